@@ -44,6 +44,7 @@ try:
     from voltaire.hash import (
         Hash,
         keccak256,
+        keccak256_batch,
         sha256,
         eip191_hash_message,
         blake2b,
@@ -54,6 +55,7 @@ try:
     __all__.extend([
         "Hash",
         "keccak256",
+        "keccak256_batch",
         "sha256",
         "eip191_hash_message",
         "blake2b",
@@ -8,10 +8,12 @@ import ctypes
 import os
 import platform
 import sys
+import threading
 from ctypes import (
     POINTER,
     Structure,
     c_bool,
+    c_char,
     c_char_p,
     c_int,
     c_int64,
@@ -20,9 +22,12 @@ from ctypes import (
     c_uint8,
     c_uint32,
     c_uint64,
+    c_void_p,
 )
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Union
+
+from voltaire._version import __version__
 
 # Type aliases
 c_uint8_p = POINTER(c_uint8)
@@ -110,57 +115,239 @@ class FusionPattern(Structure):
     ]
 
 
-def _find_library() -> Optional[Path]:
+# Per-thread reusable output buffers. Callers copy the result out before
+# returning, so a buffer is never observed by two calls at once. Struct
+# buffers are cached together with a ctypes.pointer() to them, so call sites
+# pass the pointer instead of creating a byref() object per call.
+_tls = threading.local()
+
+
+def _scratch(key: str, factory, with_pointer: bool = False):
+    entry = _tls.__dict__.get(key)
+    if entry is None:
+        entry = factory()
+        if with_pointer:
+            entry = (entry, ctypes.pointer(entry))
+        setattr(_tls, key, entry)
+    return entry
+
+
+def scratch_hash() -> tuple[PrimitivesHash, "ctypes._Pointer"]:
+    """Thread-local PrimitivesHash output buffer and a pointer to it."""
+    return _scratch("hash", PrimitivesHash, with_pointer=True)
+
+
+def scratch_u256() -> tuple[PrimitivesU256, "ctypes._Pointer"]:
+    """Thread-local PrimitivesU256 buffer and a pointer to it."""
+    return _scratch("u256", PrimitivesU256, with_pointer=True)
+
+
+def scratch_bytes32() -> tuple[ctypes.Array, "ctypes._Pointer"]:
+    """Thread-local ``c_uint8 * 32`` output buffer and a pointer to it."""
+    return _scratch("bytes32", c_uint8_array_32, with_pointer=True)
+
+
+# Variable-length outputs (ABI encode/decode) share one growable buffer per
+# thread. It starts at SCRATCH_BUFFER_MIN bytes, at least doubles whenever a
+# call needs more, and is never shrunk.
+SCRATCH_BUFFER_MIN = 4096
+
+
+def scratch_buffer(size: int) -> tuple[ctypes.Array, "ctypes._Pointer"]:
+    """Thread-local ``c_char`` buffer of at least ``size`` bytes and a uint8 pointer to it."""
+    entry = _tls.__dict__.get("buffer")
+    if entry is None or len(entry[0]) < size:
+        capacity = max(size, 2 * len(entry[0]) if entry else SCRATCH_BUFFER_MIN)
+        buf = (c_char * capacity)()
+        entry = (buf, ctypes.cast(buf, c_uint8_p))
+        _tls.buffer = entry
+    return entry
+
+
+def input_ptr(data: Union[bytes, bytearray], offset: int = 0) -> tuple[Any, int]:
     """
-    Find the Voltaire shared library.
+    Pointer to ``data[offset:]`` for a native call, and its length.
 
-    Search order:
-    1. VOLTAIRE_LIB_PATH environment variable
-    2. Package directory
-    3. Build output directories
-    4. System library paths
+    bytes are read in place and bytearrays are wrapped with from_buffer, so
+    neither is copied; other buffers are copied once. Only pass the pointer
+    to functions that take ``const`` input, since a bytearray is aliased
+    rather than copied. The caller keeps ``data`` alive across the call.
     """
-    # Check environment variable
-    env_path = os.environ.get("VOLTAIRE_LIB_PATH")
-    if env_path:
-        path = Path(env_path)
-        if path.exists():
-            return path
+    if isinstance(data, bytearray):
+        size = len(data) - offset
+        return ctypes.cast((c_uint8 * size).from_buffer(data, offset), c_uint8_p), size
+    if not isinstance(data, bytes):
+        data, offset = bytes(data[offset:]), 0
+    if offset:
+        address = ctypes.addressof(ctypes.cast(data, c_uint8_p).contents) + offset
+        return ctypes.cast(address, c_uint8_p), len(data) - offset
+    return ctypes.cast(data, c_uint8_p), len(data)
+
+
+# Fixed lengths of the *_to_hex outputs (without the NUL terminator). Callers
+# slice ``buf.raw[:N]`` rather than reading ``buf.value``, which re-scans the
+# buffer for the terminator.
+ADDRESS_HEX_LEN = 42
+HASH_HEX_LEN = 66
+U256_HEX_LEN = 66
+
+_hex_buffer_67 = c_char * (HASH_HEX_LEN + 1)
+_hex_buffer_43 = c_char * (ADDRESS_HEX_LEN + 1)
 
-    # Determine library name by platform
+
+def scratch_hex67() -> ctypes.Array:
+    """Thread-local 67-byte string buffer (0x + 64 hex chars + NUL)."""
+    return _scratch("hex67", _hex_buffer_67)
+
+
+def scratch_hex43() -> ctypes.Array:
+    """Thread-local 43-byte string buffer (0x + 40 hex chars + NUL)."""
+    return _scratch("hex43", _hex_buffer_43)
+
+
+def _library_names() -> list[str]:
+    """Library file names for this platform, in preference order."""
     system = platform.system()
     if system == "Darwin":
-        lib_names = ["libprimitives_ts_native.dylib", "libprimitives.dylib"]
-    elif system == "Windows":
-        lib_names = ["primitives_ts_native.dll", "primitives.dll"]
-    else:
-        lib_names = ["libprimitives_ts_native.so", "libprimitives.so"]
-
-    # Search paths for each library name
-    search_paths = []
-    for lib_name in lib_names:
-        search_paths.extend([
-            # Package lib directory
-            Path(__file__).parent / "lib" / lib_name,
+        return ["libprimitives_ts_native.dylib", "libprimitives.dylib"]
+    if system == "Windows":
+        return ["primitives_ts_native.dll", "primitives.dll"]
+    return ["libprimitives_ts_native.so", "libprimitives.so"]
+
+
+def _package_library_paths() -> tuple[str, ...]:
+    """Library files shipped inside the package (the wheel-install case)."""
+    package_lib = Path(__file__).parent / "lib"
+    return tuple(str(package_lib / lib_name) for lib_name in _library_names())
+
+
+def _dev_library_paths() -> tuple[str, ...]:
+    """Build output locations of a development checkout, in search order."""
+    # packages/voltaire-py/src/voltaire/_ffi.py. The ancestors are looked up
+    # once; shallow installs simply skip this step.
+    parents = Path(__file__).parents
+    build_dirs = []
+    if len(parents) > 4:
+        root = parents[4]
+        build_dirs.extend([
             # Root zig-out/native (primary location)
-            Path(__file__).parents[4] / "zig-out" / "native" / lib_name,
+            root / "zig-out" / "native",
             # Build output (relative to package root)
-            Path(__file__).parents[4] / "zig-out" / "lib" / lib_name,
+            root / "zig-out" / "lib",
             # voltaire-zig build output
-            Path(__file__).parents[4] / "packages" / "voltaire-zig" / "zig-out" / "lib" / lib_name,
-            Path(__file__).parents[4] / "packages" / "voltaire-zig" / "zig-out" / "native" / lib_name,
-            # Root zig-out
-            Path(__file__).parents[5] / "zig-out" / "lib" / lib_name,
-            Path(__file__).parents[5] / "zig-out" / "native" / lib_name,
+            root / "packages" / "voltaire-zig" / "zig-out" / "lib",
+            root / "packages" / "voltaire-zig" / "zig-out" / "native",
         ])
+    if len(parents) > 5:
+        # Root zig-out
+        build_dirs.extend([
+            parents[5] / "zig-out" / "lib",
+            parents[5] / "zig-out" / "native",
+        ])
+
+    return tuple(
+        str(directory / lib_name)
+        for lib_name in _library_names()
+        for directory in build_dirs
+    )
+
+
+# Static per install, so built once at import rather than on every search
+_PACKAGE_PATHS = _package_library_paths()
+_DEV_PATHS = _dev_library_paths()
+
+
+def _find_library() -> Optional[Path]:
+    """
+    Find the Voltaire shared library.
+
+    Search order:
+    1. VOLTAIRE_LIB_PATH environment variable
+    2. Package lib directory
+    3. Path cached by a previous development-tree search (see _cache_file),
+       if the file is unchanged since it was cached
+    4. Build output directories of a development checkout
+    """
+    # Check environment variable
+    env_path = os.environ.get("VOLTAIRE_LIB_PATH")
+    if env_path and os.path.isfile(env_path):
+        return Path(env_path)
 
-    for path in search_paths:
-        if path.exists():
+    for candidate in _PACKAGE_PATHS:
+        if os.path.isfile(candidate):
+            return Path(candidate)
+
+    cached = _read_cached_library()
+    if cached is not None:
+        return cached
+
+    for candidate in _DEV_PATHS:
+        if os.path.isfile(candidate):
+            path = Path(candidate)
+            _write_cached_library(path)
             return path
 
     return None
 
 
+def _cache_file() -> Optional[Path]:
+    """Location of the on-disk library path cache, or None if unavailable."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        try:
+            cache_home = Path.home() / ".cache"
+        except RuntimeError:
+            return None
+    return Path(cache_home) / "voltaire" / "lib_path"
+
+
+def _cache_key() -> str:
+    # Different installs/checkouts of the package must not share an entry
+    return f"{__version__} {Path(__file__).parent}"
+
+
+def _file_stamp(path: str) -> Optional[str]:
+    """mtime and size of ``path``, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns} {st.st_size}"
+
+
+def _read_cached_library() -> Optional[Path]:
+    """
+    Return the cached library path if it belongs to this install and the
+    file is unchanged (same mtime and size) since it was cached.
+    """
+    cache_file = _cache_file()
+    if cache_file is None:
+        return None
+    try:
+        key, lib_path, stamp = cache_file.read_text(encoding="utf-8").split("\n")
+    except (OSError, UnicodeDecodeError, ValueError):
+        return None
+    if key != _cache_key() or not lib_path or stamp != _file_stamp(lib_path):
+        return None
+    return Path(lib_path)
+
+
+def _write_cached_library(path: Path) -> None:
+    """Best-effort write of the resolved library path; failures are ignored."""
+    cache_file = _cache_file()
+    if cache_file is None:
+        return
+    lib_path = str(path.resolve())
+    stamp = _file_stamp(lib_path)
+    if stamp is None:
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(f"{_cache_key()}\n{lib_path}\n{stamp}", encoding="utf-8")
+    except OSError:
+        pass
+
+
 def _load_library() -> ctypes.CDLL:
     """Load the Voltaire shared library."""
     lib_path = _find_library()
@@ -171,6 +358,9 @@ def _load_library() -> ctypes.CDLL:
             "Set VOLTAIRE_LIB_PATH or run 'zig build build-ts-native' first."
         )
 
+    # CDLL (not PyDLL) releases the GIL for the duration of every call. The
+    # native library keeps no shared mutable state (its scratch buffers are
+    # thread-local, as are ours), so calls from several threads run in parallel.
     try:
         lib = ctypes.CDLL(str(lib_path))
     except OSError as e:
@@ -180,434 +370,513 @@ def _load_library() -> ctypes.CDLL:
     return lib
 
 
-def _setup_function_signatures(lib: ctypes.CDLL) -> None:
-    """Define C function signatures for type safety."""
-
+# (name, argtypes, restype) for every native function bound by this module.
+# Kept as data so the whole signature set is one constant and the setup is
+# a short loop rather than hundreds of attribute assignments.
+_SIGNATURES = (
     # Address functions
-    lib.primitives_address_from_hex.argtypes = [c_char_p, POINTER(PrimitivesAddress)]
-    lib.primitives_address_from_hex.restype = c_int
-
-    lib.primitives_address_to_hex.argtypes = [POINTER(PrimitivesAddress), c_char_p]
-    lib.primitives_address_to_hex.restype = c_int
-
-    lib.primitives_address_to_checksum_hex.argtypes = [POINTER(PrimitivesAddress), c_char_p]
-    lib.primitives_address_to_checksum_hex.restype = c_int
-
-    lib.primitives_address_is_zero.argtypes = [POINTER(PrimitivesAddress)]
-    lib.primitives_address_is_zero.restype = c_bool
-
-    lib.primitives_address_equals.argtypes = [POINTER(PrimitivesAddress), POINTER(PrimitivesAddress)]
-    lib.primitives_address_equals.restype = c_bool
-
-    lib.primitives_address_validate_checksum.argtypes = [c_char_p]
-    lib.primitives_address_validate_checksum.restype = c_bool
+    ("primitives_address_from_hex", (c_char_p, POINTER(PrimitivesAddress)), c_int),
+    ("primitives_address_to_hex", (POINTER(PrimitivesAddress), c_char_p), c_int),
+    ("primitives_address_to_checksum_hex", (POINTER(PrimitivesAddress), c_char_p), c_int),
+    ("primitives_address_is_zero", (POINTER(PrimitivesAddress),), c_bool),
+    ("primitives_address_equals", (POINTER(PrimitivesAddress), POINTER(PrimitivesAddress)), c_bool),
+    ("primitives_address_validate_checksum", (c_char_p,), c_bool),
 
     # Hash functions
-    lib.primitives_keccak256.argtypes = [c_uint8_p, c_size_t, POINTER(PrimitivesHash)]
-    lib.primitives_keccak256.restype = c_int
-
-    lib.primitives_hash_to_hex.argtypes = [POINTER(PrimitivesHash), c_char_p]
-    lib.primitives_hash_to_hex.restype = c_int
-
-    lib.primitives_hash_from_hex.argtypes = [c_char_p, POINTER(PrimitivesHash)]
-    lib.primitives_hash_from_hex.restype = c_int
-
-    lib.primitives_hash_equals.argtypes = [POINTER(PrimitivesHash), POINTER(PrimitivesHash)]
-    lib.primitives_hash_equals.restype = c_bool
+    # Hash inputs are declared c_char_p so callers can pass bytes directly:
+    # ctypes hands over the bytes object's own buffer without copying.
+    ("primitives_keccak256", (c_char_p, c_size_t, POINTER(PrimitivesHash)), c_int),
+
+    # Fixed-size variants (input must be exactly 32 / 64 bytes)
+    ("primitives_keccak256_32", (c_char_p, POINTER(PrimitivesHash)), c_int),
+    ("primitives_keccak256_64", (c_char_p, POINTER(PrimitivesHash)), c_int),
+    ("primitives_keccak256_batch", (
+        c_char_p,                   # data (all items concatenated)
+        POINTER(c_uint32),          # offsets (count + 1 entries)
+        c_size_t,                   # count
+        POINTER(PrimitivesHash),    # out_hashes
+    ), c_int),
+    ("primitives_hash_to_hex", (POINTER(PrimitivesHash), c_char_p), c_int),
+    ("primitives_hash_from_hex", (c_char_p, POINTER(PrimitivesHash)), c_int),
+    ("primitives_hash_equals", (POINTER(PrimitivesHash), POINTER(PrimitivesHash)), c_bool),
 
     # SHA-256
-    lib.primitives_sha256.argtypes = [c_uint8_p, c_size_t, POINTER(c_uint8 * 32)]
-    lib.primitives_sha256.restype = c_int
+    ("primitives_sha256", (c_char_p, c_size_t, POINTER(c_uint8 * 32)), c_int),
 
     # Hex utilities
-    lib.primitives_hex_to_bytes.argtypes = [c_char_p, c_uint8_p, c_size_t]
-    lib.primitives_hex_to_bytes.restype = c_int
-
-    lib.primitives_bytes_to_hex.argtypes = [c_uint8_p, c_size_t, c_char_p, c_size_t]
-    lib.primitives_bytes_to_hex.restype = c_int
+    ("primitives_hex_to_bytes", (c_char_p, c_uint8_p, c_size_t), c_int),
+    ("primitives_hex_to_bytes_fast", (c_char_p, c_uint8_p, c_size_t), c_int),
+    ("primitives_bytes_to_hex", (c_uint8_p, c_size_t, c_char_p, c_size_t), c_int),
 
     # U256 functions
-    lib.primitives_u256_from_hex.argtypes = [c_char_p, POINTER(PrimitivesU256)]
-    lib.primitives_u256_from_hex.restype = c_int
-
-    lib.primitives_u256_to_hex.argtypes = [POINTER(PrimitivesU256), c_char_p, c_size_t]
-    lib.primitives_u256_to_hex.restype = c_int
+    ("primitives_u256_from_hex", (c_char_p, POINTER(PrimitivesU256)), c_int),
+    ("primitives_u256_to_hex", (POINTER(PrimitivesU256), c_char_p, c_size_t), c_int),
 
     # EIP-191
-    lib.primitives_eip191_hash_message.argtypes = [c_uint8_p, c_size_t, POINTER(PrimitivesHash)]
-    lib.primitives_eip191_hash_message.restype = c_int
+    ("primitives_eip191_hash_message", (c_char_p, c_size_t, POINTER(PrimitivesHash)), c_int),
 
     # secp256k1
-    lib.primitives_secp256k1_recover_pubkey.argtypes = [
+    ("primitives_secp256k1_recover_pubkey", (
         POINTER(c_uint8 * 32),  # message_hash
         POINTER(c_uint8 * 32),  # r
         POINTER(c_uint8 * 32),  # s
         c_uint8,  # v
         POINTER(c_uint8 * 64),  # out_pubkey
-    ]
-    lib.primitives_secp256k1_recover_pubkey.restype = c_int
-
-    lib.primitives_secp256k1_recover_address.argtypes = [
+    ), c_int),
+    ("primitives_secp256k1_recover_address", (
         POINTER(c_uint8 * 32),
         POINTER(c_uint8 * 32),
         POINTER(c_uint8 * 32),
         c_uint8,
         POINTER(PrimitivesAddress),
-    ]
-    lib.primitives_secp256k1_recover_address.restype = c_int
-
-    lib.primitives_secp256k1_pubkey_from_private.argtypes = [
+    ), c_int),
+    ("primitives_secp256k1_recover_address_batch", (
+        POINTER(c_uint8 * 32),      # message_hashes
+        POINTER(c_uint8 * 32),      # rs
+        POINTER(c_uint8 * 32),      # ss
+        c_uint8_p,                  # vs
+        c_size_t,                   # count
+        POINTER(PrimitivesAddress), # out_addresses
+        POINTER(c_size_t),          # out_failed_index
+    ), c_int),
+    ("primitives_secp256k1_pubkey_from_private", (
         POINTER(c_uint8 * 32),
         POINTER(c_uint8 * 64),
-    ]
-    lib.primitives_secp256k1_pubkey_from_private.restype = c_int
+    ), c_int),
 
     # Key generation
-    lib.primitives_generate_private_key.argtypes = [POINTER(c_uint8 * 32)]
-    lib.primitives_generate_private_key.restype = c_int
+    ("primitives_generate_private_key", (
+        POINTER(c_uint8 * 32),  # out_private_key
+    ), c_int),
 
     # Public key compression
-    lib.primitives_compress_public_key.argtypes = [
+    ("primitives_compress_public_key", (
         POINTER(c_uint8 * 64),  # uncompressed
         POINTER(c_uint8 * 33),  # out_compressed
-    ]
-    lib.primitives_compress_public_key.restype = c_int
+    ), c_int),
 
     # CREATE address
-    lib.primitives_calculate_create_address.argtypes = [
+    ("primitives_calculate_create_address", (
         POINTER(PrimitivesAddress),
         c_uint64,
         POINTER(PrimitivesAddress),
-    ]
-    lib.primitives_calculate_create_address.restype = c_int
+    ), c_int),
 
     # RLP functions
-    lib.primitives_rlp_encode_bytes.argtypes = [
+    ("primitives_rlp_encode_bytes", (
         c_uint8_p,  # data
         c_size_t,   # data_len
         c_char_p,   # out_buf
         c_size_t,   # buf_len
-    ]
-    lib.primitives_rlp_encode_bytes.restype = c_int
-
-    lib.primitives_rlp_encode_uint.argtypes = [
+    ), c_int),
+    ("primitives_rlp_encode_bytes_borrow", (
+        c_char_p,            # data
+        c_size_t,            # data_len
+        POINTER(c_void_p),   # out_ptr (thread-local, valid until next *_borrow call)
+        POINTER(c_size_t),   # out_len
+    ), c_int),
+    ("primitives_rlp_encode_uint", (
         POINTER(c_uint8 * 32),  # value_bytes (big-endian u256)
         c_char_p,               # out_buf
         c_size_t,               # buf_len
-    ]
-    lib.primitives_rlp_encode_uint.restype = c_int
-
-    lib.primitives_rlp_to_hex.argtypes = [
+    ), c_int),
+    ("primitives_rlp_to_hex", (
         c_uint8_p,  # rlp_data
         c_size_t,   # rlp_len
         c_char_p,   # out_buf
         c_size_t,   # buf_len
-    ]
-    lib.primitives_rlp_to_hex.restype = c_int
-
-    lib.primitives_rlp_from_hex.argtypes = [
+    ), c_int),
+    ("primitives_rlp_from_hex", (
         c_char_p,   # hex (null-terminated)
         c_char_p,   # out_buf
         c_size_t,   # buf_len
-    ]
-    lib.primitives_rlp_from_hex.restype = c_int
+    ), c_int),
 
     # Transaction functions
-    lib.primitives_tx_detect_type.argtypes = [
+    ("primitives_tx_detect_type", (
         c_uint8_p,  # data
         c_size_t,   # data_len
-    ]
-    lib.primitives_tx_detect_type.restype = c_int
+    ), c_int),
 
     # CREATE2 address
-    lib.primitives_calculate_create2_address.argtypes = [
+    ("primitives_calculate_create2_address", (
         POINTER(PrimitivesAddress),  # sender
         POINTER(c_uint8 * 32),       # salt (32 bytes)
         c_uint8_p,                   # init_code
         c_size_t,                    # init_code_len
         POINTER(PrimitivesAddress),  # out_address
-    ]
-    lib.primitives_calculate_create2_address.restype = c_int
+    ), c_int),
 
     # BLAKE2b (64-byte output)
-    lib.primitives_blake2b.argtypes = [c_uint8_p, c_size_t, POINTER(c_uint8 * 64)]
-    lib.primitives_blake2b.restype = c_int
+    ("primitives_blake2b", (c_char_p, c_size_t, POINTER(c_uint8 * 64)), c_int),
 
     # RIPEMD160 (20-byte output)
-    lib.primitives_ripemd160.argtypes = [c_uint8_p, c_size_t, POINTER(c_uint8 * 20)]
-    lib.primitives_ripemd160.restype = c_int
+    ("primitives_ripemd160", (c_char_p, c_size_t, POINTER(c_uint8 * 20)), c_int),
 
     # ABI functions
-    lib.primitives_abi_compute_selector.argtypes = [
+    ("primitives_abi_compute_selector", (
         c_char_p,               # signature (null-terminated)
         POINTER(c_uint8 * 4),   # out_selector
-    ]
-    lib.primitives_abi_compute_selector.restype = c_int
-
-    lib.primitives_abi_decode_parameters.argtypes = [
+    ), c_int),
+    ("primitives_abi_decode_parameters", (
         c_uint8_p,   # data
         c_size_t,    # data_len
         c_char_p,    # types_json (null-terminated)
         c_char_p,    # out_buf
         c_size_t,    # buf_len
-    ]
-    lib.primitives_abi_decode_parameters.restype = c_int
-
-    lib.primitives_abi_decode_function_data.argtypes = [
+    ), c_int),
+    ("primitives_abi_decode_parameters_bin", (
+        c_uint8_p,  # data
+        c_size_t,   # data_len
+        c_char_p,   # types (one tag byte per parameter)
+        c_size_t,   # types_len
+        c_char_p,   # out_buf (u32 length-prefixed payloads)
+        c_size_t,   # buf_len
+    ), c_int),
+    ("primitives_abi_decode_parameters_batch_bin", (
+        c_uint8_p,          # data (concatenated blobs)
+        POINTER(c_uint32),  # offsets (n_items + 1)
+        c_size_t,           # n_items
+        c_char_p,           # types (one tag byte per parameter)
+        c_size_t,           # types_len
+        c_char_p,           # out_buf (u32 length-prefixed payloads)
+        c_size_t,           # buf_len
+    ), c_int),
+    ("primitives_abi_decode_parameters_batch", (
+        c_char_p,           # types_json (null-terminated)
+        POINTER(c_uint32),  # offsets (n_items + 1)
+        c_uint8_p,          # data (concatenated blobs)
+        c_size_t,           # n_items
+        c_char_p,           # out_buf
+        c_size_t,           # buf_len
+    ), c_int),
+    ("primitives_abi_decode_function_data", (
         c_uint8_p,              # data
         c_size_t,               # data_len
         c_char_p,               # types_json (null-terminated)
         POINTER(c_uint8 * 4),   # out_selector
         c_char_p,               # out_buf
         c_size_t,               # buf_len
-    ]
-    lib.primitives_abi_decode_function_data.restype = c_int
-
-    lib.primitives_abi_encode_parameters.argtypes = [
+    ), c_int),
+    ("primitives_abi_encode_parameters", (
         c_char_p,   # types_json (null-terminated)
         c_char_p,   # values_json (null-terminated)
         c_uint8_p,  # out_buf
         c_size_t,   # buf_len
-    ]
-    lib.primitives_abi_encode_parameters.restype = c_int
-
-    lib.primitives_abi_encode_function_data.argtypes = [
+    ), c_int),
+    ("primitives_abi_encode_parameters_bin", (
+        c_char_p,   # types (one tag byte per parameter)
+        c_size_t,   # types_len
+        c_char_p,   # values (u32 length-prefixed payloads)
+        c_size_t,   # values_len
+        c_uint8_p,  # out_buf
+        c_size_t,   # buf_len
+    ), c_int),
+    ("primitives_abi_encode_function_data", (
         c_char_p,   # signature (null-terminated)
         c_char_p,   # types_json (null-terminated)
         c_char_p,   # values_json (null-terminated)
         c_uint8_p,  # out_buf
         c_size_t,   # buf_len
-    ]
-    lib.primitives_abi_encode_function_data.restype = c_int
-
-    lib.primitives_abi_encode_packed.argtypes = [
+    ), c_int),
+    ("primitives_abi_encode_packed", (
         c_char_p,   # types_json (null-terminated)
         c_char_p,   # values_json (null-terminated)
         c_uint8_p,  # out_buf
         c_size_t,   # buf_len
-    ]
-    lib.primitives_abi_encode_packed.restype = c_int
-
-    lib.primitives_abi_estimate_gas.argtypes = [
+    ), c_int),
+    ("primitives_abi_estimate_gas", (
         c_uint8_p,  # data
         c_size_t,   # data_len
-    ]
-    lib.primitives_abi_estimate_gas.restype = c_longlong
+    ), c_longlong),
 
     # Bytecode analysis functions
-    lib.primitives_bytecode_analyze_jumpdests.argtypes = [
+    ("primitives_bytecode_analyze_jumpdests", (
         c_uint8_p,              # code
         c_size_t,               # code_len
         POINTER(c_uint32),      # out_jumpdests
         c_size_t,               # max_jumpdests
-    ]
-    lib.primitives_bytecode_analyze_jumpdests.restype = c_int
-
-    lib.primitives_bytecode_is_boundary.argtypes = [
+    ), c_int),
+    ("primitives_bytecode_analyze_jumpdests_batch", (
+        c_uint8_p,              # codes (all contracts concatenated)
+        POINTER(c_uint32),      # offsets (count + 1 entries)
+        c_size_t,               # count
+        POINTER(c_uint32),      # out_jumpdests (offsets[count] entries)
+        POINTER(c_uint32),      # out_counts (count entries)
+    ), c_int),
+    ("primitives_bytecode_analyze_jumpdests_bitmap", (
+        c_uint8_p,              # code
+        c_size_t,               # code_len
+        c_uint8_p,              # out_bitmap (ceil(code_len / 8) bytes)
+        c_size_t,               # bitmap_len
+    ), c_int),
+    ("primitives_bytecode_is_boundary", (
         c_uint8_p,              # code
         c_size_t,               # code_len
         c_uint32,               # position
-    ]
-    lib.primitives_bytecode_is_boundary.restype = c_bool
-
-    lib.primitives_bytecode_is_valid_jumpdest.argtypes = [
+    ), c_bool),
+    ("primitives_bytecode_is_valid_jumpdest", (
         c_uint8_p,              # code
         c_size_t,               # code_len
         c_uint32,               # position
-    ]
-    lib.primitives_bytecode_is_valid_jumpdest.restype = c_bool
-
-    lib.primitives_bytecode_validate.argtypes = [
+    ), c_bool),
+    ("primitives_bytecode_validate", (
         c_uint8_p,              # code
         c_size_t,               # code_len
-    ]
-    lib.primitives_bytecode_validate.restype = c_int
-
-    lib.primitives_bytecode_get_next_pc.argtypes = [
+    ), c_int),
+    ("primitives_bytecode_get_next_pc", (
         c_uint8_p,              # code
         c_size_t,               # code_len
         c_uint32,               # current_pc
-    ]
-    lib.primitives_bytecode_get_next_pc.restype = c_int64
+    ), c_int64),
+    ("primitives_bytecode_next_pc", (
+        c_uint8_p,              # code
+        c_size_t,               # code_len
+        c_uint32,               # current_pc
+        POINTER(c_uint32),      # out_next_pc
+    ), c_int),
 
     # Blob functions (EIP-4844)
-    lib.primitives_blob_from_data.argtypes = [c_uint8_p, c_size_t, c_uint8_p]
-    lib.primitives_blob_from_data.restype = c_int
-
-    lib.primitives_blob_to_data.argtypes = [c_uint8_p, c_uint8_p, POINTER(c_size_t)]
-    lib.primitives_blob_to_data.restype = c_int
-
-    lib.primitives_blob_is_valid.argtypes = [c_size_t]
-    lib.primitives_blob_is_valid.restype = c_int
-
-    lib.primitives_blob_calculate_gas.argtypes = [c_uint32]
-    lib.primitives_blob_calculate_gas.restype = c_uint64
-
-    lib.primitives_blob_estimate_count.argtypes = [c_size_t]
-    lib.primitives_blob_estimate_count.restype = c_uint32
-
-    lib.primitives_blob_calculate_gas_price.argtypes = [c_uint64]
-    lib.primitives_blob_calculate_gas_price.restype = c_uint64
-
-    lib.primitives_blob_calculate_excess_gas.argtypes = [c_uint64, c_uint64]
-    lib.primitives_blob_calculate_excess_gas.restype = c_uint64
+    ("primitives_blob_from_data", (c_uint8_p, c_size_t, c_uint8_p), c_int),
+    ("primitives_blob_to_data", (c_uint8_p, c_uint8_p, POINTER(c_size_t)), c_int),
+    ("primitives_blob_is_valid", (c_size_t,), c_int),
+    ("primitives_blob_calculate_gas", (c_uint32,), c_uint64),
+    ("primitives_blob_estimate_count", (c_size_t,), c_uint32),
+    ("primitives_blob_calculate_gas_price", (c_uint64,), c_uint64),
+    ("primitives_blob_calculate_excess_gas", (c_uint64, c_uint64), c_uint64),
 
     # Signature utilities
-    lib.primitives_secp256k1_validate_signature.argtypes = [
+    ("primitives_secp256k1_validate_signature", (
         POINTER(c_uint8 * 32),  # r
         POINTER(c_uint8 * 32),  # s
-    ]
-    lib.primitives_secp256k1_validate_signature.restype = c_bool
-
-    lib.primitives_signature_normalize.argtypes = [
+    ), c_bool),
+    ("primitives_secp256k1_verify", (
+        POINTER(c_uint8 * 32),  # message_hash
+        POINTER(c_uint8 * 32),  # r
+        POINTER(c_uint8 * 32),  # s
+        POINTER(c_uint8 * 64),  # pubkey
+    ), c_bool),
+    ("primitives_signature_normalize", (
         POINTER(c_uint8 * 32),  # r (unused but required)
         POINTER(c_uint8 * 32),  # s (modified in place)
-    ]
-    lib.primitives_signature_normalize.restype = c_bool
-
-    lib.primitives_signature_is_canonical.argtypes = [
+    ), c_bool),
+    ("primitives_signature_is_canonical", (
         POINTER(c_uint8 * 32),  # r
         POINTER(c_uint8 * 32),  # s
-    ]
-    lib.primitives_signature_is_canonical.restype = c_bool
-
-    lib.primitives_signature_parse.argtypes = [
+    ), c_bool),
+    ("primitives_signature_parse", (
         c_uint8_p,              # sig_data
         c_size_t,               # sig_len
         POINTER(c_uint8 * 32),  # out_r
         POINTER(c_uint8 * 32),  # out_s
         POINTER(c_uint8),       # out_v
-    ]
-    lib.primitives_signature_parse.restype = c_int
-
-    lib.primitives_signature_serialize.argtypes = [
+    ), c_int),
+    ("primitives_signature_serialize", (
         POINTER(c_uint8 * 32),  # r
         POINTER(c_uint8 * 32),  # s
         c_uint8,                # v
         c_bool,                 # include_v
         c_uint8_p,              # out_buf
-    ]
-    lib.primitives_signature_serialize.restype = c_int
-
-    # Wallet generation
-    lib.primitives_generate_private_key.argtypes = [
-        POINTER(c_uint8 * 32),  # out_private_key
-    ]
-    lib.primitives_generate_private_key.restype = c_int
-
-    lib.primitives_compress_public_key.argtypes = [
-        POINTER(c_uint8 * 64),  # uncompressed
-        POINTER(c_uint8 * 33),  # out_compressed
-    ]
-    lib.primitives_compress_public_key.restype = c_int
+    ), c_int),
 
     # Solidity-style hashing
-    lib.primitives_solidity_keccak256.argtypes = [
-        c_uint8_p,              # packed_data
+    ("primitives_solidity_keccak256", (
+        c_char_p,               # packed_data
         c_size_t,               # data_len
         POINTER(PrimitivesHash),  # out_hash
-    ]
-    lib.primitives_solidity_keccak256.restype = c_int
-
-    lib.primitives_solidity_sha256.argtypes = [
-        c_uint8_p,              # packed_data
+    ), c_int),
+    ("primitives_solidity_sha256", (
+        c_char_p,               # packed_data
         c_size_t,               # data_len
         POINTER(c_uint8 * 32),  # out_hash
-    ]
-    lib.primitives_solidity_sha256.restype = c_int
+    ), c_int),
 
     # Event log matching
-    lib.primitives_eventlog_matches_address.argtypes = [
+    ("primitives_eventlog_matches_address", (
         POINTER(c_uint8 * 20),  # log_address
         c_uint8_p,              # filter_addresses (array of 20-byte addresses)
         c_size_t,               # filter_count
-    ]
-    lib.primitives_eventlog_matches_address.restype = c_int
-
-    lib.primitives_eventlog_matches_topic.argtypes = [
+    ), c_int),
+    ("primitives_eventlog_matches_topic", (
         POINTER(c_uint8 * 32),  # log_topic
         POINTER(c_uint8 * 32),  # filter_topic
         c_int,                  # null_topic (1 = null filter, 0 = specific filter)
-    ]
-    lib.primitives_eventlog_matches_topic.restype = c_int
-
-    lib.primitives_eventlog_matches_topics.argtypes = [
+    ), c_int),
+    ("primitives_eventlog_matches_topics", (
         c_uint8_p,              # log_topics (array of 32-byte topics)
         c_size_t,               # log_topic_count
         c_uint8_p,              # filter_topics (array of 32-byte topics)
         POINTER(c_int),         # filter_nulls (array of int flags)
         c_size_t,               # filter_count
-    ]
-    lib.primitives_eventlog_matches_topics.restype = c_int
+    ), c_int),
 
     # Version
-    lib.primitives_version_string.argtypes = []
-    lib.primitives_version_string.restype = c_char_p
+    ("primitives_version_string", (), c_char_p),
 
     # Access list (EIP-2930)
-    lib.primitives_access_list_gas_cost.argtypes = [
+    ("primitives_access_list_gas_cost", (
         POINTER(PrimitivesAccessListEntry),  # entries
         c_size_t,                            # entries_len
         POINTER(c_uint64),                   # out_cost
-    ]
-    lib.primitives_access_list_gas_cost.restype = c_int
+    ), c_int),
 
     # Authorization (EIP-7702)
-    lib.primitives_authorization_validate.argtypes = [
+    ("primitives_authorization_validate", (
         POINTER(PrimitivesAuthorization),  # auth_ptr
-    ]
-    lib.primitives_authorization_validate.restype = c_int
-
-    lib.primitives_authorization_signing_hash.argtypes = [
+    ), c_int),
+    ("primitives_authorization_signing_hash", (
         c_uint64,                   # chain_id
         POINTER(PrimitivesAddress), # address_ptr
         c_uint64,                   # nonce
         POINTER(PrimitivesHash),    # out_hash
-    ]
-    lib.primitives_authorization_signing_hash.restype = c_int
-
-    lib.primitives_authorization_authority.argtypes = [
+    ), c_int),
+    ("primitives_authorization_authority", (
         POINTER(PrimitivesAuthorization),  # auth_ptr
         POINTER(PrimitivesAddress),        # out_address
-    ]
-    lib.primitives_authorization_authority.restype = c_int
-
-    lib.primitives_authorization_gas_cost.argtypes = [
+    ), c_int),
+    ("primitives_authorization_gas_cost", (
         c_size_t,  # count
         c_size_t,  # empty_accounts
-    ]
-    lib.primitives_authorization_gas_cost.restype = c_uint64
+    ), c_uint64),
 
     # Advanced bytecode analysis
-    lib.primitives_bytecode_scan.argtypes = [
+    ("primitives_bytecode_scan", (
         c_uint8_p,          # code
         c_size_t,           # code_len
         c_uint32,           # start_pc
         c_uint32,           # end_pc
         c_uint8_p,          # out_instructions (InstructionData array)
         POINTER(c_size_t),  # out_len (in: buffer size, out: bytes written)
-    ]
-    lib.primitives_bytecode_scan.restype = c_int
-
-    lib.primitives_bytecode_detect_fusions.argtypes = [
+    ), c_int),
+    ("primitives_bytecode_scan_soa", (
+        c_uint8_p,          # code
+        c_size_t,           # code_len
+        c_uint32,           # start_pc
+        c_uint32,           # end_pc
+        POINTER(c_uint32),  # out_pcs
+        c_uint8_p,          # out_opcodes
+        c_uint8_p,          # out_push_sizes
+        c_size_t,           # max_instructions
+    ), c_int),
+    ("primitives_bytecode_detect_fusions", (
         c_uint8_p,          # code
         c_size_t,           # code_len
         c_uint8_p,          # out_fusions (FusionPattern array)
         POINTER(c_size_t),  # out_len (in: buffer size, out: bytes written)
-    ]
-    lib.primitives_bytecode_detect_fusions.restype = c_int
+    ), c_int),
+)
 
 
-# Lazy-loaded library instance
+def _setup_function_signatures(lib: ctypes.CDLL) -> None:
+    """Define C function signatures for type safety."""
+    for name, argtypes, restype in _SIGNATURES:
+        # Libraries built before a function was added simply lack it; that
+        # only matters once something calls it (see _unavailable).
+        func = getattr(lib, name, None)
+        if func is None:
+            continue
+        func.argtypes = argtypes
+        func.restype = restype
+
+
+# Lazy-loaded library instance. Normally set while this module is imported;
+# the lock serializes retries when that failed, so concurrent first calls
+# never open the library twice or race on its argtypes/restype writes.
 _lib: Optional[ctypes.CDLL] = None
+_lib_lock = threading.Lock()
 
 
 def get_lib() -> ctypes.CDLL:
     """Get the loaded library instance (lazy loading)."""
     global _lib
-    if _lib is None:
-        _lib = _load_library()
-    return _lib
+    lib = _lib
+    if lib is None:
+        with _lib_lock:
+            if _lib is None:
+                _lib = _load_library()
+            lib = _lib
+    return lib
+
+
+# Every function in _SIGNATURES is bound as a module attribute, so hot call
+# sites can import it directly (``from voltaire._ffi import primitives_keccak256``)
+# instead of paying for get_lib() plus a CDLL attribute lookup on every call.
+_EXPORTED_FUNCS = tuple(name for name, _, _ in _SIGNATURES)
+
+
+def _deferred(name: str):
+    """Stand-in used when the library is not loadable at import time."""
+
+    def call(*args):
+        return getattr(get_lib(), name)(*args)
+
+    call.__name__ = call.__qualname__ = name
+    return call
+
+
+def _unavailable(name: str):
+    """Stand-in for a function the loaded library does not export."""
+
+    def call(*args):
+        raise AttributeError(
+            f"{name} is not exported by the loaded Voltaire library; "
+            "rebuild it with 'zig build build-ts-native'"
+        )
+
+    call.__name__ = call.__qualname__ = name
+    return call
+
+
+def has_function(name: str) -> bool:
+    """Whether the native library can be loaded and exports ``name``."""
+    try:
+        lib = get_lib()
+    except OSError:
+        return False
+    return hasattr(lib, name)
+
+
+# Hottest entry points are re-bound through a dedicated CFUNCTYPE prototype
+# so their signature lives on the function type instead of being attached
+# to a generic CDLL function object.
+_PROTOTYPED_FUNCS = (
+    "primitives_keccak256",
+    "primitives_keccak256_32",
+    "primitives_sha256",
+    "primitives_secp256k1_recover_address",
+    "primitives_bytecode_is_valid_jumpdest",
+    "primitives_address_equals",
+)
+
+
+def _prototype(lib: ctypes.CDLL, name: str):
+    """Build a prototype-bound function pointer from the configured signature."""
+    func = getattr(lib, name)
+    return ctypes.CFUNCTYPE(func.restype, *func.argtypes)((name, lib))
+
+
+def _bind_exports() -> None:
+    """Bind every exported function to a module-level name."""
+    try:
+        lib = get_lib()
+    except OSError:
+        # Keep imports working without the native library; each call retries
+        # the load and raises the usual OSError if it is still missing.
+        bound = {name: _deferred(name) for name in _EXPORTED_FUNCS}
+    else:
+        bound = {
+            name: getattr(lib, name, None) or _unavailable(name)
+            for name in _EXPORTED_FUNCS
+        }
+        bound.update({
+            name: _prototype(lib, name)
+            for name in _PROTOTYPED_FUNCS
+            if hasattr(lib, name)
+        })
+    globals().update(bound)
+
+
+_bind_exports()
 
 
 def get_version() -> str:
@@ -6,13 +6,126 @@ Ethereum ABI specification.
 """
 
 import ctypes
+import functools
+import itertools
 import json
-from ctypes import POINTER, c_char_p, c_size_t, c_uint8
-from typing import Any, Union
-
-from voltaire._ffi import get_lib
+import os
+import struct
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import c_char_p, c_size_t, c_uint8, c_uint32
+from typing import Any, Callable, Sequence, Union
+
+from voltaire._ffi import (
+    input_ptr,
+    primitives_abi_decode_function_data,
+    primitives_abi_decode_parameters,
+    primitives_abi_decode_parameters_batch,
+    primitives_abi_decode_parameters_batch_bin,
+    primitives_abi_decode_parameters_bin,
+    primitives_abi_encode_function_data,
+    primitives_abi_encode_packed,
+    primitives_abi_encode_parameters,
+    primitives_abi_encode_parameters_bin,
+    primitives_keccak256,
+    scratch_buffer,
+    scratch_hash,
+)
 from voltaire.errors import InvalidInputError, InvalidLengthError
 
+# Number of distinct function signatures whose selector and parameter types
+# are kept. Callers typically cycle through a small set (transfer, approve,
+# balanceOf, ...), so repeats skip hashing and parsing entirely.
+SELECTOR_CACHE_SIZE = 2048
+
+# Calldata gas pricing used by Abi.estimate_gas (same as the native
+# estimateGasForData)
+BASE_TX_GAS = 21000
+ZERO_BYTE_GAS = 4
+NONZERO_BYTE_GAS = 16
+
+# One-byte type tags for the primitives_abi_*_parameters_bin entry points. The
+# order mirrors abi_bin_types in the native library; types missing here go
+# through the JSON entry points instead.
+_BIN_TYPE_TAGS = {
+    name: tag
+    for tag, name in enumerate((
+        "uint8", "uint16", "uint32", "uint64", "uint128", "uint256",
+        "int8", "int16", "int32", "int64", "int128", "int256",
+        "address", "bool",
+        "bytes1", "bytes2", "bytes3", "bytes4", "bytes8", "bytes16", "bytes32",
+        "bytes", "string",
+        "uint256[]", "address[]", "bytes32[]",
+    ))
+}
+_BIN_TYPE_TAGS["uint"] = _BIN_TYPE_TAGS["uint256"]
+_BIN_TYPE_TAGS["int"] = _BIN_TYPE_TAGS["int256"]
+
+# Element payload size for the array types in the binary format; an array's
+# payload is its element payloads back to back
+_BIN_ARRAY_ELEMENT_SIZE = {"uint256[]": 32, "address[]": 20, "bytes32[]": 32}
+
+# Tags whose payload length depends on the value rather than the type
+_BIN_DYNAMIC_TAGS = frozenset(
+    _BIN_TYPE_TAGS[name] for name in ("bytes", "string", *_BIN_ARRAY_ELEMENT_SIZE)
+)
+
+_U32 = struct.Struct("<I")
+
+# (bit width, signed) for every uintN/intN type. Parameter lists made only of
+# these, address and bool are static 32-byte words and are encoded in Python
+# by _encode_scalars without a native call.
+_INT_TYPES = {
+    **{f"uint{bits}": (bits, False) for bits in range(8, 257, 8)},
+    **{f"int{bits}": (bits, True) for bits in range(8, 257, 8)},
+    "uint": (256, False),
+    "int": (256, True),
+}
+_SCALAR_TYPES = frozenset(_INT_TYPES) | {"address", "bool"}
+
+_WORD_FALSE = bytes(32)
+_WORD_TRUE = bytes(31) + b"\x01"
+_ADDRESS_PAD = bytes(12)
+
+
+def _decode_uint_bin(payload: bytes) -> int:
+    return int.from_bytes(payload, "big")
+
+
+def _decode_int_bin(payload: bytes) -> int:
+    return int.from_bytes(payload, "big", signed=True)
+
+
+def _decode_address_bin(payload: bytes) -> str:
+    return "0x" + payload.hex()
+
+
+def _decode_bool_bin(payload: bytes) -> bool:
+    return payload != b"\x00"
+
+
+def _decode_string_bin(payload: bytes) -> str:
+    return payload.decode("utf-8")
+
+
+# Python value for each payload returned by primitives_abi_decode_parameters_bin
+_BIN_DECODERS = {
+    name: (
+        _decode_uint_bin if name.startswith("uint")
+        else _decode_int_bin if name.startswith("int")
+        else _decode_address_bin if name == "address"
+        else _decode_bool_bin if name == "bool"
+        else _decode_string_bin if name == "string"
+        else bytes
+    )
+    for name in _BIN_TYPE_TAGS
+}
+_BIN_DECODERS.update({
+    "uint256[]": lambda p: [int.from_bytes(p[i:i + 32], "big") for i in range(0, len(p), 32)],
+    "address[]": lambda p: ["0x" + p[i:i + 20].hex() for i in range(0, len(p), 20)],
+    "bytes32[]": lambda p: [p[i:i + 32] for i in range(0, len(p), 32)],
+})
+
 
 # Error codes from C API
 PRIMITIVES_SUCCESS = 0
@@ -37,43 +150,85 @@ def _check_error(result: int, context: str = "") -> None:
     raise InvalidInputError(f"ABI error code {result}{': ' + context if context else ''}")
 
 
-def _parse_json_value(abi_type: str, value: Any) -> Any:
-    """Convert JSON-decoded value to appropriate Python type based on ABI type."""
+def _parse_json_address(value: Any) -> str:
+    # Address comes back as hex string
+    return value if isinstance(value, str) else str(value)
+
+
+def _parse_json_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return value == "true"
+
+
+def _parse_json_bytes(value: Any) -> bytes:
+    # Bytes come back as hex strings
+    if isinstance(value, str):
+        hex_str = value[2:] if value.startswith("0x") else value
+        return bytes.fromhex(hex_str) if hex_str else b""
+    return bytes(value)
+
+
+def _parse_json_passthrough(value: Any) -> Any:
+    return value
+
+
+@functools.lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def _json_value_parser(abi_type: str) -> Callable[[Any], Any]:
+    """
+    Converter from a JSON-decoded value to the Python type for ``abi_type``.
+
+    The type string is inspected once per type (and cached), so decoding a
+    long array applies one converter per element instead of re-running the
+    type checks for every value.
+    """
     # Check arrays FIRST (before uint/int/bytes checks which use startswith)
     if abi_type.endswith("[]"):
         # Dynamic array
-        element_type = abi_type[:-2]
-        if isinstance(value, list):
-            return [_parse_json_value(element_type, v) for v in value]
-        return value
+        parse_element = _json_value_parser(abi_type[:-2])
+
+        def parse_array(value: Any) -> Any:
+            if isinstance(value, list):
+                return [parse_element(v) for v in value]
+            return value
+
+        return parse_array
 
     if abi_type == "address":
-        # Address comes back as hex string
-        return value if isinstance(value, str) else str(value)
+        return _parse_json_address
 
-    if abi_type.startswith("uint") or abi_type.startswith("int"):
+    if abi_type.startswith(("uint", "int")):
         # Integers come back as strings for large values
-        if isinstance(value, str):
-            return int(value)
-        return int(value)
+        return int
 
     if abi_type == "bool":
-        if isinstance(value, bool):
-            return value
-        return value == "true" or value is True
+        return _parse_json_bool
 
     if abi_type == "string":
-        return str(value)
+        return str
 
-    if abi_type == "bytes" or abi_type.startswith("bytes"):
-        # Bytes come back as hex strings
-        if isinstance(value, str):
-            hex_str = value[2:] if value.startswith("0x") else value
-            return bytes.fromhex(hex_str) if hex_str else b""
-        return bytes(value)
+    if abi_type.startswith("bytes"):
+        return _parse_json_bytes
 
     # Fallback
-    return value
+    return _parse_json_passthrough
+
+
+def _parse_json_values(types: Sequence[str], values: list[Any]) -> list[Any]:
+    """Convert a decoded JSON value list, one converter per parameter type."""
+    return [_json_value_parser(t)(v) for t, v in zip(types, values)]
+
+
+@functools.lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def _compute_selector(signature: str) -> bytes:
+    """First 4 bytes of keccak256(signature), memoized per signature string."""
+    sig_bytes = signature.encode("utf-8")
+    _, out_ptr = scratch_hash()
+
+    result = primitives_keccak256(sig_bytes, len(sig_bytes), out_ptr)
+    _check_error(result, f"computing selector for {signature}")
+
+    return ctypes.string_at(out_ptr, 4)
 
 
 class Abi:
@@ -84,6 +239,8 @@ class Abi:
         """
         Compute the 4-byte function selector from a function signature.
 
+        Results are cached per signature (see SELECTOR_CACHE_SIZE).
+
         Args:
             signature: Function signature string (e.g., "transfer(address,uint256)")
 
@@ -94,16 +251,7 @@ class Abi:
             >>> Abi.compute_selector("transfer(address,uint256)")
             b'\\xa9\\x05\\x9c\\xbb'
         """
-        lib = get_lib()
-        out_selector = (c_uint8 * 4)()
-
-        result = lib.primitives_abi_compute_selector(
-            signature.encode("utf-8"),
-            ctypes.byref(out_selector),
-        )
-        _check_error(result, f"computing selector for {signature}")
-
-        return bytes(out_selector)
+        return _compute_selector(signature)
 
     @staticmethod
     def decode_parameters(types: list[str], data: Union[bytes, bytearray]) -> list[Any]:
@@ -136,37 +284,135 @@ class Abi:
         if not data:
             raise InvalidLengthError("Empty data for non-empty parameter types")
 
-        lib = get_lib()
+        decoded = _decode_parameters_bin(types, data)
+        if decoded is not None:
+            return decoded
 
-        # Convert data to ctypes array
-        data_bytes = bytes(data)
-        data_array = (c_uint8 * len(data_bytes))(*data_bytes)
+        data_ptr, data_len = input_ptr(data)
 
         # Create types JSON
         types_json = json.dumps(types).encode("utf-8")
 
-        # Allocate output buffer (generous size for JSON output)
-        buf_size = max(4096, len(data) * 10)
-        out_buf = ctypes.create_string_buffer(buf_size)
+        # Reusable output buffer (generous size for JSON output)
+        out_buf, _ = scratch_buffer(len(data) * 10)
 
-        result = lib.primitives_abi_decode_parameters(
-            ctypes.cast(data_array, POINTER(c_uint8)),
-            c_size_t(len(data_bytes)),
+        result = primitives_abi_decode_parameters(
+            data_ptr,
+            c_size_t(data_len),
             types_json,
             out_buf,
-            c_size_t(buf_size),
+            c_size_t(len(out_buf)),
         )
         _check_error(result, "decoding parameters")
 
         # Parse JSON output
-        json_str = out_buf.value.decode("utf-8")
+        json_str = ctypes.string_at(out_buf, result).decode("utf-8")
         if not json_str:
             return []
 
         decoded = json.loads(json_str)
 
         # Convert to appropriate Python types
-        return [_parse_json_value(types[i], v) for i, v in enumerate(decoded)]
+        return _parse_json_values(types, decoded)
+
+    @staticmethod
+    def decode_parameters_batch(
+        types: list[str], items: Sequence[Union[bytes, bytearray]]
+    ) -> list[list[Any]]:
+        """
+        Decode many ABI-encoded blobs that share the same parameter types.
+
+        All blobs are handed to the native library in a single call, which is
+        much cheaper than calling decode_parameters once per blob when
+        scanning large numbers of logs or calls. Each blob decodes to the
+        same values decode_parameters would return for it.
+
+        Args:
+            types: List of ABI type strings shared by every blob
+            items: ABI-encoded blobs to decode
+
+        Returns:
+            One list of decoded Python values per blob, in input order
+
+        Raises:
+            InvalidInputError: If types or any blob are invalid
+            InvalidLengthError: If any blob is too short for the specified types
+
+        Example:
+            >>> blobs = [(1).to_bytes(32, "big"), (2).to_bytes(32, "big")]
+            >>> Abi.decode_parameters_batch(["uint256"], blobs)
+            [[1], [2]]
+        """
+        if not items:
+            return []
+
+        if not types:
+            return [[] for _ in items]
+
+        # offsets[i]..offsets[i + 1] spans item i within the concatenated data
+        offsets = array("I", itertools.accumulate(map(len, items), initial=0))
+        data_bytes = b"".join(items)
+
+        decoded = _decode_parameters_batch_bin(types, offsets, data_bytes, len(items))
+        if decoded is not None:
+            return decoded
+
+        data_ptr, _ = input_ptr(data_bytes)
+
+        # Reusable output buffer (generous size for JSON output)
+        out_buf, _ = scratch_buffer(len(data_bytes) * 10 + 2 * len(items))
+
+        result = primitives_abi_decode_parameters_batch(
+            json.dumps(types).encode("utf-8"),
+            (c_uint32 * len(offsets)).from_buffer(offsets),
+            data_ptr,
+            c_size_t(len(items)),
+            out_buf,
+            c_size_t(len(out_buf)),
+        )
+        _check_error(result, "decoding parameters")
+
+        decoded = json.loads(ctypes.string_at(out_buf, result))
+
+        parsers = [_json_value_parser(t) for t in types]
+        return [[p(v) for p, v in zip(parsers, values)] for values in decoded]
+
+    @staticmethod
+    def decode_parameters_many_threaded(
+        types: list[str],
+        items: Sequence[Union[bytes, bytearray]],
+        n_threads: int | None = None,
+    ) -> list[list[Any]]:
+        """
+        Decode many ABI-encoded blobs using a pool of threads.
+
+        The blobs are split into one contiguous chunk per thread and each
+        chunk goes through decode_parameters_batch. Native calls release the
+        GIL, so the chunks are decoded in parallel.
+
+        Args:
+            types: List of ABI type strings shared by every blob
+            items: ABI-encoded blobs to decode
+            n_threads: Number of worker threads (defaults to os.cpu_count())
+
+        Returns:
+            One list of decoded Python values per blob, in input order
+
+        Raises:
+            InvalidInputError: If types or any blob are invalid
+            InvalidLengthError: If any blob is too short for the specified types
+        """
+        n_threads = min(n_threads or os.cpu_count() or 1, len(items))
+        if n_threads <= 1:
+            return Abi.decode_parameters_batch(types, items)
+
+        chunk = -(-len(items) // n_threads)
+        chunks = [items[i:i + chunk] for i in range(0, len(items), chunk)]
+        with ThreadPoolExecutor(max_workers=n_threads) as pool:
+            results = pool.map(
+                lambda part: Abi.decode_parameters_batch(types, part), chunks
+            )
+            return [values for part in results for values in part]
 
     @staticmethod
     def decode_function_data(
@@ -193,41 +439,40 @@ class Abi:
         if len(data) < 4:
             raise InvalidLengthError("Data too short for function selector (< 4 bytes)")
 
-        lib = get_lib()
+        decoded = _decode_parameters_bin(types, data, 4)
+        if decoded is not None:
+            return bytes(data[:4]), decoded
 
-        # Convert data to ctypes array
-        data_bytes = bytes(data)
-        data_array = (c_uint8 * len(data_bytes))(*data_bytes)
+        data_ptr, data_len = input_ptr(data)
 
         # Create types JSON
         types_json = json.dumps(types).encode("utf-8")
 
-        # Allocate output buffers
+        # Output buffers (selector plus the reusable per-thread JSON buffer)
         out_selector = (c_uint8 * 4)()
-        buf_size = max(4096, len(data) * 10)
-        out_buf = ctypes.create_string_buffer(buf_size)
+        out_buf, _ = scratch_buffer(len(data) * 10)
 
-        result = lib.primitives_abi_decode_function_data(
-            ctypes.cast(data_array, POINTER(c_uint8)),
-            c_size_t(len(data_bytes)),
+        result = primitives_abi_decode_function_data(
+            data_ptr,
+            c_size_t(data_len),
             types_json,
             ctypes.byref(out_selector),
             out_buf,
-            c_size_t(buf_size),
+            c_size_t(len(out_buf)),
         )
         _check_error(result, "decoding function data")
 
         selector = bytes(out_selector)
 
         # Parse JSON output
-        json_str = out_buf.value.decode("utf-8")
+        json_str = ctypes.string_at(out_buf, result).decode("utf-8")
         if not json_str or json_str == "[]":
             return selector, []
 
         decoded = json.loads(json_str)
 
         # Convert to appropriate Python types
-        values = [_parse_json_value(types[i], v) for i, v in enumerate(decoded)]
+        values = _parse_json_values(types, decoded)
 
         return selector, values
 
@@ -262,7 +507,11 @@ class Abi:
         if len(types) == 0:
             return b""
 
-        lib = get_lib()
+        encoded = _encode_scalars(types, values)
+        if encoded is None:
+            encoded = _encode_parameters_bin(types, values)
+        if encoded is not None:
+            return encoded
 
         # Convert types and values to JSON format expected by C API
         types_json = json.dumps(types)
@@ -271,20 +520,19 @@ class Abi:
         ]
         values_json = json.dumps(values_json_list)
 
-        # Allocate output buffer (generous size: 32 bytes per param + extra for dynamic)
-        buf_size = max(len(types) * 32 * 4, 4096)
-        out_buf = (c_uint8 * buf_size)()
+        # Reusable output buffer (generous size: 32 bytes per param + extra for dynamic)
+        out_buf, out_ptr = scratch_buffer(len(types) * 32 * 4)
 
-        result = lib.primitives_abi_encode_parameters(
+        result = primitives_abi_encode_parameters(
             types_json.encode("utf-8"),
             values_json.encode("utf-8"),
-            ctypes.cast(out_buf, POINTER(c_uint8)),
-            buf_size,
+            out_ptr,
+            len(out_buf),
         )
         _check_error(result, "encoding parameters")
 
         # Result is number of bytes written
-        return bytes(out_buf[:result])
+        return ctypes.string_at(out_buf, result)
 
     @staticmethod
     def encode_function_data(signature: str, values: list[Any]) -> bytes:
@@ -312,8 +560,6 @@ class Abi:
             >>> calldata[:4].hex()
             'a9059cbb'
         """
-        lib = get_lib()
-
         # Extract types from signature for validation and JSON
         types = _extract_types_from_signature(signature)
 
@@ -322,6 +568,12 @@ class Abi:
                 f"Type/value count mismatch: {len(types)} types in signature, {len(values)} values"
             )
 
+        encoded = _encode_scalars(types, values)
+        if encoded is None:
+            encoded = _encode_parameters_bin(types, values)
+        if encoded is not None:
+            return _compute_selector(signature) + encoded
+
         # Convert to JSON format
         types_json = json.dumps(types)
         values_json_list = [
@@ -329,20 +581,19 @@ class Abi:
         ]
         values_json = json.dumps(values_json_list)
 
-        # Allocate output buffer
-        buf_size = max(4 + len(types) * 32 * 4, 4096)
-        out_buf = (c_uint8 * buf_size)()
+        # Reusable output buffer
+        out_buf, out_ptr = scratch_buffer(4 + len(types) * 32 * 4)
 
-        result = lib.primitives_abi_encode_function_data(
+        result = primitives_abi_encode_function_data(
             signature.encode("utf-8"),
             types_json.encode("utf-8"),
             values_json.encode("utf-8"),
-            ctypes.cast(out_buf, POINTER(c_uint8)),
-            buf_size,
+            out_ptr,
+            len(out_buf),
         )
         _check_error(result, "encoding function data")
 
-        return bytes(out_buf[:result])
+        return ctypes.string_at(out_buf, result)
 
     @staticmethod
     def encode_packed(types: list[str], values: list[Any]) -> bytes:
@@ -377,8 +628,6 @@ class Abi:
         if len(types) == 0:
             return b""
 
-        lib = get_lib()
-
         # Convert to JSON format
         types_json = json.dumps(types)
         values_json_list = [
@@ -386,28 +635,27 @@ class Abi:
         ]
         values_json = json.dumps(values_json_list)
 
-        # Allocate output buffer (packed is typically smaller, but be generous)
-        buf_size = max(len(types) * 32 * 2, 4096)
-        out_buf = (c_uint8 * buf_size)()
+        # Reusable output buffer (packed is typically smaller, but be generous)
+        out_buf, out_ptr = scratch_buffer(len(types) * 32 * 2)
 
-        result = lib.primitives_abi_encode_packed(
+        result = primitives_abi_encode_packed(
             types_json.encode("utf-8"),
             values_json.encode("utf-8"),
-            ctypes.cast(out_buf, POINTER(c_uint8)),
-            buf_size,
+            out_ptr,
+            len(out_buf),
         )
         _check_error(result, "encoding packed")
 
-        return bytes(out_buf[:result])
+        return ctypes.string_at(out_buf, result)
 
     @staticmethod
     def estimate_gas(data: bytes) -> int:
         """
         Estimate calldata gas cost based on EVM pricing rules.
 
-        Zero bytes cost 4 gas each, non-zero bytes cost 16 gas each.
-        This is useful for estimating transaction costs and comparing
-        encoding strategies.
+        The 21000 base transaction cost plus 4 gas per zero byte and 16 gas
+        per non-zero byte. Empty data is estimated at 0. This is useful for
+        estimating transaction costs and comparing encoding strategies.
 
         Args:
             data: Calldata bytes
@@ -417,21 +665,16 @@ class Abi:
 
         Example:
             >>> Abi.estimate_gas(bytes([0, 0, 0, 1]))  # 3 zeros + 1 non-zero
-            28
+            21028
         """
         if len(data) == 0:
             return 0
 
-        lib = get_lib()
-
-        data_array = (c_uint8 * len(data))(*data)
-        result = lib.primitives_abi_estimate_gas(
-            ctypes.cast(data_array, POINTER(c_uint8)),
-            len(data),
-        )
-
-        # Result is the gas estimate (non-negative)
-        return int(result)
+        # bytes.count is a C-level scan; no native call needed
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+        zeros = data.count(0)
+        return BASE_TX_GAS + ZERO_BYTE_GAS * zeros + NONZERO_BYTE_GAS * (len(data) - zeros)
 
 
 def _format_value_for_json(value: Any, type_str: str) -> str:
@@ -446,6 +689,8 @@ def _format_value_for_json(value: Any, type_str: str) -> str:
     elif type_str.startswith("uint") or type_str.startswith("int"):
         # Convert integers to string (decimal or hex)
         if isinstance(value, int):
+            if type_str in _INT_TYPES:
+                _check_int_range(type_str, value)
             return str(value)
         raise InvalidInputError(f"Integer type requires int value, got {type(value)}")
     elif type_str.startswith("bytes"):
@@ -464,15 +709,238 @@ def _format_value_for_json(value: Any, type_str: str) -> str:
         return str(value)
 
 
-def _extract_types_from_signature(signature: str) -> list[str]:
+def _bin_payload(type_str: str, value: Any) -> bytes:
+    """Raw payload for one value in the binary parameter format."""
+    element_size = _BIN_ARRAY_ELEMENT_SIZE.get(type_str)
+    if element_size is not None:
+        if not isinstance(value, (list, tuple)):
+            raise InvalidInputError(f"Array type requires list or tuple value, got {type(value)}")
+        payloads = [_bin_payload(type_str[:-2], v) for v in value]
+        if any(len(p) != element_size for p in payloads):
+            raise InvalidInputError(f"Invalid element for {type_str}")
+        return b"".join(payloads)
+    if type_str.startswith(("uint", "int")):
+        return _int_word(type_str, value)
+    elif type_str == "address":
+        if not isinstance(value, str):
+            raise InvalidInputError(f"Address must be a string, got {type(value)}")
+        payload = _hex_payload(value)
+        if payload is None or len(payload) != 20:
+            raise InvalidInputError(f"Invalid address: {value}")
+        return payload
+    elif type_str == "bool":
+        return b"\x01" if value else b"\x00"
+    elif type_str == "string":
+        if not isinstance(value, str):
+            raise InvalidInputError(f"String type requires str value, got {type(value)}")
+        return value.encode("utf-8")
+    else:
+        # bytes1-bytes32 or dynamic bytes
+        if isinstance(value, bytes):
+            payload = value
+        elif isinstance(value, str):
+            payload = _hex_payload(value)
+            if payload is None:
+                raise InvalidInputError(f"Invalid hex for {type_str}: {value}")
+        else:
+            raise InvalidInputError(f"Bytes type requires bytes or hex string, got {type(value)}")
+        if type_str != "bytes" and len(payload) != int(type_str[5:]):
+            raise InvalidInputError(f"Invalid length for {type_str}: {len(payload)} bytes")
+        return payload
+
+
+def _check_int_range(type_str: str, value: Any) -> bool:
+    """
+    Check a uintN/intN value against its bit width on every encode path.
+
+    Returns whether the type is signed. The native binary parser widens
+    every uintN/intN to 256 bits, so the bound is only enforced here.
     """
-    Extract parameter types from a function signature.
+    bits, signed = _INT_TYPES[type_str]
+    if not isinstance(value, int):
+        raise InvalidInputError(f"Integer type requires int value, got {type(value)}")
+    bound = 1 << (bits - 1) if signed else 1 << bits
+    low = -bound if signed else 0
+    if not low <= value < bound:
+        raise InvalidInputError(f"Value out of range for {type_str}: {value}")
+    return signed
+
+
+def _int_word(type_str: str, value: Any) -> bytes:
+    """32-byte big-endian word for a range-checked uintN/intN value."""
+    return value.to_bytes(32, "big", signed=_check_int_range(type_str, value))
+
+
+def _hex_payload(value: str) -> bytes | None:
+    """Decode an optionally 0x-prefixed hex string, or None if malformed."""
+    digits = value[2:] if value.startswith(("0x", "0X")) else value
+    try:
+        payload = bytes.fromhex(digits)
+    except ValueError:
+        return None
+    # fromhex skips whitespace between byte pairs; reject it like the native parser
+    return payload if len(payload) * 2 == len(digits) else None
+
+
+def _encode_scalars(types: Sequence[str], values: Sequence[Any]) -> bytes | None:
+    """
+    ABI-encode static scalar parameters (uintN, intN, address, bool) directly.
+
+    Returns None when any type is not a scalar, so the caller can fall back
+    to the native entry points.
+    """
+    if not _SCALAR_TYPES.issuperset(types):
+        return None
+
+    words = []
+    for type_str, value in zip(types, values):
+        if type_str == "bool":
+            words.append(_WORD_TRUE if value else _WORD_FALSE)
+        elif type_str == "address":
+            words.append(_ADDRESS_PAD + _bin_payload(type_str, value))
+        else:
+            words.append(_int_word(type_str, value))
+    return b"".join(words)
+
+
+def _encode_parameters_bin(types: Sequence[str], values: Sequence[Any]) -> bytes | None:
+    """
+    ABI-encode through the binary entry point.
+
+    Returns None when a type is not covered by the binary format, so the
+    caller can fall back to the JSON entry point.
+    """
+    try:
+        tags = bytes([_BIN_TYPE_TAGS[t] for t in types])
+    except KeyError:
+        return None
+
+    values_buf = bytearray()
+    dynamic_len = 0
+    for type_str, value in zip(types, values):
+        payload = _bin_payload(type_str, value)
+        values_buf += _U32.pack(len(payload))
+        values_buf += payload
+        # Arrays encode one 32-byte word per element
+        element_size = _BIN_ARRAY_ELEMENT_SIZE.get(type_str)
+        dynamic_len += len(payload) if element_size is None else len(payload) // element_size * 32
+
+    # Head word per parameter, plus length word and padding per dynamic tail
+    out_buf, out_ptr = scratch_buffer(96 * len(types) + dynamic_len)
+
+    result = primitives_abi_encode_parameters_bin(
+        tags,
+        len(tags),
+        bytes(values_buf),
+        len(values_buf),
+        out_ptr,
+        len(out_buf),
+    )
+    _check_error(result, "encoding parameters")
+
+    return ctypes.string_at(out_buf, result)
+
+
+def _decode_parameters_bin(
+    types: Sequence[str], data: Union[bytes, bytearray], offset: int = 0
+) -> list[Any] | None:
+    """
+    ABI-decode ``data[offset:]`` through the binary entry point.
+
+    Returns None when a type is not covered by the binary format, so the
+    caller can fall back to the JSON entry point.
+    """
+    try:
+        tags = bytes([_BIN_TYPE_TAGS[t] for t in types])
+    except KeyError:
+        return None
+
+    data_ptr, data_len = input_ptr(data, offset)
+
+    # Length word plus at most one 32-byte word per parameter; each dynamic
+    # payload is no longer than the input
+    n_dynamic = sum(tag in _BIN_DYNAMIC_TAGS for tag in tags)
+    out_buf, _ = scratch_buffer(36 * len(tags) + n_dynamic * data_len)
+
+    result = primitives_abi_decode_parameters_bin(
+        data_ptr,
+        data_len,
+        tags,
+        len(tags),
+        out_buf,
+        len(out_buf),
+    )
+    _check_error(result, "decoding parameters")
+
+    raw = ctypes.string_at(out_buf, result)
+    values, _ = _parse_bin_values([_BIN_DECODERS[t] for t in types], raw, 0)
+    return values
+
+
+def _decode_parameters_batch_bin(
+    types: Sequence[str], offsets: array, data: bytes, count: int
+) -> list[list[Any]] | None:
+    """
+    ABI-decode ``count`` concatenated blobs through the binary batch entry point.
+
+    Returns None when a type is not covered by the binary format, so the
+    caller can fall back to the JSON entry point.
+    """
+    try:
+        tags = bytes([_BIN_TYPE_TAGS[t] for t in types])
+    except KeyError:
+        return None
+
+    data_ptr, data_len = input_ptr(data)
+
+    # Same bound as _decode_parameters_bin, summed over the items
+    n_dynamic = sum(tag in _BIN_DYNAMIC_TAGS for tag in tags)
+    out_buf, _ = scratch_buffer(36 * len(tags) * count + n_dynamic * data_len)
+
+    result = primitives_abi_decode_parameters_batch_bin(
+        data_ptr,
+        (c_uint32 * len(offsets)).from_buffer(offsets),
+        count,
+        tags,
+        len(tags),
+        out_buf,
+        len(out_buf),
+    )
+    _check_error(result, "decoding parameters")
+
+    raw = ctypes.string_at(out_buf, result)
+    decoders = [_BIN_DECODERS[t] for t in types]
+    rows = []
+    pos = 0
+    for _ in range(count):
+        values, pos = _parse_bin_values(decoders, raw, pos)
+        rows.append(values)
+    return rows
+
+
+def _parse_bin_values(
+    decoders: Sequence[Callable[[bytes], Any]], raw: bytes, pos: int
+) -> tuple[list[Any], int]:
+    """Read one u32 length-prefixed payload per decoder from ``raw[pos:]``."""
+    values = []
+    for decode in decoders:
+        (size,) = _U32.unpack_from(raw, pos)
+        pos += 4
+        values.append(decode(raw[pos:pos + size]))
+        pos += size
+    return values, pos
+
+
+@functools.lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def _extract_types_from_signature(signature: str) -> tuple[str, ...]:
+    """
+    Extract parameter types from a function signature (cached).
 
     Args:
         signature: Function signature like "transfer(address,uint256)"
 
     Returns:
-        List of type strings like ["address", "uint256"]
+        Tuple of type strings like ("address", "uint256")
     """
     # Find the parameter section between parentheses
     start = signature.find("(")
@@ -484,7 +952,14 @@ def _extract_types_from_signature(signature: str) -> list[str]:
     params_str = signature[start + 1:end]
 
     if not params_str:
-        return []
+        return ()
+
+    # No tuple types: a plain split gives the same result
+    if "(" not in params_str:
+        types = [t.strip() for t in params_str.split(",")]
+        if not types[-1]:
+            types.pop()
+        return tuple(types)
 
     # Split by comma, but be careful with nested types (tuples)
     types = []
@@ -507,4 +982,4 @@ def _extract_types_from_signature(signature: str) -> list[str]:
     if current.strip():
         types.append(current.strip())
 
-    return types
+    return tuple(types)
@@ -2,7 +2,8 @@
 AccessList - EIP-2930 access lists for gas-optimized storage access.
 """
 
-from dataclasses import dataclass
+import itertools
+from dataclasses import dataclass, field
 from typing import Iterator, Sequence
 
 from voltaire.errors import InvalidLengthError
@@ -16,13 +17,37 @@ COLD_STORAGE_ACCESS_COST: int = 2100
 WARM_STORAGE_ACCESS_COST: int = 100
 
 
+_HEX_PREFIXES = ("0x", "0X")
+
+
 def _strip_0x(s: str) -> str:
     """Remove 0x prefix if present."""
-    if s.startswith(("0x", "0X")):
+    if s.startswith(_HEX_PREFIXES):
         return s[2:]
     return s
 
 
+def _decode_hex_chunks(hexes: list[str], size: int) -> list[bytes] | None:
+    """
+    Decode unprefixed hex strings of exactly ``size`` bytes each.
+
+    All strings go through a single bytes.fromhex call and the result is
+    sliced back apart. Returns None if any string is not exactly ``size``
+    bytes of hex, so the caller can decode one by one and report which.
+    """
+    width = 2 * size
+    if any(len(h) != width for h in hexes):
+        return None
+    try:
+        raw = bytes.fromhex("".join(hexes))
+    except ValueError:
+        return None
+    if len(raw) != size * len(hexes):
+        # fromhex skips whitespace, so a padded string decodes short
+        return None
+    return [raw[i : i + size] for i in range(0, len(raw), size)]
+
+
 def _validate_address(data: bytes) -> None:
     """Validate address is exactly 20 bytes."""
     if len(data) != 20:
@@ -66,6 +91,21 @@ class AccessListEntry:
         for key in self.storage_keys:
             _validate_storage_key(key)
 
+    @classmethod
+    def _unchecked(
+        cls, address: bytes, storage_keys: tuple[bytes, ...]
+    ) -> "AccessListEntry":
+        """
+        Build an entry without __post_init__ validation.
+
+        Only for values whose lengths are already guaranteed, such as the
+        fixed-width slices produced by _decode_hex_chunks.
+        """
+        entry = object.__new__(cls)
+        object.__setattr__(entry, "address", address)
+        object.__setattr__(entry, "storage_keys", storage_keys)
+        return entry
+
     @classmethod
     def from_dict(cls, d: dict) -> "AccessListEntry":
         """
@@ -83,12 +123,18 @@ class AccessListEntry:
         addr_hex = _strip_0x(d["address"])
         addr_bytes = bytes.fromhex(addr_hex)
 
-        storage_keys = tuple(
-            bytes.fromhex(_strip_0x(key))
+        key_hexes = [
+            key[2:] if key[:2] in _HEX_PREFIXES else key
             for key in d.get("storageKeys", [])
-        )
+        ]
+        storage_keys = _decode_hex_chunks(key_hexes, 32)
+        if storage_keys is None:
+            storage_keys = [bytes.fromhex(key) for key in key_hexes]
+            return cls(address=addr_bytes, storage_keys=tuple(storage_keys))
 
-        return cls(address=addr_bytes, storage_keys=storage_keys)
+        # Keys are 32 bytes by construction; only the address needs checking
+        _validate_address(addr_bytes)
+        return cls._unchecked(addr_bytes, tuple(storage_keys))
 
     def to_dict(self) -> dict:
         """
@@ -98,8 +144,8 @@ class AccessListEntry:
             Dictionary with 'address' and 'storageKeys' as hex strings
         """
         return {
-            "address": "0x" + self.address.hex(),
-            "storageKeys": ["0x" + key.hex() for key in self.storage_keys],
+            "address": f"0x{self.address.hex()}",
+            "storageKeys": [f"0x{key.hex()}" for key in self.storage_keys],
         }
 
 
@@ -126,6 +172,15 @@ class AccessList:
     entries: tuple[AccessListEntry, ...] = ()
     """Tuple of access list entries."""
 
+    _total_keys: int = field(init=False, repr=False, compare=False)
+    """Storage keys across all entries, counted once at construction."""
+
+    def __post_init__(self) -> None:
+        """Count storage keys so gas_cost and storage_key_count are O(1)."""
+        object.__setattr__(
+            self, "_total_keys", sum(len(entry.storage_keys) for entry in self.entries)
+        )
+
     @classmethod
     def from_list(cls, items: Sequence[dict]) -> "AccessList":
         """
@@ -137,7 +192,33 @@ class AccessList:
         Returns:
             AccessList instance
         """
-        entries = tuple(AccessListEntry.from_dict(item) for item in items)
+        # Decode every address, then every storage key, with one fromhex call
+        # each; on any malformed value fall back to per-entry decoding, which
+        # raises the precise error.
+        addr_hexes: list[str] = []
+        key_hexes_per_item: list[list[str]] = []
+        for item in items:
+            addr = item["address"]
+            addr_hexes.append(addr[2:] if addr[:2] in _HEX_PREFIXES else addr)
+            key_hexes_per_item.append([
+                key[2:] if key[:2] in _HEX_PREFIXES else key
+                for key in item.get("storageKeys", [])
+            ])
+        addresses = _decode_hex_chunks(addr_hexes, 20)
+        keys = _decode_hex_chunks(
+            list(itertools.chain.from_iterable(key_hexes_per_item)), 32
+        )
+        if addresses is None or keys is None:
+            return cls(entries=tuple(AccessListEntry.from_dict(item) for item in items))
+
+        # Decoded addresses and keys are 20 and 32 bytes by construction
+        key_iter = iter(keys)
+        entries = tuple(
+            AccessListEntry._unchecked(
+                address, tuple(itertools.islice(key_iter, len(key_hexes)))
+            )
+            for address, key_hexes in zip(addresses, key_hexes_per_item)
+        )
         return cls(entries=entries)
 
     def to_list(self) -> list[dict]:
@@ -158,9 +239,7 @@ class AccessList:
         Returns:
             Total gas cost in gas units
         """
-        num_addresses = len(self.entries)
-        num_keys = sum(len(entry.storage_keys) for entry in self.entries)
-        return ADDRESS_COST * num_addresses + STORAGE_KEY_COST * num_keys
+        return ADDRESS_COST * len(self.entries) + STORAGE_KEY_COST * self._total_keys
 
     def address_count(self) -> int:
         """
@@ -178,7 +257,7 @@ class AccessList:
         Returns:
             Total count of storage keys
         """
-        return sum(len(entry.storage_keys) for entry in self.entries)
+        return self._total_keys
 
     def is_empty(self) -> bool:
         """
@@ -3,12 +3,24 @@ Address - 20-byte Ethereum address with EIP-55 checksum support.
 """
 
 import ctypes
-from ctypes import POINTER, c_uint8, c_uint64
+from ctypes import c_uint8, c_uint64
 from typing import ClassVar
 
-from voltaire._ffi import PrimitivesAddress, get_lib
+from voltaire._ffi import (
+    ADDRESS_HEX_LEN,
+    PrimitivesAddress,
+    input_ptr,
+    primitives_address_from_hex,
+    primitives_address_to_checksum_hex,
+    primitives_address_validate_checksum,
+    primitives_calculate_create2_address,
+    primitives_calculate_create_address,
+    scratch_hex43,
+)
 from voltaire.errors import check_error, InvalidLengthError, InvalidValueError
 
+_ZERO_BYTES = bytes(20)
+
 
 class Address:
     """
@@ -23,13 +35,16 @@ class Address:
         0x742d35Cc6634C0532925a3b844Bc9e7595f2bD20
     """
 
-    __slots__ = ("_data",)
+    # _bytes mirrors _data so equality, hashing and to_bytes stay in pure
+    # CPython; bytes caches its own hash after the first call.
+    __slots__ = ("_data", "_bytes")
 
     _ZERO: ClassVar["Address | None"] = None
 
     def __init__(self, data: PrimitivesAddress) -> None:
         """Internal constructor. Use from_hex, from_bytes, or zero() instead."""
         self._data = data
+        self._bytes = bytes(data.bytes)
 
     @classmethod
     def from_hex(cls, hex_str: str) -> "Address":
@@ -46,14 +61,13 @@ class Address:
             InvalidHexError: Invalid hex characters
             InvalidLengthError: Not exactly 20 bytes
         """
-        lib = get_lib()
         addr = PrimitivesAddress()
 
         # Ensure 0x prefix for C API
         if not hex_str.startswith(("0x", "0X")):
             hex_str = "0x" + hex_str
 
-        result = lib.primitives_address_from_hex(
+        result = primitives_address_from_hex(
             hex_str.encode("ascii"), ctypes.byref(addr)
         )
         check_error(result, "Address.from_hex")
@@ -119,10 +133,9 @@ class Address:
                 f"Address.calculate_create_address: nonce must be non-negative, got {nonce}"
             )
 
-        lib = get_lib()
         out_addr = PrimitivesAddress()
 
-        result = lib.primitives_calculate_create_address(
+        result = primitives_calculate_create_address(
             ctypes.byref(sender._data),
             c_uint64(nonce),
             ctypes.byref(out_addr),
@@ -156,23 +169,17 @@ class Address:
                 f"Address.calculate_create2_address: salt must be 32 bytes, got {len(salt)}"
             )
 
-        lib = get_lib()
         out_addr = PrimitivesAddress()
 
-        # Convert salt to ctypes array
-        salt_array = (c_uint8 * 32)(*salt)
-
-        # Convert init_code to ctypes pointer
-        if len(init_code) > 0:
-            init_code_ptr = (c_uint8 * len(init_code))(*init_code)
-        else:
-            init_code_ptr = None
+        # One bulk copy for the salt; init_code is read in place
+        salt_array = (c_uint8 * 32).from_buffer_copy(salt)
+        init_code_ptr, init_code_len = input_ptr(init_code)
 
-        result = lib.primitives_calculate_create2_address(
+        result = primitives_calculate_create2_address(
             ctypes.byref(sender._data),
             ctypes.byref(salt_array),
-            ctypes.cast(init_code_ptr, POINTER(c_uint8)) if init_code_ptr else None,
-            len(init_code),
+            init_code_ptr,
+            init_code_len,
             ctypes.byref(out_addr),
         )
         check_error(result, "Address.calculate_create2_address")
@@ -186,11 +193,8 @@ class Address:
         Returns:
             42-character hex string (e.g., "0x1234...abcd")
         """
-        lib = get_lib()
-        buf = ctypes.create_string_buffer(43)  # 42 chars + null terminator
-        result = lib.primitives_address_to_hex(ctypes.byref(self._data), buf)
-        check_error(result, "Address.to_hex")
-        return buf.value.decode("ascii")
+        # bytes.hex() is already lowercase and needs no output buffer at all
+        return f"0x{self._bytes.hex()}"
 
     def to_checksum(self) -> str:
         """
@@ -199,11 +203,10 @@ class Address:
         Returns:
             42-character mixed-case hex string
         """
-        lib = get_lib()
-        buf = ctypes.create_string_buffer(43)  # 42 chars + null terminator
-        result = lib.primitives_address_to_checksum_hex(ctypes.byref(self._data), buf)
+        buf = scratch_hex43()
+        result = primitives_address_to_checksum_hex(ctypes.byref(self._data), buf)
         check_error(result, "Address.to_checksum")
-        return buf.value.decode("ascii")
+        return buf.raw[:ADDRESS_HEX_LEN].decode("ascii")
 
     def to_bytes(self) -> bytes:
         """
@@ -212,7 +215,7 @@ class Address:
         Returns:
             20 bytes
         """
-        return bytes(self._data.bytes)
+        return self._bytes
 
     def is_zero(self) -> bool:
         """
@@ -221,8 +224,7 @@ class Address:
         Returns:
             True if all bytes are zero
         """
-        lib = get_lib()
-        return lib.primitives_address_is_zero(ctypes.byref(self._data))
+        return self._bytes == _ZERO_BYTES
 
     @staticmethod
     def validate_checksum(hex_str: str) -> bool:
@@ -235,26 +237,22 @@ class Address:
         Returns:
             True if checksum is valid, False otherwise
         """
-        lib = get_lib()
-
         # Ensure 0x prefix
         if not hex_str.startswith(("0x", "0X")):
             hex_str = "0x" + hex_str
 
-        return lib.primitives_address_validate_checksum(hex_str.encode("ascii"))
+        return primitives_address_validate_checksum(hex_str.encode("ascii"))
 
     def __eq__(self, other: object) -> bool:
         """Check equality with another Address."""
         if not isinstance(other, Address):
             return NotImplemented
-        lib = get_lib()
-        return lib.primitives_address_equals(
-            ctypes.byref(self._data), ctypes.byref(other._data)
-        )
+        # A 20-byte compare is far cheaper than an FFI round trip
+        return self._bytes == other._bytes
 
     def __hash__(self) -> int:
         """Return hash of address bytes."""
-        return hash(bytes(self._data.bytes))
+        return hash(self._bytes)
 
     def __bytes__(self) -> bytes:
         """Support bytes(addr) conversion."""
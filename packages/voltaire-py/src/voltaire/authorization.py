@@ -10,13 +10,12 @@ from typing import Any
 
 from voltaire._ffi import (
     PrimitivesAddress,
+    PrimitivesAuthorization,
     PrimitivesHash,
-    get_lib,
-    c_uint8,
     c_uint64,
-    c_size_t,
-    POINTER,
-    Structure,
+    primitives_authorization_authority,
+    primitives_authorization_gas_cost,
+    primitives_authorization_signing_hash,
 )
 from voltaire.errors import check_error, InvalidAuthorizationError
 
@@ -40,60 +39,12 @@ SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
 # secp256k1 curve order N / 2 (for malleability check)
 SECP256K1_HALF_N = SECP256K1_N // 2
 
-
-# ============================================================================
-# C Struct
-# ============================================================================
-
-
-class PrimitivesAuthorization(Structure):
-    """C-compatible Authorization structure."""
-
-    _fields_ = [
-        ("chain_id", c_uint64),
-        ("address", PrimitivesAddress),
-        ("nonce", c_uint64),
-        ("v", c_uint64),
-        ("r", c_uint8 * 32),
-        ("s", c_uint8 * 32),
-    ]
-
-
-def _setup_authorization_functions(lib: ctypes.CDLL) -> None:
-    """Set up C function signatures for authorization API."""
-    lib.primitives_authorization_validate.argtypes = [POINTER(PrimitivesAuthorization)]
-    lib.primitives_authorization_validate.restype = ctypes.c_int
-
-    lib.primitives_authorization_signing_hash.argtypes = [
-        c_uint64,
-        POINTER(PrimitivesAddress),
-        c_uint64,
-        POINTER(PrimitivesHash),
-    ]
-    lib.primitives_authorization_signing_hash.restype = ctypes.c_int
-
-    lib.primitives_authorization_authority.argtypes = [
-        POINTER(PrimitivesAuthorization),
-        POINTER(PrimitivesAddress),
-    ]
-    lib.primitives_authorization_authority.restype = ctypes.c_int
-
-    lib.primitives_authorization_gas_cost.argtypes = [c_size_t, c_size_t]
-    lib.primitives_authorization_gas_cost.restype = c_uint64
-
-
-# Flag to track if we've set up authorization functions
-_authorization_setup_done = False
-
-
-def _ensure_authorization_setup() -> ctypes.CDLL:
-    """Ensure authorization C functions are set up."""
-    global _authorization_setup_done
-    lib = get_lib()
-    if not _authorization_setup_done:
-        _setup_authorization_functions(lib)
-        _authorization_setup_done = True
-    return lib
+# r and s are fixed-width 32-byte big-endian, so comparing them as bytes
+# orders them exactly like the integers, without building a 256-bit int.
+_ZERO_WORD = bytes(32)
+_ZERO_ADDRESS = bytes(20)
+_SECP256K1_N_BYTES = SECP256K1_N.to_bytes(32, "big")
+_SECP256K1_HALF_N_BYTES = SECP256K1_HALF_N.to_bytes(32, "big")
 
 
 # ============================================================================
@@ -150,7 +101,7 @@ class Authorization:
             InvalidAuthorizationError: If validation fails
         """
         # Check address is not zero
-        if self.address == bytes(20):
+        if self.address == _ZERO_ADDRESS:
             raise InvalidAuthorizationError("Address cannot be zero address")
 
         # Check y_parity
@@ -158,17 +109,15 @@ class Authorization:
             raise InvalidAuthorizationError("yParity must be 0 or 1")
 
         # Check r
-        r_int = int.from_bytes(self.r, "big")
-        if r_int == 0:
+        if self.r == _ZERO_WORD:
             raise InvalidAuthorizationError("Signature r cannot be zero")
-        if r_int >= SECP256K1_N:
+        if self.r >= _SECP256K1_N_BYTES:
             raise InvalidAuthorizationError("Signature r must be less than curve order")
 
         # Check s
-        s_int = int.from_bytes(self.s, "big")
-        if s_int == 0:
+        if self.s == _ZERO_WORD:
             raise InvalidAuthorizationError("Signature s cannot be zero")
-        if s_int > SECP256K1_HALF_N:
+        if self.s > _SECP256K1_HALF_N_BYTES:
             raise InvalidAuthorizationError("Signature s too high (malleable signature)")
 
         return True
@@ -183,14 +132,12 @@ class Authorization:
         Returns:
             32-byte Keccak-256 hash
         """
-        lib = _ensure_authorization_setup()
-
         addr = PrimitivesAddress()
         ctypes.memmove(addr.bytes, self.address, 20)
 
         out_hash = PrimitivesHash()
 
-        result = lib.primitives_authorization_signing_hash(
+        result = primitives_authorization_signing_hash(
             c_uint64(self.chain_id),
             ctypes.byref(addr),
             c_uint64(self.nonce),
@@ -210,8 +157,6 @@ class Authorization:
         Raises:
             InvalidSignatureError: If signature recovery fails
         """
-        lib = _ensure_authorization_setup()
-
         # Create C struct
         c_auth = PrimitivesAuthorization()
         c_auth.chain_id = self.chain_id
@@ -223,7 +168,7 @@ class Authorization:
 
         out_address = PrimitivesAddress()
 
-        result = lib.primitives_authorization_authority(
+        result = primitives_authorization_authority(
             ctypes.byref(c_auth),
             ctypes.byref(out_address),
         )
@@ -245,8 +190,7 @@ class Authorization:
         Returns:
             Total gas cost
         """
-        lib = _ensure_authorization_setup()
-        return lib.primitives_authorization_gas_cost(auth_count, empty_accounts)
+        return primitives_authorization_gas_cost(auth_count, empty_accounts)
 
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> "Authorization":
@@ -306,9 +250,9 @@ class Authorization:
         """
         return {
             "chainId": self.chain_id,
-            "address": "0x" + self.address.hex(),
+            "address": f"0x{self.address.hex()}",
             "nonce": self.nonce,
             "yParity": self.y_parity,
-            "r": "0x" + self.r.hex(),
-            "s": "0x" + self.s.hex(),
+            "r": f"0x{self.r.hex()}",
+            "s": f"0x{self.s.hex()}",
         }
@@ -10,7 +10,14 @@ import ctypes
 import struct
 from typing import ClassVar
 
-from voltaire._ffi import get_lib
+from voltaire._ffi import (
+    primitives_blob_calculate_excess_gas,
+    primitives_blob_calculate_gas,
+    primitives_blob_calculate_gas_price,
+    primitives_blob_estimate_count,
+    primitives_blob_from_data,
+    primitives_blob_to_data,
+)
 from voltaire.errors import InvalidLengthError, InvalidInputError, check_error
 
 # Constants
@@ -85,13 +92,12 @@ class Blob:
             )
 
         # Try FFI first
-        lib = get_lib()
         out_blob = c_uint8_array_blob()
 
         # Convert data to ctypes array
         data_array = (ctypes.c_uint8 * len(data))(*data)
 
-        result = lib.primitives_blob_from_data(
+        result = primitives_blob_from_data(
             ctypes.cast(data_array, ctypes.POINTER(ctypes.c_uint8)),
             len(data),
             ctypes.cast(out_blob, ctypes.POINTER(ctypes.c_uint8)),
@@ -138,13 +144,12 @@ class Blob:
             InvalidInputError: If length prefix is invalid
         """
         # Try FFI first
-        lib = get_lib()
         out_data = (ctypes.c_uint8 * BLOB_SIZE)()
         out_len = ctypes.c_size_t()
 
         blob_array = (ctypes.c_uint8 * BLOB_SIZE)(*self._data)
 
-        result = lib.primitives_blob_to_data(
+        result = primitives_blob_to_data(
             ctypes.cast(blob_array, ctypes.POINTER(ctypes.c_uint8)),
             ctypes.cast(out_data, ctypes.POINTER(ctypes.c_uint8)),
             ctypes.byref(out_len),
@@ -212,8 +217,7 @@ class Blob:
         Returns:
             Total blob gas (blob_count * 131072)
         """
-        lib = get_lib()
-        return lib.primitives_blob_calculate_gas(blob_count)
+        return primitives_blob_calculate_gas(blob_count)
 
     @staticmethod
     def estimate_count(data_size: int) -> int:
@@ -228,8 +232,7 @@ class Blob:
         """
         if data_size <= 0:
             return 0
-        lib = get_lib()
-        return lib.primitives_blob_estimate_count(data_size)
+        return primitives_blob_estimate_count(data_size)
 
     @staticmethod
     def calculate_gas_price(excess_blob_gas: int) -> int:
@@ -244,8 +247,7 @@ class Blob:
         Returns:
             Blob gas price in wei
         """
-        lib = get_lib()
-        return lib.primitives_blob_calculate_gas_price(excess_blob_gas)
+        return primitives_blob_calculate_gas_price(excess_blob_gas)
 
     @staticmethod
     def calculate_excess_gas(parent_excess: int, parent_used: int) -> int:
@@ -261,8 +263,7 @@ class Blob:
         Returns:
             New excess blob gas
         """
-        lib = get_lib()
-        return lib.primitives_blob_calculate_excess_gas(parent_excess, parent_used)
+        return primitives_blob_calculate_excess_gas(parent_excess, parent_used)
 
     def __len__(self) -> int:
         """Return blob size (always 131072)."""
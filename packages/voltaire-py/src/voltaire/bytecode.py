@@ -3,11 +3,104 @@ Bytecode - EVM bytecode analysis and validation utilities.
 """
 
 import ctypes
+import functools
+import itertools
+import struct
+from array import array
 from ctypes import c_uint32, c_uint8
-
-from voltaire._ffi import c_uint8_p, get_lib
+from typing import NamedTuple, Sequence
+
+from voltaire._ffi import (
+    c_uint8_p,
+    input_ptr,
+    primitives_bytecode_analyze_jumpdests,
+    primitives_bytecode_analyze_jumpdests_batch,
+    primitives_bytecode_analyze_jumpdests_bitmap,
+    primitives_bytecode_next_pc,
+    primitives_bytecode_is_boundary,
+    primitives_bytecode_scan_soa,
+    primitives_bytecode_validate,
+)
 from voltaire.errors import InvalidHexError, check_error
 
+# Number of distinct bytecodes whose JUMPDEST analysis is kept process-wide.
+# The same contract code is typically analyzed many times (one Bytecode per
+# call frame), so repeat analyses become a dict lookup.
+ANALYSIS_CACHE_SIZE = 1024
+
+
+class _CodeAnalysis:
+    """Analysis results for one bytecode, each filled in on first use."""
+
+    __slots__ = ("jumpdests", "bitmap")
+
+    def __init__(self) -> None:
+        self.jumpdests: bytes | None = None
+        self.bitmap: bytes | None = None
+
+
+# One entry per code for both results, so at most ANALYSIS_CACHE_SIZE copies
+# of contract code are kept alive
+@functools.lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _code_analysis(code: bytes) -> _CodeAnalysis:
+    return _CodeAnalysis()
+
+
+def _analyze_jumpdests(code: bytes) -> bytes:
+    """Run native JUMPDEST analysis, returning 4-byte little-endian positions."""
+    entry = _code_analysis(code)
+    if entry.jumpdests is not None:
+        return entry.jumpdests
+
+    n = len(code)
+
+    # Allocate output buffer for JUMPDEST positions
+    # Maximum possible JUMPDESTs is len(code)
+    out_jumpdests = (c_uint32 * n)()
+
+    code_ptr, _ = input_ptr(code)
+
+    count = primitives_bytecode_analyze_jumpdests(code_ptr, n, out_jumpdests, n)
+
+    # Convert positions to bytes (4-byte little-endian each) in one pass
+    entry.jumpdests = struct.pack(f"<{count}I", *out_jumpdests[:count])
+    return entry.jumpdests
+
+
+def _jumpdest_bitmap(code: bytes) -> bytes:
+    """Build packed JUMPDEST bitmap: bit ``pc & 7`` of byte ``pc >> 3``."""
+    entry = _code_analysis(code)
+    if entry.bitmap is not None:
+        return entry.bitmap
+
+    n = len(code)
+    size = (n + 7) >> 3
+    bitmap = (c_uint8 * size)()
+
+    code_ptr, _ = input_ptr(code)
+
+    result = primitives_bytecode_analyze_jumpdests_bitmap(
+        code_ptr, n, ctypes.cast(bitmap, c_uint8_p), size
+    )
+    check_error(result, "Bytecode jumpdest analysis")
+
+    entry.bitmap = bytes(bitmap)
+    return entry.bitmap
+
+
+class Instructions(NamedTuple):
+    """
+    Decoded instruction stream in structure-of-arrays form.
+
+    Entry ``i`` of each field describes the same instruction, so
+    ``instructions.opcodes.find(0x56)`` locates the first JUMP and
+    ``instructions.pcs[i]`` gives its position.
+    """
+
+    pcs: tuple[int, ...]
+    opcodes: bytes
+    push_sizes: bytes
+
 
 class Bytecode:
     """
@@ -25,7 +118,7 @@ class Bytecode:
         True
     """
 
-    __slots__ = ("_code", "_jumpdest_bitmap")
+    __slots__ = ("_code", "_jumpdests", "_jumpdest_bitmap")
 
     def __init__(self, code: bytes) -> None:
         """
@@ -35,6 +128,7 @@ class Bytecode:
             code: Raw bytecode bytes
         """
         self._code = code
+        self._jumpdests: bytes | None = None
         self._jumpdest_bitmap: bytes | None = None
 
     @classmethod
@@ -80,37 +174,76 @@ class Bytecode:
         Returns:
             Bytes containing JUMPDEST positions
         """
-        if self._jumpdest_bitmap is not None:
-            return self._jumpdest_bitmap
+        if self._jumpdests is not None:
+            return self._jumpdests
 
         if not self._code:
-            self._jumpdest_bitmap = b""
-            return self._jumpdest_bitmap
+            self._jumpdests = b""
+            return self._jumpdests
 
-        lib = get_lib()
+        self._jumpdests = _analyze_jumpdests(bytes(self._code))
+        return self._jumpdests
 
-        # Allocate output buffer for JUMPDEST positions
-        # Maximum possible JUMPDESTs is len(code)
-        max_jumpdests = len(self._code)
-        out_jumpdests = (c_uint32 * max_jumpdests)()
+    @staticmethod
+    def clear_analysis_cache() -> None:
+        """
+        Drop the process-wide JUMPDEST analysis cache.
 
-        # Create pointer to code
-        code_array = (c_uint8 * len(self._code))(*self._code)
-        code_ptr = ctypes.cast(code_array, c_uint8_p)
+        Bytecode instances keep results they have already computed.
+        """
+        _code_analysis.cache_clear()
 
-        count = lib.primitives_bytecode_analyze_jumpdests(
-            code_ptr,
-            len(self._code),
+    @staticmethod
+    def analyze_jumpdests_batch(codes: Sequence[bytes]) -> list[bytes]:
+        """
+        Analyze JUMPDEST positions of many contracts in one native call.
+
+        Equivalent to ``[Bytecode(code).analyze_jumpdests() for code in codes]``,
+        but crosses the FFI boundary once for the whole batch. The native call
+        runs without the GIL, so large scans can be split across threads.
+
+        Args:
+            codes: Raw bytecode of each contract
+
+        Returns:
+            One bytes object of 4-byte little-endian JUMPDEST positions per
+            contract, in input order
+        """
+        count = len(codes)
+        if count == 0:
+            return []
+
+        # offsets[i]..offsets[i + 1] spans contract i within data; contract i
+        # can have at most len(codes[i]) JUMPDESTs, so the output reuses offsets
+        offsets = array("I", itertools.accumulate(map(len, codes), initial=0))
+        data = b"".join(codes)
+        data_ptr, total = input_ptr(data)
+        out_jumpdests = (c_uint32 * total)()
+        out_counts = (c_uint32 * count)()
+
+        result = primitives_bytecode_analyze_jumpdests_batch(
+            data_ptr,
+            (c_uint32 * len(offsets)).from_buffer(offsets),
+            count,
             out_jumpdests,
-            max_jumpdests,
+            out_counts,
         )
+        check_error(result, "Bytecode jumpdest analysis")
 
-        # Convert positions to bytes (4-byte little-endian each)
-        result = b""
-        for i in range(count):
-            result += out_jumpdests[i].to_bytes(4, "little")
+        return [
+            struct.pack(f"<{n}I", *out_jumpdests[start : start + n])
+            for start, n in zip(offsets, out_counts)
+        ]
+
+    def _get_jumpdest_bitmap(self) -> bytes:
+        """
+        Return packed JUMPDEST bitmap (cached), one bit per code byte.
 
-        self._jumpdest_bitmap = result
+        Bit ``pc & 7`` of byte ``pc >> 3`` is set when ``pc`` is a valid
+        JUMPDEST, giving O(1) membership checks after a single analysis pass.
+        """
+        if self._jumpdest_bitmap is None:
+            self._jumpdest_bitmap = _jumpdest_bitmap(bytes(self._code))
         return self._jumpdest_bitmap
 
     def is_boundary(self, position: int) -> bool:
@@ -132,14 +265,11 @@ class Bytecode:
         if position < 0 or position >= len(self._code):
             return False
 
-        lib = get_lib()
-
-        code_array = (c_uint8 * len(self._code))(*self._code)
-        code_ptr = ctypes.cast(code_array, c_uint8_p)
+        code_ptr, code_len = input_ptr(self._code)
 
-        return lib.primitives_bytecode_is_boundary(
+        return primitives_bytecode_is_boundary(
             code_ptr,
-            len(self._code),
+            code_len,
             position,
         )
 
@@ -162,16 +292,8 @@ class Bytecode:
         if position < 0 or position >= len(self._code):
             return False
 
-        lib = get_lib()
-
-        code_array = (c_uint8 * len(self._code))(*self._code)
-        code_ptr = ctypes.cast(code_array, c_uint8_p)
-
-        return lib.primitives_bytecode_is_valid_jumpdest(
-            code_ptr,
-            len(self._code),
-            position,
-        )
+        bitmap = self._get_jumpdest_bitmap()
+        return bool((bitmap[position >> 3] >> (position & 7)) & 1)
 
     def validate(self) -> bool:
         """
@@ -185,14 +307,11 @@ class Bytecode:
         if not self._code:
             return True  # Empty bytecode is valid
 
-        lib = get_lib()
-
-        code_array = (c_uint8 * len(self._code))(*self._code)
-        code_ptr = ctypes.cast(code_array, c_uint8_p)
+        code_ptr, code_len = input_ptr(self._code)
 
-        result = lib.primitives_bytecode_validate(
+        result = primitives_bytecode_validate(
             code_ptr,
-            len(self._code),
+            code_len,
         )
 
         # 0 = success (valid), negative = error (invalid)
@@ -216,18 +335,60 @@ class Bytecode:
         if current_pc < 0:
             return -1
 
-        lib = get_lib()
+        code_ptr, code_len = input_ptr(self._code)
 
-        code_array = (c_uint8 * len(self._code))(*self._code)
-        code_ptr = ctypes.cast(code_array, c_uint8_p)
-
-        result = lib.primitives_bytecode_get_next_pc(
+        next_pc = c_uint32()
+        if primitives_bytecode_next_pc(
             code_ptr,
-            len(self._code),
+            code_len,
             current_pc,
+            ctypes.byref(next_pc),
+        ):
+            return -1
+
+        return next_pc.value
+
+    def scan(self, start_pc: int = 0, end_pc: int | None = None) -> Instructions:
+        """
+        Decode instructions in ``[start_pc, end_pc)``, skipping PUSH data.
+
+        Args:
+            start_pc: First position to decode (must be an instruction boundary)
+            end_pc: Stop before this position (default: end of code)
+
+        Returns:
+            Instructions with parallel pcs, opcodes and push_sizes
+        """
+        n = len(self._code)
+        if end_pc is None or end_pc > n:
+            end_pc = n
+        if start_pc < 0 or start_pc >= end_pc:
+            return Instructions((), b"", b"")
+
+        code_ptr, _ = input_ptr(self._code)
+
+        max_instructions = end_pc - start_pc
+        out_pcs = (c_uint32 * max_instructions)()
+        out_opcodes = (c_uint8 * max_instructions)()
+        out_push_sizes = (c_uint8 * max_instructions)()
+
+        count = primitives_bytecode_scan_soa(
+            code_ptr,
+            n,
+            start_pc,
+            end_pc,
+            out_pcs,
+            out_opcodes,
+            out_push_sizes,
+            max_instructions,
         )
+        check_error(count, "Bytecode.scan")
 
-        return result
+        return Instructions(
+            tuple(out_pcs[:count]),
+            ctypes.string_at(out_opcodes, count),
+            ctypes.string_at(out_push_sizes, count),
+        )
 
     def to_bytes(self) -> bytes:
         """
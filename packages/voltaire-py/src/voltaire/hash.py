@@ -7,12 +7,41 @@ Provides Keccak-256, SHA-256, and EIP-191 message hashing.
 from __future__ import annotations
 
 import ctypes
-from ctypes import POINTER, c_uint8
-
-from voltaire._ffi import PrimitivesHash, get_lib
+import hmac
+import itertools
+from array import array
+from ctypes import c_uint8, c_uint32
+from typing import Iterable
+
+from voltaire._ffi import (
+    HASH_HEX_LEN,
+    PrimitivesHash,
+    primitives_blake2b,
+    primitives_eip191_hash_message,
+    primitives_hash_from_hex,
+    primitives_hash_to_hex,
+    primitives_keccak256,
+    primitives_keccak256_32,
+    primitives_keccak256_64,
+    primitives_keccak256_batch,
+    primitives_ripemd160,
+    primitives_sha256,
+    scratch_bytes32,
+    scratch_hash,
+    scratch_hex67,
+)
 from voltaire.errors import InvalidHexError, InvalidLengthError, check_error
 
 
+def _to_bytes(data: bytes | str) -> bytes:
+    """Coerce hash input to bytes (str is UTF-8 encoded)."""
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    if isinstance(data, bytes):
+        return data
+    return bytes(data)
+
+
 class Hash:
     """
     32-byte cryptographic hash value.
@@ -44,13 +73,12 @@ class Hash:
         Raises:
             InvalidHexError: If hex string is invalid.
         """
-        lib = get_lib()
-        out_hash = PrimitivesHash()
+        out_hash, out_ptr = scratch_hash()
 
         # Encode to bytes for C API
         hex_bytes = hex_str.encode("ascii")
 
-        code = lib.primitives_hash_from_hex(hex_bytes, ctypes.byref(out_hash))
+        code = primitives_hash_from_hex(hex_bytes, out_ptr)
         if code < 0:
             raise InvalidHexError(f"Invalid hex string: {hex_str}")
 
@@ -81,20 +109,17 @@ class Hash:
         Returns:
             66-character hex string (0x + 64 hex chars).
         """
-        lib = get_lib()
-
         # Create C struct from our bytes
-        c_hash = PrimitivesHash()
-        for i, b in enumerate(self._data):
-            c_hash.bytes[i] = b
+        c_hash, c_hash_ptr = scratch_hash()
+        c_hash.bytes[:] = self._data
 
         # Buffer for hex output (66 bytes: 0x + 64 chars + null)
-        buf = ctypes.create_string_buffer(67)
+        buf = scratch_hex67()
 
-        code = lib.primitives_hash_to_hex(ctypes.byref(c_hash), buf)
+        code = primitives_hash_to_hex(c_hash_ptr, buf)
         check_error(code, "hash_to_hex")
 
-        return buf.value[:66].decode("ascii")
+        return buf.raw[:HASH_HEX_LEN].decode("ascii")
 
     def to_bytes(self) -> bytes:
         """
@@ -114,16 +139,9 @@ class Hash:
         if not isinstance(other, Hash):
             return False
 
-        lib = get_lib()
-
-        # Create C structs
-        a = PrimitivesHash()
-        b = PrimitivesHash()
-        for i in range(32):
-            a.bytes[i] = self._data[i]
-            b.bytes[i] = other._data[i]
-
-        return lib.primitives_hash_equals(ctypes.byref(a), ctypes.byref(b))
+        # compare_digest is constant-time and runs in C, so there is no need
+        # to cross into the native library for a 32-byte comparison
+        return hmac.compare_digest(self._data, other._data)
 
     def __hash__(self) -> int:
         """Hash for use in sets and dicts."""
@@ -147,26 +165,56 @@ def keccak256(data: bytes | str) -> Hash:
     Returns:
         32-byte Hash.
     """
-    if isinstance(data, str):
-        data = data.encode("utf-8")
+    data = _to_bytes(data)
+    out_hash, out_ptr = scratch_hash()
 
-    lib = get_lib()
-    out_hash = PrimitivesHash()
-
-    # Convert bytes to ctypes array
+    # 32/64-byte inputs (storage keys, hash pairs) use fixed-size entry points
     data_len = len(data)
-    if data_len > 0:
-        data_array = (c_uint8 * data_len).from_buffer_copy(data)
-        data_ptr = ctypes.cast(data_array, POINTER(c_uint8))
+    if data_len == 32:
+        code = primitives_keccak256_32(data, out_ptr)
+    elif data_len == 64:
+        code = primitives_keccak256_64(data, out_ptr)
     else:
-        data_ptr = ctypes.cast(ctypes.c_char_p(b""), POINTER(c_uint8))
-
-    code = lib.primitives_keccak256(data_ptr, data_len, ctypes.byref(out_hash))
+        code = primitives_keccak256(data, data_len, out_ptr)
     check_error(code, "keccak256")
 
     return Hash(bytes(out_hash.bytes))
 
 
+def keccak256_batch(items: Iterable[bytes | str]) -> list[Hash]:
+    """
+    Compute Keccak-256 of many inputs in a single native call.
+
+    Equivalent to ``[keccak256(item) for item in items]``, but crosses the
+    FFI boundary once for the whole batch instead of once per item.
+
+    Args:
+        items: Input bytes or strings (UTF-8 encoded).
+
+    Returns:
+        List of 32-byte Hashes, in input order.
+    """
+    datas = [_to_bytes(item) for item in items]
+    count = len(datas)
+    if count == 0:
+        return []
+
+    # One contiguous buffer plus offsets: building these is a couple of C-level
+    # loops, where a per-item pointer array costs a ctypes conversion per item.
+    # offsets[i]..offsets[i + 1] spans item i within data.
+    data = b"".join(datas)
+    offsets = array("I", itertools.accumulate(map(len, datas), initial=0))
+    out_hashes = (PrimitivesHash * count)()
+
+    code = primitives_keccak256_batch(
+        data, (c_uint32 * len(offsets)).from_buffer(offsets), count, out_hashes
+    )
+    check_error(code, "keccak256_batch")
+
+    raw = bytes(out_hashes)
+    return [Hash(raw[offset : offset + 32]) for offset in range(0, 32 * count, 32)]
+
+
 def sha256(data: bytes | str) -> Hash:
     """
     Compute SHA-256 hash.
@@ -177,21 +225,10 @@ def sha256(data: bytes | str) -> Hash:
     Returns:
         32-byte Hash.
     """
-    if isinstance(data, str):
-        data = data.encode("utf-8")
-
-    lib = get_lib()
-    out_hash = (c_uint8 * 32)()
-
-    # Convert bytes to ctypes array
-    data_len = len(data)
-    if data_len > 0:
-        data_array = (c_uint8 * data_len).from_buffer_copy(data)
-        data_ptr = ctypes.cast(data_array, POINTER(c_uint8))
-    else:
-        data_ptr = ctypes.cast(ctypes.c_char_p(b""), POINTER(c_uint8))
+    data = _to_bytes(data)
+    out_hash, out_ptr = scratch_bytes32()
 
-    code = lib.primitives_sha256(data_ptr, data_len, ctypes.byref(out_hash))
+    code = primitives_sha256(data, len(data), out_ptr)
     check_error(code, "sha256")
 
     return Hash(bytes(out_hash))
@@ -210,21 +247,10 @@ def eip191_hash_message(message: bytes | str) -> Hash:
     Returns:
         32-byte Hash suitable for signing.
     """
-    if isinstance(message, str):
-        message = message.encode("utf-8")
-
-    lib = get_lib()
-    out_hash = PrimitivesHash()
-
-    # Convert bytes to ctypes array
-    msg_len = len(message)
-    if msg_len > 0:
-        msg_array = (c_uint8 * msg_len).from_buffer_copy(message)
-        msg_ptr = ctypes.cast(msg_array, POINTER(c_uint8))
-    else:
-        msg_ptr = ctypes.cast(ctypes.c_char_p(b""), POINTER(c_uint8))
+    message = _to_bytes(message)
+    out_hash, out_ptr = scratch_hash()
 
-    code = lib.primitives_eip191_hash_message(msg_ptr, msg_len, ctypes.byref(out_hash))
+    code = primitives_eip191_hash_message(message, len(message), out_ptr)
     check_error(code, "eip191_hash_message")
 
     return Hash(bytes(out_hash.bytes))
@@ -246,21 +272,10 @@ def blake2b(data: bytes | str) -> bytes:
     Returns:
         64-byte hash.
     """
-    if isinstance(data, str):
-        data = data.encode("utf-8")
-
-    lib = get_lib()
+    data = _to_bytes(data)
     out_hash = (c_uint8 * 64)()
 
-    # Convert bytes to ctypes array
-    data_len = len(data)
-    if data_len > 0:
-        data_array = (c_uint8 * data_len).from_buffer_copy(data)
-        data_ptr = ctypes.cast(data_array, POINTER(c_uint8))
-    else:
-        data_ptr = ctypes.cast(ctypes.c_char_p(b""), POINTER(c_uint8))
-
-    code = lib.primitives_blake2b(data_ptr, data_len, ctypes.byref(out_hash))
+    code = primitives_blake2b(data, len(data), ctypes.byref(out_hash))
     check_error(code, "blake2b")
 
     return bytes(out_hash)
@@ -279,21 +294,10 @@ def ripemd160(data: bytes | str) -> bytes:
     Returns:
         20-byte hash.
     """
-    if isinstance(data, str):
-        data = data.encode("utf-8")
-
-    lib = get_lib()
+    data = _to_bytes(data)
     out_hash = (c_uint8 * 20)()
 
-    # Convert bytes to ctypes array
-    data_len = len(data)
-    if data_len > 0:
-        data_array = (c_uint8 * data_len).from_buffer_copy(data)
-        data_ptr = ctypes.cast(data_array, POINTER(c_uint8))
-    else:
-        data_ptr = ctypes.cast(ctypes.c_char_p(b""), POINTER(c_uint8))
-
-    code = lib.primitives_ripemd160(data_ptr, data_len, ctypes.byref(out_hash))
+    code = primitives_ripemd160(data, len(data), ctypes.byref(out_hash))
     check_error(code, "ripemd160")
 
     return bytes(out_hash)
@@ -5,11 +5,28 @@ Provides efficient hex string encoding/decoding using Voltaire's native C implem
 """
 
 import ctypes
-from ctypes import c_char_p, c_size_t, create_string_buffer
-
-from voltaire._ffi import get_lib, c_uint8_p
+from ctypes import c_char, c_char_p, c_size_t
+
+from voltaire._ffi import (
+    c_uint8_p,
+    has_function,
+    primitives_bytes_to_hex,
+    primitives_hex_to_bytes,
+    primitives_hex_to_bytes_fast,
+)
 from voltaire.errors import check_error, InvalidHexError, InvalidLengthError
 
+# Inputs with at least this many hex digits are decoded 16 characters at a
+# time by primitives_hex_to_bytes_fast; shorter ones use the scalar path.
+FAST_DECODE_MIN_CHARS = 32
+
+# Libraries built before the vectorized decoder existed only have the scalar one
+_decode_long = (
+    primitives_hex_to_bytes_fast
+    if has_function("primitives_hex_to_bytes_fast")
+    else primitives_hex_to_bytes
+)
+
 
 class Hex:
     """Hex encoding/decoding utilities."""
@@ -32,17 +49,15 @@ class Hex:
         if len(data) == 0:
             return "0x"
 
-        lib = get_lib()
-
         # Output buffer: "0x" + 2 chars per byte + null terminator
         out_len = 2 + len(data) * 2 + 1
-        out_buf = create_string_buffer(out_len)
+        out_buf = (c_char * out_len)()
 
         # Convert bytes to c_uint8 array
         data_arr = (ctypes.c_uint8 * len(data))(*data)
         data_ptr = ctypes.cast(data_arr, c_uint8_p)
 
-        result = lib.primitives_bytes_to_hex(
+        result = primitives_bytes_to_hex(
             data_ptr,
             c_size_t(len(data)),
             out_buf,
@@ -51,7 +66,7 @@ class Hex:
 
         check_error(result, "Hex.encode")
 
-        return out_buf.value.decode("ascii")
+        return out_buf.raw[:result].decode("ascii")
 
     @staticmethod
     def decode(hex_str: str) -> bytes:
@@ -77,7 +92,7 @@ class Hex:
             return b""
 
         # Normalize: ensure 0x prefix (C API requires it)
-        if hex_str.startswith("0x") or hex_str.startswith("0X"):
+        if hex_str.startswith(("0x", "0X")):
             normalized = "0x" + hex_str[2:]  # Normalize to lowercase prefix
         else:
             normalized = "0x" + hex_str
@@ -90,8 +105,6 @@ class Hex:
         if len(hex_digits) == 0:
             return b""
 
-        lib = get_lib()
-
         # Output buffer: 1 byte per 2 hex chars
         out_len = len(hex_digits) // 2
         out_buf = (ctypes.c_uint8 * out_len)()
@@ -100,7 +113,13 @@ class Hex:
         # Pass hex string (with 0x prefix) as null-terminated
         hex_bytes = normalized.encode("ascii")
 
-        result = lib.primitives_hex_to_bytes(
+        # Vectorized decoder for anything address-sized or larger
+        decode = (
+            _decode_long
+            if len(hex_digits) >= FAST_DECODE_MIN_CHARS
+            else primitives_hex_to_bytes
+        )
+        result = decode(
             c_char_p(hex_bytes),
             out_ptr,
             c_size_t(out_len),
@@ -6,10 +6,26 @@ Provides canonical serialization of bytes, integers, and nested lists.
 
 from __future__ import annotations
 
-from ctypes import c_char_p, c_int, c_size_t, c_uint8, create_string_buffer
+from ctypes import (
+    byref,
+    c_char,
+    c_char_p,
+    c_int,
+    c_size_t,
+    c_uint8,
+    c_void_p,
+    create_string_buffer,
+    string_at,
+)
 from typing import Union
 
-from voltaire._ffi import c_uint8_array_32, get_lib
+from voltaire._ffi import (
+    c_uint8_array_32,
+    primitives_rlp_encode_bytes_borrow,
+    primitives_rlp_encode_uint,
+    primitives_rlp_from_hex,
+    primitives_rlp_to_hex,
+)
 from voltaire.errors import check_error, InvalidHexError
 
 # Type alias for encodable items
@@ -36,25 +52,20 @@ class Rlp:
             >>> Rlp.encode_bytes(b"")
             b'\\x80'
         """
-        lib = get_lib()
-
-        # Output buffer: worst case is prefix + length bytes + data
-        # For data up to 2^64, we need at most 9 bytes of header
-        buf_size = len(data) + 9
-        out_buf = create_string_buffer(buf_size)
-
-        # Convert bytes to ctypes array
-        data_array = (c_uint8 * len(data))(*data)
-
-        result = lib.primitives_rlp_encode_bytes(
-            data_array,
-            c_size_t(len(data)),
-            out_buf,
-            c_size_t(buf_size),
+        # The encoding is written into a library-owned thread-local buffer;
+        # string_at copies it out exactly once.
+        out_ptr = c_void_p()
+        out_len = c_size_t()
+
+        result = primitives_rlp_encode_bytes_borrow(
+            bytes(data),
+            len(data),
+            byref(out_ptr),
+            byref(out_len),
         )
         check_error(result, "RLP encode bytes")
 
-        return out_buf.raw[:result]
+        return string_at(out_ptr, out_len.value)
 
     @staticmethod
     def encode_uint(value: int) -> bytes:
@@ -79,8 +90,6 @@ class Rlp:
         if value < 0:
             raise ValueError("RLP cannot encode negative integers")
 
-        lib = get_lib()
-
         # Convert integer to 32-byte big-endian
         value_bytes = value.to_bytes(32, byteorder="big")
         value_array = c_uint8_array_32(*value_bytes)
@@ -89,7 +98,7 @@ class Rlp:
         buf_size = 33
         out_buf = create_string_buffer(buf_size)
 
-        result = lib.primitives_rlp_encode_uint(
+        result = primitives_rlp_encode_uint(
             value_array,
             out_buf,
             c_size_t(buf_size),
@@ -173,15 +182,13 @@ class Rlp:
             >>> Rlp.to_hex(b"\\x83dog")
             '0x83646f67'
         """
-        lib = get_lib()
-
         # Output: 2 (0x) + 2*len + 1 (null)
         buf_size = 2 + 2 * len(rlp_data) + 1
-        out_buf = create_string_buffer(buf_size)
+        out_buf = (c_char * buf_size)()
 
         data_array = (c_uint8 * len(rlp_data))(*rlp_data)
 
-        result = lib.primitives_rlp_to_hex(
+        result = primitives_rlp_to_hex(
             data_array,
             c_size_t(len(rlp_data)),
             out_buf,
@@ -189,7 +196,7 @@ class Rlp:
         )
         check_error(result, "RLP to hex")
 
-        return out_buf.value.decode("ascii")
+        return out_buf.raw[:result].decode("ascii")
 
     @staticmethod
     def from_hex(hex_str: str) -> bytes:
@@ -209,10 +216,8 @@ class Rlp:
             >>> Rlp.from_hex("0x83646f67")
             b'\\x83dog'
         """
-        lib = get_lib()
-
         # Normalize: ensure 0x prefix for C API
-        if not hex_str.startswith("0x") and not hex_str.startswith("0X"):
+        if not hex_str.startswith(("0x", "0X")):
             hex_str = "0x" + hex_str
 
         # Output buffer: (len - 2) / 2 bytes
@@ -220,7 +225,7 @@ class Rlp:
         buf_size = (hex_len - 2) // 2 + 1
         out_buf = create_string_buffer(buf_size)
 
-        result = lib.primitives_rlp_from_hex(
+        result = primitives_rlp_from_hex(
             hex_str.encode("ascii"),
             out_buf,
             c_size_t(buf_size),
@@ -1,15 +1,26 @@
 """
 Secp256k1 - secp256k1 elliptic curve operations for Ethereum.
 
-Provides public key recovery, address derivation, and signature validation.
+Provides public key recovery, address derivation, signature verification,
+and signature validation.
 """
 
 import ctypes
-from ctypes import POINTER, c_bool, c_uint8
+from ctypes import c_uint8
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
-
-from voltaire._ffi import PrimitivesAddress, get_lib
+from typing import TYPE_CHECKING, Sequence
+
+from voltaire._ffi import (
+    PrimitivesAddress,
+    primitives_compress_public_key,
+    primitives_generate_private_key,
+    primitives_secp256k1_pubkey_from_private,
+    primitives_secp256k1_recover_address,
+    primitives_secp256k1_recover_address_batch,
+    primitives_secp256k1_recover_pubkey,
+    primitives_secp256k1_validate_signature,
+    primitives_secp256k1_verify,
+)
 from voltaire.errors import (
     InvalidInputError,
     InvalidLengthError,
@@ -37,33 +48,11 @@ class Signature:
     v: int
 
 
-# Track if FFI functions are set up
-_functions_setup = False
-
-
-def _setup_secp256k1_functions(lib) -> None:
-    """Define C function signatures for secp256k1 operations."""
-    c_uint8_array_32 = c_uint8 * 32
-    c_uint8_array_64 = c_uint8 * 64
-
-    # validate_signature is already set up in _ffi.py, but we need it here too
-    # Check if it exists, if not set it up
-    if not hasattr(lib, "_secp256k1_validate_setup"):
-        lib.primitives_secp256k1_validate_signature.argtypes = [
-            POINTER(c_uint8_array_32),
-            POINTER(c_uint8_array_32),
-        ]
-        lib.primitives_secp256k1_validate_signature.restype = c_bool
-        lib._secp256k1_validate_setup = True
-
-
-def _ensure_functions_setup():
-    """Ensure FFI function signatures are defined."""
-    global _functions_setup
-    if not _functions_setup:
-        lib = get_lib()
-        _setup_secp256k1_functions(lib)
-        _functions_setup = True
+# Last (message_hash, r, s, v) seen by recover_address and the raw address
+# it recovered. Duplicate signatures within a block (multicall, same-sender
+# bursts) then skip the native recovery entirely. The key holds bytes copies
+# so a caller mutating a bytearray-backed Signature cannot match a stale entry.
+_last_recovery: tuple[tuple[bytes, bytes, bytes, int], bytes] | None = None
 
 
 class Secp256k1:
@@ -110,8 +99,6 @@ class Secp256k1:
                 f"signature.v must be 0, 1, 27, or 28, got {v}"
             )
 
-        lib = get_lib()
-
         c_uint8_array_32 = c_uint8 * 32
         c_uint8_array_64 = c_uint8 * 64
 
@@ -120,7 +107,7 @@ class Secp256k1:
         s_arr = c_uint8_array_32(*signature.s)
         out_pubkey = c_uint8_array_64()
 
-        result = lib.primitives_secp256k1_recover_pubkey(
+        result = primitives_secp256k1_recover_pubkey(
             ctypes.byref(msg_hash_arr),
             ctypes.byref(r_arr),
             ctypes.byref(s_arr),
@@ -174,7 +161,12 @@ class Secp256k1:
                 f"signature.v must be 0, 1, 27, or 28, got {v}"
             )
 
-        lib = get_lib()
+        global _last_recovery
+        message_hash = bytes(message_hash)
+        key = (message_hash, bytes(signature.r), bytes(signature.s), v)
+        last = _last_recovery
+        if last is not None and last[0] == key:
+            return Address(PrimitivesAddress.from_buffer_copy(last[1]))
 
         c_uint8_array_32 = c_uint8 * 32
 
@@ -183,7 +175,7 @@ class Secp256k1:
         s_arr = c_uint8_array_32(*signature.s)
         out_address = PrimitivesAddress()
 
-        result = lib.primitives_secp256k1_recover_address(
+        result = primitives_secp256k1_recover_address(
             ctypes.byref(msg_hash_arr),
             ctypes.byref(r_arr),
             ctypes.byref(s_arr),
@@ -196,8 +188,87 @@ class Secp256k1:
                 f"Failed to recover address (error code: {result})"
             )
 
+        _last_recovery = (key, bytes(out_address))
         return Address(out_address)
 
+    @staticmethod
+    def recover_address_batch(
+        message_hashes: Sequence[bytes], signatures: Sequence[Signature]
+    ) -> list["Address"]:
+        """
+        Recover signer addresses for many signatures in one native call.
+
+        Equivalent to calling recover_address() pairwise, but crosses the FFI
+        boundary once for the whole batch.
+
+        Args:
+            message_hashes: 32-byte message hashes that were signed
+            signatures: Signatures with r, s, v components, one per hash
+
+        Returns:
+            Addresses of the signers, in input order
+
+        Raises:
+            InvalidInputError: If the two sequences differ in length
+            InvalidLengthError: If any message_hash, r, or s is not 32 bytes
+            InvalidSignatureError: If any signature is invalid or recovery fails
+        """
+        # Import here to avoid circular imports
+        from voltaire.address import Address
+
+        count = len(message_hashes)
+        if len(signatures) != count:
+            raise InvalidInputError(
+                f"Got {count} message hashes but {len(signatures)} signatures"
+            )
+        if count == 0:
+            return []
+
+        for i, (message_hash, signature) in enumerate(zip(message_hashes, signatures)):
+            if len(message_hash) != 32:
+                raise InvalidLengthError(
+                    f"message_hashes[{i}] must be 32 bytes, got {len(message_hash)}"
+                )
+            if len(signature.r) != 32 or len(signature.s) != 32:
+                raise InvalidLengthError(
+                    f"signatures[{i}] r and s must be 32 bytes each"
+                )
+            if signature.v not in (0, 1, 27, 28):
+                raise InvalidSignatureError(
+                    f"signatures[{i}].v must be 0, 1, 27, or 28, got {signature.v}"
+                )
+
+        c_uint8_array_32_n = (c_uint8 * 32) * count
+
+        hashes_arr = c_uint8_array_32_n.from_buffer_copy(b"".join(message_hashes))
+        rs_arr = c_uint8_array_32_n.from_buffer_copy(b"".join(sig.r for sig in signatures))
+        ss_arr = c_uint8_array_32_n.from_buffer_copy(b"".join(sig.s for sig in signatures))
+        vs_arr = (c_uint8 * count)(*(sig.v for sig in signatures))
+        out_addresses = (PrimitivesAddress * count)()
+        failed_index = ctypes.c_size_t()
+
+        result = primitives_secp256k1_recover_address_batch(
+            hashes_arr,
+            rs_arr,
+            ss_arr,
+            vs_arr,
+            count,
+            out_addresses,
+            ctypes.byref(failed_index),
+        )
+
+        if result != 0:
+            raise InvalidSignatureError(
+                f"Failed to recover address for signatures[{failed_index.value}] "
+                f"(error code: {result})"
+            )
+
+        raw = bytes(out_addresses)
+        return [
+            Address(PrimitivesAddress.from_buffer_copy(raw, offset))
+            for offset in range(0, 20 * count, 20)
+        ]
+
     @staticmethod
     def public_key_from_private(private_key: bytes) -> bytes:
         """
@@ -218,15 +289,13 @@ class Secp256k1:
                 f"private_key must be 32 bytes, got {len(private_key)}"
             )
 
-        lib = get_lib()
-
         c_uint8_array_32 = c_uint8 * 32
         c_uint8_array_64 = c_uint8 * 64
 
         privkey_arr = c_uint8_array_32(*private_key)
         out_pubkey = c_uint8_array_64()
 
-        result = lib.primitives_secp256k1_pubkey_from_private(
+        result = primitives_secp256k1_pubkey_from_private(
             ctypes.byref(privkey_arr),
             ctypes.byref(out_pubkey),
         )
@@ -260,18 +329,73 @@ class Secp256k1:
         if len(s) != 32:
             raise InvalidLengthError(f"s must be 32 bytes, got {len(s)}")
 
-        _ensure_functions_setup()
-        lib = get_lib()
-
         c_uint8_array_32 = c_uint8 * 32
 
         r_arr = c_uint8_array_32(*r)
         s_arr = c_uint8_array_32(*s)
 
         return bool(
-            lib.primitives_secp256k1_validate_signature(
+            primitives_secp256k1_validate_signature(
+                ctypes.byref(r_arr),
+                ctypes.byref(s_arr),
+            )
+        )
+
+    @staticmethod
+    def verify(message_hash: bytes, signature: Signature, public_key: bytes) -> bool:
+        """
+        Verify an ECDSA signature against a known public key.
+
+        Prefer this over recover_address() plus a comparison when the signer's
+        public key is already known: verification skips the point
+        decompression that recovery needs. The recovery id (signature.v) is
+        not used.
+
+        Args:
+            message_hash: 32-byte message hash that was signed
+            signature: Signature with r, s components
+            public_key: 64-byte uncompressed public key (x || y)
+
+        Returns:
+            True if the signature is valid for the message and key; False if
+            it is not, if s is in the upper half of the curve order, or if
+            the key is not on the curve
+
+        Raises:
+            InvalidLengthError: If message_hash, r, s, or public_key has the
+                wrong length
+        """
+        if len(message_hash) != 32:
+            raise InvalidLengthError(
+                f"message_hash must be 32 bytes, got {len(message_hash)}"
+            )
+        if len(signature.r) != 32:
+            raise InvalidLengthError(
+                f"signature.r must be 32 bytes, got {len(signature.r)}"
+            )
+        if len(signature.s) != 32:
+            raise InvalidLengthError(
+                f"signature.s must be 32 bytes, got {len(signature.s)}"
+            )
+        if len(public_key) != 64:
+            raise InvalidLengthError(
+                f"public_key must be 64 bytes, got {len(public_key)}"
+            )
+
+        c_uint8_array_32 = c_uint8 * 32
+        c_uint8_array_64 = c_uint8 * 64
+
+        msg_hash_arr = c_uint8_array_32.from_buffer_copy(message_hash)
+        r_arr = c_uint8_array_32.from_buffer_copy(signature.r)
+        s_arr = c_uint8_array_32.from_buffer_copy(signature.s)
+        pubkey_arr = c_uint8_array_64.from_buffer_copy(public_key)
+
+        return bool(
+            primitives_secp256k1_verify(
+                ctypes.byref(msg_hash_arr),
                 ctypes.byref(r_arr),
                 ctypes.byref(s_arr),
+                ctypes.byref(pubkey_arr),
             )
         )
 
@@ -288,12 +412,10 @@ class Secp256k1:
             - Key is guaranteed to be in valid range (1 to N-1)
             - Never returns zero or values >= curve order
         """
-        lib = get_lib()
-
         c_uint8_array_32 = c_uint8 * 32
         out_key = c_uint8_array_32()
 
-        result = lib.primitives_generate_private_key(ctypes.byref(out_key))
+        result = primitives_generate_private_key(ctypes.byref(out_key))
 
         if result != 0:
             raise InvalidInputError(
@@ -326,15 +448,13 @@ class Secp256k1:
                 f"uncompressed public key must be 64 bytes, got {len(uncompressed)}"
             )
 
-        lib = get_lib()
-
         c_uint8_array_64 = c_uint8 * 64
         c_uint8_array_33 = c_uint8 * 33
 
         in_arr = c_uint8_array_64(*uncompressed)
         out_compressed = c_uint8_array_33()
 
-        result = lib.primitives_compress_public_key(
+        result = primitives_compress_public_key(
             ctypes.byref(in_arr),
             ctypes.byref(out_compressed),
         )
@@ -4,11 +4,16 @@ Signature utilities for ECDSA secp256k1 signatures.
 Provides normalization, validation, parsing, and serialization of signatures.
 """
 
-from ctypes import POINTER, c_bool, c_int, c_size_t, c_uint8
+from ctypes import c_uint8
 from dataclasses import dataclass
 from typing import Optional
 
-from voltaire._ffi import get_lib
+from voltaire._ffi import (
+    primitives_signature_is_canonical,
+    primitives_signature_normalize,
+    primitives_signature_parse,
+    primitives_signature_serialize,
+)
 from voltaire.errors import InvalidLengthError
 
 
@@ -28,55 +33,6 @@ class SignatureComponents:
     v: int
 
 
-def _setup_signature_functions(lib) -> None:
-    """Define C function signatures for signature utilities."""
-    c_uint8_array_32 = c_uint8 * 32
-    c_uint8_p = POINTER(c_uint8)
-
-    lib.primitives_signature_normalize.argtypes = [
-        POINTER(c_uint8_array_32),  # r
-        POINTER(c_uint8_array_32),  # s
-    ]
-    lib.primitives_signature_normalize.restype = c_bool
-
-    lib.primitives_signature_is_canonical.argtypes = [
-        POINTER(c_uint8_array_32),  # r
-        POINTER(c_uint8_array_32),  # s
-    ]
-    lib.primitives_signature_is_canonical.restype = c_bool
-
-    lib.primitives_signature_parse.argtypes = [
-        c_uint8_p,  # sig_data
-        c_size_t,  # sig_len
-        POINTER(c_uint8_array_32),  # out_r
-        POINTER(c_uint8_array_32),  # out_s
-        POINTER(c_uint8),  # out_v
-    ]
-    lib.primitives_signature_parse.restype = c_int
-
-    lib.primitives_signature_serialize.argtypes = [
-        POINTER(c_uint8_array_32),  # r
-        POINTER(c_uint8_array_32),  # s
-        c_uint8,  # v
-        c_bool,  # include_v
-        c_uint8_p,  # out_buf
-    ]
-    lib.primitives_signature_serialize.restype = c_int
-
-
-# Track if functions are set up
-_functions_setup = False
-
-
-def _ensure_functions_setup():
-    """Ensure FFI function signatures are defined."""
-    global _functions_setup
-    if not _functions_setup:
-        lib = get_lib()
-        _setup_signature_functions(lib)
-        _functions_setup = True
-
-
 class SignatureUtils:
     """
     Signature manipulation utilities for ECDSA secp256k1.
@@ -109,16 +65,13 @@ class SignatureUtils:
         if len(s) != 32:
             raise InvalidLengthError(f"s must be 32 bytes, got {len(s)}")
 
-        _ensure_functions_setup()
-        lib = get_lib()
-
         c_uint8_array_32 = c_uint8 * 32
 
         # Create mutable copies
         r_arr = c_uint8_array_32(*r)
         s_arr = c_uint8_array_32(*s)
 
-        was_normalized = lib.primitives_signature_normalize(r_arr, s_arr)
+        was_normalized = primitives_signature_normalize(r_arr, s_arr)
 
         return bytes(r_arr), bytes(s_arr), bool(was_normalized)
 
@@ -146,15 +99,12 @@ class SignatureUtils:
         if len(s) != 32:
             raise InvalidLengthError(f"s must be 32 bytes, got {len(s)}")
 
-        _ensure_functions_setup()
-        lib = get_lib()
-
         c_uint8_array_32 = c_uint8 * 32
 
         r_arr = c_uint8_array_32(*r)
         s_arr = c_uint8_array_32(*s)
 
-        return bool(lib.primitives_signature_is_canonical(r_arr, s_arr))
+        return bool(primitives_signature_is_canonical(r_arr, s_arr))
 
     @staticmethod
     def parse(signature: bytes) -> SignatureComponents:
@@ -179,9 +129,6 @@ class SignatureUtils:
                 f"Signature must be 64 or 65 bytes, got {len(signature)}"
             )
 
-        _ensure_functions_setup()
-        lib = get_lib()
-
         c_uint8_array_32 = c_uint8 * 32
 
         out_r = c_uint8_array_32()
@@ -190,7 +137,7 @@ class SignatureUtils:
 
         sig_arr = (c_uint8 * len(signature))(*signature)
 
-        result = lib.primitives_signature_parse(
+        result = primitives_signature_parse(
             sig_arr, len(signature), out_r, out_s, out_v
         )
 
@@ -227,9 +174,6 @@ class SignatureUtils:
         if len(s) != 32:
             raise InvalidLengthError(f"s must be 32 bytes, got {len(s)}")
 
-        _ensure_functions_setup()
-        lib = get_lib()
-
         c_uint8_array_32 = c_uint8 * 32
 
         r_arr = c_uint8_array_32(*r)
@@ -241,6 +185,6 @@ class SignatureUtils:
         out_len = 65 if include_v else 64
         out_buf = (c_uint8 * out_len)()
 
-        lib.primitives_signature_serialize(r_arr, s_arr, v_byte, include_v, out_buf)
+        primitives_signature_serialize(r_arr, s_arr, v_byte, include_v, out_buf)
 
         return bytes(out_buf)
@@ -10,12 +10,18 @@ Provides:
 from __future__ import annotations
 
 import ctypes
-from ctypes import POINTER, c_size_t, c_uint8
+from ctypes import c_size_t, c_uint8
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import TYPE_CHECKING, Union
 
-from voltaire._ffi import PrimitivesAddress, get_lib
+from voltaire._ffi import (
+    PrimitivesAddress,
+    input_ptr,
+    primitives_calculate_create2_address,
+    primitives_calculate_create_address,
+    primitives_tx_detect_type,
+)
 from voltaire.errors import InvalidInputError, InvalidLengthError, check_error
 
 if TYPE_CHECKING:
@@ -477,13 +483,9 @@ class Transaction:
         if not data:
             raise InvalidInputError("Transaction.detect_type: data cannot be empty")
 
-        lib = get_lib()
+        data_ptr, data_len = input_ptr(data)
 
-        # Convert bytes to ctypes array
-        data_array = (c_uint8 * len(data)).from_buffer_copy(data)
-        data_ptr = ctypes.cast(data_array, POINTER(c_uint8))
-
-        result = lib.primitives_tx_detect_type(data_ptr, c_size_t(len(data)))
+        result = primitives_tx_detect_type(data_ptr, c_size_t(data_len))
 
         # Result is type value (0-4) or negative error
         if result < 0:
@@ -508,10 +510,9 @@ class Transaction:
         # Import here to avoid circular import
         from voltaire.address import Address as AddressClass
 
-        lib = get_lib()
         out_address = PrimitivesAddress()
 
-        result = lib.primitives_calculate_create_address(
+        result = primitives_calculate_create_address(
             ctypes.byref(sender._data),
             nonce,
             ctypes.byref(out_address),
@@ -550,23 +551,13 @@ class Transaction:
                 f"Transaction.calculate_create2_address: salt must be 32 bytes, got {len(salt)}"
             )
 
-        lib = get_lib()
         out_address = PrimitivesAddress()
 
-        # Convert salt to ctypes array
+        # One bulk copy for the salt; init_code is read in place
         salt_array = (c_uint8 * 32).from_buffer_copy(salt)
+        init_code_ptr, init_code_len = input_ptr(init_code)
 
-        # Convert init_code to ctypes
-        if init_code:
-            init_code_array = (c_uint8 * len(init_code)).from_buffer_copy(init_code)
-            init_code_ptr = ctypes.cast(init_code_array, POINTER(c_uint8))
-            init_code_len = len(init_code)
-        else:
-            # Empty init_code
-            init_code_ptr = ctypes.cast(None, POINTER(c_uint8))
-            init_code_len = 0
-
-        result = lib.primitives_calculate_create2_address(
+        result = primitives_calculate_create2_address(
             ctypes.byref(sender._data),
             ctypes.byref(salt_array),
             init_code_ptr,
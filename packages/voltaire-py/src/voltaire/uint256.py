@@ -6,10 +6,15 @@ Big-endian byte representation matching Ethereum ABI encoding.
 
 from __future__ import annotations
 
-import ctypes
 from typing import TYPE_CHECKING
 
-from voltaire._ffi import PrimitivesU256, get_lib
+from voltaire._ffi import (
+    U256_HEX_LEN,
+    primitives_u256_from_hex,
+    primitives_u256_to_hex,
+    scratch_hex67,
+    scratch_u256,
+)
 from voltaire.errors import InvalidLengthError, check_error
 
 if TYPE_CHECKING:
@@ -49,15 +54,14 @@ class Uint256:
             InvalidHexError: Invalid hex characters.
             InvalidLengthError: Exceeds 32 bytes.
         """
-        lib = get_lib()
-        result = PrimitivesU256()
+        result, result_ptr = scratch_u256()
 
         # Encode to bytes for C API
-        if not hex_str.startswith("0x") and not hex_str.startswith("0X"):
+        if not hex_str.startswith(("0x", "0X")):
             hex_str = "0x" + hex_str
         hex_bytes = hex_str.encode("ascii")
 
-        code = lib.primitives_u256_from_hex(hex_bytes, ctypes.byref(result))
+        code = primitives_u256_from_hex(hex_bytes, result_ptr)
         check_error(code, "Uint256.from_hex")
 
         return cls(bytes(result.bytes))
@@ -120,16 +124,15 @@ class Uint256:
         Returns:
             Hex string (0x + 64 hex chars).
         """
-        lib = get_lib()
         # Buffer: 0x + 64 hex chars + null terminator = 67 bytes
-        buf = ctypes.create_string_buffer(67)
-        c_struct = PrimitivesU256()
+        buf = scratch_hex67()
+        c_struct, c_struct_ptr = scratch_u256()
         c_struct.bytes[:] = self._data
 
-        code = lib.primitives_u256_to_hex(ctypes.byref(c_struct), buf, 67)
+        code = primitives_u256_to_hex(c_struct_ptr, buf, 67)
         check_error(code, "Uint256.to_hex")
 
-        return buf.value.decode("ascii")
+        return buf.raw[:U256_HEX_LEN].decode("ascii")
 
     def to_int(self) -> int:
         """
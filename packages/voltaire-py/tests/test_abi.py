@@ -38,6 +38,13 @@ class TestComputeSelector:
         selector = Abi.compute_selector("foo(uint256,address,bool)")
         assert len(selector) == 4
 
+    def test_repeated_calls_consistent(self):
+        """Cached selectors match across calls and between signatures."""
+        first = Abi.compute_selector("transfer(address,uint256)")
+        Abi.compute_selector("approve(address,uint256)")
+        second = Abi.compute_selector("transfer(address,uint256)")
+        assert first == second == bytes.fromhex("a9059cbb")
+
 
 class TestEncodeParametersUint:
     """Tests for Abi.encode_parameters with uint types."""
@@ -259,6 +266,18 @@ class TestEncodeParametersBytes:
         assert len(encoded) == 32
         assert all(b == 0xff for b in encoded)
 
+    def test_bytes4_wrong_length_rejected(self):
+        """A value longer or shorter than the fixed size is rejected."""
+        with pytest.raises(InvalidInputError):
+            Abi.encode_parameters(["bytes4"], [bytes(5)])
+        with pytest.raises(InvalidInputError):
+            Abi.encode_parameters(["bytes4"], ["0x123456"])
+
+    def test_uppercase_hex_prefix(self):
+        """A 0X prefix is accepted like 0x."""
+        encoded = Abi.encode_parameters(["bytes4"], ["0X12345678"])
+        assert encoded == Abi.encode_parameters(["bytes4"], ["0x12345678"])
+
 
 class TestEncodeParametersMixed:
     """Tests for Abi.encode_parameters with mixed types."""
@@ -277,6 +296,69 @@ class TestEncodeParametersMixed:
         encoded = Abi.encode_parameters([], [])
         assert len(encoded) == 0
 
+    def test_uint256_string_dynamic(self):
+        """Dynamic string follows the static head via an offset word."""
+        encoded = Abi.encode_parameters(["uint256", "string"], [1, "hello"])
+        assert len(encoded) == 128
+        assert int.from_bytes(encoded[32:64], "big") == 64  # offset
+        assert int.from_bytes(encoded[64:96], "big") == 5  # length
+        assert encoded[96:101] == b"hello"
+        assert encoded[101:] == bytes(27)
+
+    def test_bytes_from_hex_string(self):
+        """Dynamic bytes accept a 0x-prefixed hex string."""
+        assert Abi.encode_parameters(["bytes"], ["0xdeadbeef"]) == (
+            Abi.encode_parameters(["bytes"], [b"\xde\xad\xbe\xef"])
+        )
+
+    def test_large_output_after_small(self):
+        """Outputs larger than the reused buffer are returned intact."""
+        small = Abi.encode_parameters(["uint256"], [1])
+        payload = bytes(range(256)) * 40
+        large = Abi.encode_parameters(["bytes"], [payload])
+        assert small == (1).to_bytes(32, "big")
+        assert int.from_bytes(large[32:64], "big") == len(payload)
+        assert large[64:64 + len(payload)] == payload
+
+    def test_negative_uint_raises(self):
+        """Negative values are rejected for unsigned types."""
+        with pytest.raises(InvalidInputError):
+            Abi.encode_parameters(["uint256"], [-1])
+
+    def test_uint256_array(self):
+        """uint256[] is encoded as offset, length and one word per element."""
+        encoded = Abi.encode_parameters(["uint256[]"], [[1, 2, 3]])
+        assert encoded == b"".join(
+            n.to_bytes(32, "big") for n in (32, 3, 1, 2, 3)
+        )
+
+    def test_bytes32_array_wrong_element_length_raises(self):
+        """bytes32[] elements must be exactly 32 bytes."""
+        with pytest.raises(InvalidInputError):
+            Abi.encode_parameters(["bytes32[]"], [[b"\x01" * 31]])
+
+    def test_narrow_int_range_checked(self):
+        """Values are range-checked against the declared bit width."""
+        with pytest.raises(InvalidInputError):
+            Abi.encode_parameters(["uint8"], [256])
+        with pytest.raises(InvalidInputError):
+            Abi.encode_parameters(["int8"], [-129])
+        assert Abi.encode_parameters(["int8"], [-128]) == b"\xff" * 31 + b"\x80"
+
+    def test_narrow_int_range_checked_with_dynamic_types(self):
+        """The bit-width check also applies next to dynamic parameters."""
+        with pytest.raises(InvalidInputError):
+            Abi.encode_parameters(["uint8", "string"], [256, "x"])
+        with pytest.raises(InvalidInputError):
+            Abi.encode_parameters(["int16", "bytes"], [1 << 15, b""])
+        with pytest.raises(InvalidInputError):
+            Abi.encode_parameters(["uint8", "bool[]"], [256, [True]])
+
+    def test_uint256_overflow_raises(self):
+        """Values wider than 256 bits are rejected."""
+        with pytest.raises(InvalidInputError):
+            Abi.encode_parameters(["uint256"], [1 << 256])
+
 
 class TestEncodeFunctionData:
     """Tests for Abi.encode_function_data."""
@@ -308,6 +390,11 @@ class TestEncodeFunctionData:
         # Last 32 bytes should be all 0xff
         assert all(b == 0xff for b in calldata[-32:])
 
+    def test_signature_whitespace_ignored_for_types(self):
+        """Whitespace around parameter types does not change the encoding."""
+        calldata = Abi.encode_function_data("f(uint256, bool)", [1, True])
+        assert calldata[4:] == Abi.encode_parameters(["uint256", "bool"], [1, True])
+
 
 class TestEncodePackedUint:
     """Tests for Abi.encode_packed with uint types.
@@ -225,6 +225,26 @@ class TestDecodeParametersDynamic:
         values = Abi.decode_parameters(["string"], data)
         assert values[0] == "hello"
 
+    def test_decode_string_with_json_metacharacters(self):
+        """Quotes and backslashes in strings are returned verbatim."""
+        text = 'say "hi" \\ bye'
+        encoded = Abi.encode_parameters(["string"], [text])
+        assert Abi.decode_parameters(["string"], encoded) == [text]
+
+    def test_decode_string_array_with_json_metacharacters(self):
+        """Strings decoded through the JSON path are also returned verbatim."""
+        text = 'say "hi" \\ bye\n'
+        payload = text.encode("utf-8")
+        # Array offset, count (1), element offset, string length, data + padding
+        data = (
+            (32).to_bytes(32, "big")
+            + (1).to_bytes(32, "big")
+            + (32).to_bytes(32, "big")
+            + len(payload).to_bytes(32, "big")
+            + payload + bytes(-len(payload) % 32)
+        )
+        assert Abi.decode_parameters(["string[]"], data) == [[text]]
+
 
 class TestDecodeParametersArrays:
     """Tests for decoding array types."""
@@ -249,6 +269,17 @@ class TestDecodeParametersArrays:
         values = Abi.decode_parameters(["uint256[]"], data)
         assert values[0] == [1, 2, 3]
 
+    def test_array_round_trip(self):
+        """uint256[], address[] and bytes32[] round-trip through encode/decode."""
+        types = ["uint256[]", "address[]", "bytes32[]"]
+        values = [
+            [0, 1, 2**256 - 1],
+            ["0x" + "11" * 20, "0x742d35cc6634c0532925a3b844bc9e7595f251e3"],
+            [bytes(range(32))],
+        ]
+        encoded = Abi.encode_parameters(types, values)
+        assert Abi.decode_parameters(types, encoded) == values
+
 
 class TestDecodeParametersMixed:
     """Tests for decoding mixed static/dynamic types."""
@@ -286,6 +317,43 @@ class TestDecodeParametersEdgeCases:
             Abi.decode_parameters(["uint256"], b"")
 
 
+class TestDecodeParametersBatch:
+    """Tests for decode_parameters_batch."""
+
+    def test_decode_batch(self):
+        """Each blob decodes to its own value list, in order."""
+        blobs = [
+            (i).to_bytes(32, "big") + (i * 1000).to_bytes(32, "big")
+            for i in range(50)
+        ]
+        values = Abi.decode_parameters_batch(["uint256", "uint256"], blobs)
+        assert values == [[i, i * 1000] for i in range(50)]
+
+    def test_decode_batch_empty(self):
+        """No blobs decodes to an empty list."""
+        assert Abi.decode_parameters_batch(["uint256"], []) == []
+
+    def test_decode_many_threaded_matches_batch(self):
+        """Threaded decoding returns the same values in the same order."""
+        blobs = [(i).to_bytes(32, "big") for i in range(101)]
+        expected = Abi.decode_parameters_batch(["uint256"], blobs)
+        assert Abi.decode_parameters_many_threaded(["uint256"], blobs, 4) == expected
+
+    def test_decode_batch_truncated_item_raises(self):
+        """A truncated blob anywhere in the batch raises."""
+        blobs = [bytes(32), bytes(16), bytes(32)]
+        with pytest.raises((InvalidInputError, InvalidLengthError)):
+            Abi.decode_parameters_batch(["uint256"], blobs)
+
+    def test_decode_batch_strings_with_json_metacharacters(self):
+        """Quotes and backslashes round-trip and match decode_parameters."""
+        texts = ['say "hi"', "back\\slash", "plain"]
+        blobs = [Abi.encode_parameters(["uint256", "string"], [i, t]) for i, t in enumerate(texts)]
+        values = Abi.decode_parameters_batch(["uint256", "string"], blobs)
+        assert values == [[i, t] for i, t in enumerate(texts)]
+        assert values == [Abi.decode_parameters(["uint256", "string"], b) for b in blobs]
+
+
 class TestDecodeFunctionData:
     """Tests for decode_function_data."""
 
@@ -305,6 +373,13 @@ class TestDecodeFunctionData:
         assert values[0].lower() == "0x742d35cc6634c0532925a3b844bc9e7595f251e3"
         assert values[1] == 1000
 
+    def test_decode_bytearray_matches_bytes(self):
+        """bytearray calldata decodes the same as bytes."""
+        data = bytes.fromhex("a9059cbb") + bytes(12) + bytes(range(20)) + bytes(31) + b"\x07"
+        expected = Abi.decode_function_data(["address", "uint256"], data)
+        assert Abi.decode_function_data(["address", "uint256"], bytearray(data)) == expected
+        assert expected[1][1] == 7
+
     def test_decode_no_params(self):
         """Decode function with no parameters."""
         data = bytes.fromhex("18160ddd")  # totalSupply()
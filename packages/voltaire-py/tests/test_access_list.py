@@ -115,6 +115,14 @@ class TestAccessListEntryFromDict:
         with pytest.raises(InvalidLengthError):
             AccessListEntry.from_dict(d)
 
+    def test_from_dict_matches_constructor(self):
+        """Parsed entries equal and hash like directly constructed ones."""
+        d = {"address": "0x" + "11" * 20, "storageKeys": ["0x" + "22" * 32]}
+        direct = AccessListEntry(address=bytes([0x11]) * 20, storage_keys=(bytes([0x22]) * 32,))
+        entry = AccessListEntry.from_dict(d)
+        assert entry == direct
+        assert hash(entry) == hash(direct)
+
 
 class TestAccessListEntryToDict:
     """Tests for AccessListEntry.to_dict method."""
@@ -238,6 +246,26 @@ class TestAccessListFromList:
         al = AccessList.from_list(items)
         assert al.storage_key_count() == 2
 
+    def test_from_list_keys_stay_with_their_address(self):
+        """Batched decoding assigns each storage key to its own entry."""
+        items = [
+            {"address": "0x" + "11" * 20, "storageKeys": ["0x" + "aa" * 32]},
+            {"address": "22" * 20, "storageKeys": []},
+            {"address": "0X" + "33" * 20, "storageKeys": ["bb" * 32, "0x" + "cc" * 32]},
+        ]
+        al = AccessList.from_list(items)
+        assert al.entries == tuple(AccessListEntry.from_dict(item) for item in items)
+        assert al.entries[2].storage_keys == (bytes([0xBB]) * 32, bytes([0xCC]) * 32)
+
+    def test_from_list_invalid_key_length(self):
+        """A short storage key anywhere in the list is reported."""
+        items = [
+            {"address": "0x" + "11" * 20, "storageKeys": ["0x" + "aa" * 32]},
+            {"address": "0x" + "22" * 20, "storageKeys": ["0x" + "bb" * 31]},
+        ]
+        with pytest.raises(InvalidLengthError):
+            AccessList.from_list(items)
+
 
 class TestAccessListToList:
     """Tests for AccessList.to_list method."""
@@ -170,6 +170,38 @@ class TestIsValidJumpdest:
         # Position 33 is the actual JUMPDEST
         assert bytecode.is_valid_jumpdest(33) is True
 
+    def test_jumpdests_across_bitmap_bytes(self):
+        """Lookups are correct on both sides of 8-byte bitmap boundaries."""
+        # JUMPDEST at 0, 7, 8, 15, 16; PUSH1 0x5b at 10 hides position 11
+        code = bytearray([0x00] * 18)
+        for pc in (0, 7, 8, 15, 16):
+            code[pc] = 0x5b
+        code[10] = 0x60
+        code[11] = 0x5b
+        bytecode = Bytecode(bytes(code))
+
+        valid = {pc for pc in range(len(code)) if bytecode.is_valid_jumpdest(pc)}
+        assert valid == {0, 7, 8, 15, 16}
+
+    def test_bitmap_matches_analyze_jumpdests(self):
+        """Bitmap lookups agree with the position list for every pc."""
+        # Mix of JUMPDESTs, PUSH1..PUSH32 hiding 0x5b bytes, and plain ops
+        code = bytearray()
+        for i in range(64):
+            code.append(0x5b)
+            code.append(0x60 + (i % 32))
+            code.extend(b"\x5b" * ((i % 32) + 1))
+            code.append(0x01)
+        bytecode = Bytecode(bytes(code))
+
+        raw = bytecode.analyze_jumpdests()
+        expected = {
+            int.from_bytes(raw[i : i + 4], "little") for i in range(0, len(raw), 4)
+        }
+        valid = {pc for pc in range(len(code)) if bytecode.is_valid_jumpdest(pc)}
+        assert valid == expected
+        assert len(expected) == 64
+
 
 class TestValidate:
     """Tests for Bytecode.validate method."""
@@ -318,6 +350,76 @@ class TestAnalyzeJumpdests:
         # Both calls should return the same cached result
         assert result1 == result2
 
+    def test_analysis_shared_across_instances(self):
+        """Instances over identical code reuse one cached analysis."""
+        code = bytes([0x60, 0x5b, 0x5b, 0x56, 0x5b])
+        first = Bytecode(code).analyze_jumpdests()
+        second = Bytecode(bytes(bytearray(code))).analyze_jumpdests()
+        assert first is second
+        assert first == (2).to_bytes(4, "little") + (4).to_bytes(4, "little")
+
+    def test_clear_analysis_cache(self):
+        """Clearing the cache forces a fresh analysis with the same result."""
+        code = bytes([0x60, 0x5b, 0x5b, 0x56, 0x5b])
+        first = Bytecode(code).analyze_jumpdests()
+        Bytecode.clear_analysis_cache()
+        second = Bytecode(code).analyze_jumpdests()
+        assert second is not first
+        assert second == first
+
+    def test_batch_matches_single(self):
+        """Batch analysis matches analyze_jumpdests for each contract."""
+        codes = [
+            bytes.fromhex("60005b00"),
+            b"",
+            bytes.fromhex("605b5b"),
+            bytes.fromhex("5b5b5b"),
+            bytes([0x7F]) + bytes([0x5B]) * 32 + bytes([0x5B]),
+        ]
+
+        assert Bytecode.analyze_jumpdests_batch(codes) == [
+            Bytecode(code).analyze_jumpdests() for code in codes
+        ]
+
+    def test_batch_empty(self):
+        """Empty input returns an empty list."""
+        assert Bytecode.analyze_jumpdests_batch([]) == []
+
+
+class TestScan:
+    """Tests for scan method."""
+
+    def test_skips_push_data(self):
+        """PUSH immediates are not decoded as instructions."""
+        # PUSH2 0x5b5b, JUMPDEST, PUSH1 0x00, STOP
+        bytecode = Bytecode(bytes([0x61, 0x5B, 0x5B, 0x5B, 0x60, 0x00, 0x00]))
+        instructions = bytecode.scan()
+
+        assert instructions.pcs == (0, 3, 4, 6)
+        assert instructions.opcodes == bytes([0x61, 0x5B, 0x60, 0x00])
+        assert instructions.push_sizes == bytes([2, 0, 1, 0])
+
+    def test_range(self):
+        """Only instructions in [start_pc, end_pc) are returned."""
+        bytecode = Bytecode(bytes([0x01, 0x02, 0x03, 0x04]))
+        instructions = bytecode.scan(1, 3)
+
+        assert instructions.pcs == (1, 2)
+        assert instructions.opcodes == bytes([0x02, 0x03])
+
+    def test_opcode_stream_search(self):
+        """Opcode stream indexes line up with pcs."""
+        # PUSH1 0x56, JUMP
+        bytecode = Bytecode(bytes([0x60, 0x56, 0x56]))
+        instructions = bytecode.scan()
+
+        assert instructions.pcs[instructions.opcodes.find(0x56)] == 2
+
+    def test_empty(self):
+        """Empty code or empty range yields no instructions."""
+        assert Bytecode(b"").scan() == ((), b"", b"")
+        assert Bytecode(bytes([0x00])).scan(1) == ((), b"", b"")
+
 
 class TestProtocols:
     """Tests for Python protocol support."""
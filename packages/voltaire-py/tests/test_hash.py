@@ -2,7 +2,15 @@
 
 import pytest
 
-from voltaire.hash import Hash, keccak256, sha256, eip191_hash_message, blake2b, ripemd160
+from voltaire.hash import (
+    Hash,
+    keccak256,
+    keccak256_batch,
+    sha256,
+    eip191_hash_message,
+    blake2b,
+    ripemd160,
+)
 from voltaire.errors import InvalidHexError, InvalidLengthError
 
 
@@ -32,6 +40,21 @@ class TestKeccak256:
         h = keccak256(b"\xde\xad\xbe\xef")
         assert len(h.to_bytes()) == 32
 
+    def test_fixed_size_inputs(self):
+        """32- and 64-byte inputs match known vectors."""
+        assert keccak256(bytes(32)).to_hex() == (
+            "0x290decd9548b62a8d60345a988386fc84ba6bc95484008f6362f93160ef3e563"
+        )
+        assert keccak256(bytes(64)).to_hex() == (
+            "0xad3228b676f7d3cd4284a5443f17f1962b36e491b30a40b2405849e597ba5fb5"
+        )
+
+    def test_buffer_inputs(self):
+        """bytearray and memoryview hash the same as bytes."""
+        expected = keccak256(b"hello")
+        assert keccak256(bytearray(b"hello")) == expected
+        assert keccak256(memoryview(b"hello")) == expected
+
     def test_string_utf8_encoding(self):
         """String input is UTF-8 encoded."""
         h1 = keccak256("hello")
@@ -51,6 +74,29 @@ class TestKeccak256:
         assert h1 != h2
 
 
+class TestKeccak256Batch:
+    """Tests for keccak256_batch."""
+
+    def test_matches_single_calls(self):
+        """Batch results match keccak256 item by item, in order."""
+        items = [b"", b"hello", "Hello World!", b"\x00" * 200, b"\xde\xad\xbe\xef"]
+        assert keccak256_batch(items) == [keccak256(item) for item in items]
+
+    def test_empty_batch(self):
+        """Empty input returns an empty list."""
+        assert keccak256_batch([]) == []
+
+    def test_accepts_iterables(self):
+        """Generators and bytearrays are accepted."""
+        hashes = keccak256_batch(bytearray([i]) for i in range(3))
+        assert hashes == [keccak256(bytes([i])) for i in range(3)]
+
+    def test_many_short_inputs(self):
+        """Many trie-node-sized inputs, including empty ones, keep their order."""
+        items = [i.to_bytes(64, "big")[: i % 65] for i in range(500)]
+        assert keccak256_batch(items) == [keccak256(item) for item in items]
+
+
 class TestSha256:
     """Tests for SHA-256 hash function."""
 
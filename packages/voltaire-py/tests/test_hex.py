@@ -122,6 +122,20 @@ class TestDecode:
         with pytest.raises((InvalidHexError, InvalidLengthError)):
             Hex.decode("0xde ad be ef")
 
+    def test_decode_long_mixed_case(self):
+        """Long inputs decode correctly, including a partial final block."""
+        data = bytes(range(256)) + b"\xab\xcd\xef"
+        assert Hex.decode("0x" + data.hex().upper()) == data
+        assert Hex.decode(data.hex()) == data
+
+    @pytest.mark.parametrize("pos", [0, 15, 16, 40, 65])
+    def test_decode_long_invalid_char(self, pos):
+        """Invalid characters are rejected in vector blocks and in the tail."""
+        digits = list("ab" * 33)
+        digits[pos] = "g"
+        with pytest.raises(InvalidHexError):
+            Hex.decode("0x" + "".join(digits))
+
 
 class TestRoundTrip:
     """Tests for encode/decode round-trip."""
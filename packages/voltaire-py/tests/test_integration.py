@@ -646,3 +646,55 @@ class TestErrorPropagation:
                 ["uint256", "address"],  # 2 types
                 [42],  # 1 value
             )
+
+
+class TestLibraryCompatibility:
+    """Test loading a native library that predates newer exports."""
+
+    def test_import_with_missing_symbols(self):
+        """Importing succeeds and only calls into missing functions fail."""
+        import _ctypes
+        import os
+        import subprocess
+        import sys
+
+        # Any shared library without the primitives_* exports will do
+        lib_path = getattr(_ctypes, "__file__", None)
+        if lib_path is None:
+            pytest.skip("_ctypes is built into this interpreter")
+
+        script = (
+            "import voltaire, voltaire._ffi as ffi\n"
+            "assert not ffi.has_function('primitives_keccak256')\n"
+            "try:\n"
+            "    ffi.primitives_keccak256(b'', 0, None)\n"
+            "except AttributeError as e:\n"
+            "    assert 'primitives_keccak256' in str(e)\n"
+            "else:\n"
+            "    raise SystemExit('call did not fail')\n"
+        )
+        env = dict(os.environ, VOLTAIRE_LIB_PATH=lib_path)
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_cached_library_path_invalidated_by_rebuild(self, tmp_path, monkeypatch):
+        """A cached library path is dropped once the file changes."""
+        from voltaire import _ffi
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        lib = tmp_path / "libprimitives.so"
+        lib.write_bytes(b"old build")
+
+        _ffi._write_cached_library(lib)
+        assert _ffi._read_cached_library() == lib.resolve()
+
+        lib.write_bytes(b"rebuilt library")
+        assert _ffi._read_cached_library() is None
+
+        lib.unlink()
+        assert _ffi._read_cached_library() is None
@@ -93,6 +93,21 @@ class TestRlpEncodeBytes:
         assert result[1] == 70
         assert result[2:] == long_str
 
+    def test_multi_byte_length(self):
+        """Payloads over 255 bytes carry a multi-byte length prefix."""
+        data = bytes(range(256)) * 40  # 10240 bytes
+        result = Rlp.encode_bytes(data)
+        # 0xb9 (0xb7 + 2) + 2 length bytes + data
+        assert result[:3] == bytes([0xb9, 0x28, 0x00])
+        assert result[3:] == data
+
+    def test_results_do_not_alias(self):
+        """Consecutive encodings return independent bytes objects."""
+        first = Rlp.encode_bytes(b"dog")
+        second = Rlp.encode_bytes(b"cat")
+        assert first == b"\x83dog"
+        assert second == b"\x83cat"
+
 
 class TestRlpEncodeUint:
     """Tests for Rlp.encode_uint()"""
@@ -193,6 +193,121 @@ class TestRecoverAddress:
         with pytest.raises(InvalidSignatureError):
             Secp256k1.recover_address(bytes(32), sig)
 
+    def test_repeated_recovery_is_stable(self):
+        """Recovering the same signature twice, or a different one in between, agrees."""
+        r = bytes.fromhex("79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798")
+        s = bytes.fromhex("483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8")
+        first = Secp256k1.recover_address(bytes([1]) * 32, Signature(r=r, s=s, v=27))
+        other = Secp256k1.recover_address(bytes([2]) * 32, Signature(r=r, s=s, v=27))
+
+        assert Secp256k1.recover_address(bytes([1]) * 32, Signature(r=r, s=s, v=27)) == first
+        assert Secp256k1.recover_address(bytes([2]) * 32, Signature(r=r, s=s, v=27)) == other
+        assert first != other
+
+    def test_recovery_after_mutating_bytearray_signature(self):
+        """Changing a bytearray r in place is not served from the previous recovery."""
+        message_hash = bytes([1]) * 32
+        r = bytearray.fromhex("79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798")
+        s = bytes.fromhex("483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8")
+        other_r = bytes.fromhex("7592aab5d43618dda13fba71e3993cd7517a712d3da49664c06ee1bd3d1f70af")
+        expected = Secp256k1.recover_address(message_hash, Signature(r=other_r, s=s, v=27))
+
+        sig = Signature(r=r, s=s, v=27)
+        first = Secp256k1.recover_address(message_hash, sig)
+        r[:] = other_r
+
+        assert Secp256k1.recover_address(message_hash, sig) == expected
+        assert expected != first
+
+
+class TestVerify:
+    """Tests for Secp256k1.verify."""
+
+    # Signed with private key 0x0123...cdef (repeated), message hash 0xab * 32
+    MESSAGE_HASH = bytes([0xAB]) * 32
+    SIGNATURE = Signature(
+        r=bytes.fromhex("7592aab5d43618dda13fba71e3993cd7517a712d3da49664c06ee1bd3d1f70af"),
+        s=bytes.fromhex("1a477efaa0fe5a44c4e856f615f70a8095631ae0b67eec90fc24a6dff4b33146"),
+        v=27,
+    )
+    PUBLIC_KEY = bytes.fromhex(
+        "4646ae5047316b4230d0086c8acec687f00b1cd9d1dc634f6cb358ac0a9a8fff"
+        "fe77b4dd0a4bfb95851f3b7355c781dd60f8418fc8a65d14907aff47c903a559"
+    )
+
+    def test_valid_signature(self):
+        """Accept a signature made by the given key."""
+        assert Secp256k1.verify(self.MESSAGE_HASH, self.SIGNATURE, self.PUBLIC_KEY) is True
+
+    def test_wrong_message(self):
+        """Reject a signature over a different message."""
+        assert Secp256k1.verify(bytes(32), self.SIGNATURE, self.PUBLIC_KEY) is False
+
+    def test_high_s_rejected(self):
+        """Reject the malleable (high-s) form of a valid signature."""
+        high_s = (SECP256K1_N - int.from_bytes(self.SIGNATURE.s, "big")).to_bytes(32, "big")
+        sig = Signature(r=self.SIGNATURE.r, s=high_s, v=28)
+
+        assert Secp256k1.verify(self.MESSAGE_HASH, sig, self.PUBLIC_KEY) is False
+
+    def test_off_curve_public_key(self):
+        """Reject a public key that is not on the curve."""
+        assert Secp256k1.verify(self.MESSAGE_HASH, self.SIGNATURE, bytes(64)) is False
+
+    def test_invalid_public_key_length(self):
+        """Reject public key that is not 64 bytes."""
+        with pytest.raises(InvalidLengthError):
+            Secp256k1.verify(self.MESSAGE_HASH, self.SIGNATURE, self.PUBLIC_KEY[:63])
+
+    def test_invalid_message_hash_length(self):
+        """Reject message hash that is not 32 bytes."""
+        with pytest.raises(InvalidLengthError):
+            Secp256k1.verify(bytes(31), self.SIGNATURE, self.PUBLIC_KEY)
+
+
+class TestRecoverAddressBatch:
+    """Tests for Secp256k1.recover_address_batch."""
+
+    def test_matches_single_recovery(self):
+        """Batch recovery matches recover_address for each signature."""
+        # r = x-coordinate of the generator point, so R is always on the curve
+        r = bytes.fromhex("79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798")
+        s = bytes.fromhex("483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8")
+        message_hashes = [bytes([i]) * 32 for i in (1, 2, 3)]
+        signatures = [Signature(r=r, s=s, v=v) for v in (27, 28, 0)]
+
+        addresses = Secp256k1.recover_address_batch(message_hashes, signatures)
+
+        assert addresses == [
+            Secp256k1.recover_address(message_hash, sig)
+            for message_hash, sig in zip(message_hashes, signatures)
+        ]
+
+    def test_empty_batch(self):
+        """Empty input returns an empty list."""
+        assert Secp256k1.recover_address_batch([], []) == []
+
+    def test_mismatched_lengths(self):
+        """Reject sequences of different length."""
+        sig = Signature(r=bytes(32), s=bytes(32), v=27)
+
+        with pytest.raises(InvalidInputError):
+            Secp256k1.recover_address_batch([bytes(32), bytes(32)], [sig])
+
+    def test_invalid_message_hash_length(self):
+        """Reject any message hash that is not 32 bytes."""
+        sig = Signature(r=bytes(32), s=bytes(32), v=27)
+
+        with pytest.raises(InvalidLengthError):
+            Secp256k1.recover_address_batch([bytes(32), bytes(31)], [sig, sig])
+
+    def test_invalid_v(self):
+        """Reject v that is not 0, 1, 27, or 28."""
+        sig = Signature(r=bytes(32), s=bytes(32), v=100)
+
+        with pytest.raises(InvalidSignatureError):
+            Secp256k1.recover_address_batch([bytes(32)], [sig])
+
 
 class TestPublicKeyFromPrivate:
     """Tests for Secp256k1.public_key_from_private."""
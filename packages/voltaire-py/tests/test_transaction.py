@@ -73,6 +73,13 @@ class TestDetectType:
         tx_type = Transaction.detect_type(eip1559_tx)
         assert tx_type == TransactionType.EIP1559
 
+    def test_detect_from_bytearray(self):
+        """A bytearray is read in place and left unchanged."""
+        raw = bytearray([0x02]) + bytes.fromhex("f86c808504a817c80082520894")
+        snapshot = bytes(raw)
+        assert Transaction.detect_type(raw) == TransactionType.EIP1559
+        assert raw == snapshot
+
     def test_detect_eip4844_type_prefix(self):
         """Detect EIP-4844 from type prefix 0x03."""
         # Type 3 transaction starts with 0x03
@@ -131,6 +131,44 @@ export fn primitives_keccak256(
     return PRIMITIVES_SUCCESS;
 }
 
+/// Compute Keccak-256 of exactly 32 bytes (storage keys, trie child hashes)
+/// Input length is comptime-known, so the sponge absorbs a single fixed-size
+/// block with no length dispatch
+export fn primitives_keccak256_32(
+    data: *const [32]u8,
+    out_hash: *PrimitivesHash,
+) c_int {
+    std.crypto.hash.sha3.Keccak256.hash(data, &out_hash.bytes, .{});
+    return PRIMITIVES_SUCCESS;
+}
+
+/// Compute Keccak-256 of exactly 64 bytes (e.g. two concatenated hashes)
+export fn primitives_keccak256_64(
+    data: *const [64]u8,
+    out_hash: *PrimitivesHash,
+) c_int {
+    std.crypto.hash.sha3.Keccak256.hash(data, &out_hash.bytes, .{});
+    return PRIMITIVES_SUCCESS;
+}
+
+/// Compute Keccak-256 of many inputs in a single call
+/// Inputs are concatenated in `data`; item i spans offsets[i]..offsets[i + 1]
+/// (offsets holds count + 1 entries). out_hashes must hold `count` hashes
+export fn primitives_keccak256_batch(
+    data: [*]const u8,
+    offsets: [*]const u32,
+    count: usize,
+    out_hashes: [*]PrimitivesHash,
+) c_int {
+    for (0..count) |i| {
+        const start = offsets[i];
+        const end = offsets[i + 1];
+        if (end < start) return PRIMITIVES_ERROR_INVALID_INPUT;
+        std.crypto.hash.sha3.Keccak256.hash(data[start..end], &out_hashes[i].bytes, .{});
+    }
+    return PRIMITIVES_SUCCESS;
+}
+
 /// Convert hash to hex string (66 bytes: "0x" + 64 hex chars)
 /// buf must be at least 66 bytes
 export fn primitives_hash_to_hex(
@@ -196,6 +234,62 @@ export fn primitives_hex_to_bytes(
     return @intCast(bytes.len);
 }
 
+/// Convert hex string to bytes, 16 hex characters per vector step
+/// Accepts an optional 0x/0X prefix; decodes straight into out_buf without
+/// the temporary allocation (or 4KB size cap) of primitives_hex_to_bytes
+/// Returns the number of bytes written, or negative error code
+export fn primitives_hex_to_bytes_fast(
+    hex: [*:0]const u8,
+    out_buf: [*]u8,
+    buf_len: usize,
+) c_int {
+    var digits = std.mem.span(hex);
+    if (digits.len >= 2 and digits[0] == '0' and (digits[1] == 'x' or digits[1] == 'X')) {
+        digits = digits[2..];
+    }
+
+    if (digits.len % 2 != 0) {
+        return PRIMITIVES_ERROR_INVALID_LENGTH;
+    }
+    const out_len = digits.len / 2;
+    if (out_len > buf_len) {
+        return PRIMITIVES_ERROR_INVALID_LENGTH;
+    }
+
+    const V = @Vector(16, u8);
+    const evens = [8]i32{ 0, 2, 4, 6, 8, 10, 12, 14 };
+    const odds = [8]i32{ 1, 3, 5, 7, 9, 11, 13, 15 };
+
+    var i: usize = 0;
+    while (i + 16 <= digits.len) : (i += 16) {
+        const chars: V = digits[i..][0..16].*;
+
+        // '0'-'9' -> 0-9, 'a'-'f'/'A'-'F' -> 10-15, anything else -> 0xff
+        const digit = chars -% @as(V, @splat('0'));
+        const alpha = (chars | @as(V, @splat(0x20))) -% @as(V, @splat('a'));
+        const nibbles = @select(
+            u8,
+            digit < @as(V, @splat(10)),
+            digit,
+            @select(u8, alpha < @as(V, @splat(6)), alpha +% @as(V, @splat(10)), @as(V, @splat(0xff))),
+        );
+        if (@reduce(.Or, nibbles == @as(V, @splat(0xff)))) {
+            return PRIMITIVES_ERROR_INVALID_HEX;
+        }
+
+        const hi = @shuffle(u8, nibbles, undefined, evens);
+        const lo = @shuffle(u8, nibbles, undefined, odds);
+        out_buf[i / 2 ..][0..8].* = (hi << @splat(4)) | lo;
+    }
+
+    // Scalar tail (fewer than 16 hex characters)
+    _ = std.fmt.hexToBytes(out_buf[i / 2 .. out_len], digits[i..]) catch {
+        return PRIMITIVES_ERROR_INVALID_HEX;
+    };
+
+    return @intCast(out_len);
+}
+
 /// Convert bytes to hex string
 /// Returns the number of characters written (including 0x prefix), or negative error code
 export fn primitives_bytes_to_hex(
@@ -356,6 +450,38 @@ export fn primitives_secp256k1_recover_address(
     s: *const [32]u8,
     v: u8,
     out_address: *PrimitivesAddress,
+) c_int {
+    return recoverAddress(message_hash, r, s, v, out_address);
+}
+
+/// Recover signer addresses for `count` signatures in a single call
+/// Inputs are parallel arrays; on failure *out_failed_index is set to the
+/// offending entry and its error code is returned
+export fn primitives_secp256k1_recover_address_batch(
+    message_hashes: [*]const [32]u8,
+    rs: [*]const [32]u8,
+    ss: [*]const [32]u8,
+    vs: [*]const u8,
+    count: usize,
+    out_addresses: [*]PrimitivesAddress,
+    out_failed_index: *usize,
+) c_int {
+    for (0..count) |i| {
+        const result = recoverAddress(&message_hashes[i], &rs[i], &ss[i], vs[i], &out_addresses[i]);
+        if (result != PRIMITIVES_SUCCESS) {
+            out_failed_index.* = i;
+            return result;
+        }
+    }
+    return PRIMITIVES_SUCCESS;
+}
+
+fn recoverAddress(
+    message_hash: *const [32]u8,
+    r: *const [32]u8,
+    s: *const [32]u8,
+    v: u8,
+    out_address: *PrimitivesAddress,
 ) c_int {
     // Parse r and s as u256 (big-endian)
     const r_u256 = std.mem.readInt(u256, r, .big);
@@ -421,6 +547,29 @@ export fn primitives_secp256k1_validate_signature(
     return crypto.secp256k1.unauditedValidateSignature(r_u256, s_u256);
 }
 
+/// Verify an ECDSA signature against a known uncompressed public key (x || y)
+/// Cheaper than recovering the signer and comparing, since no point
+/// decompression is needed; rejects malleable (high-s) signatures
+export fn primitives_secp256k1_verify(
+    message_hash: *const [32]u8,
+    r: *const [32]u8,
+    s: *const [32]u8,
+    pubkey: *const [64]u8,
+) bool {
+    const r_u256 = std.mem.readInt(u256, r, .big);
+    const s_u256 = std.mem.readInt(u256, s, .big);
+    if (!crypto.secp256k1.unauditedValidateSignature(r_u256, s_u256)) return false;
+
+    const pub_key = crypto.secp256k1.AffinePoint{
+        .x = std.mem.readInt(u256, pubkey[0..32], .big),
+        .y = std.mem.readInt(u256, pubkey[32..64], .big),
+        .infinity = false,
+    };
+    if (!pub_key.isOnCurve()) return false;
+
+    return crypto.secp256k1.verifySignature(message_hash.*, r_u256, s_u256, pub_key);
+}
+
 // ============================================================================
 // WASM-specific secp256k1 functions (inline to avoid module conflicts)
 // ============================================================================
@@ -635,6 +784,54 @@ export fn primitives_rlp_encode_bytes(
     }
 }
 
+/// Per-thread output buffer backing the *_borrow exports. A borrowed result
+/// is valid until the next *_borrow call on the same thread.
+threadlocal var borrow_buf: std.ArrayList(u8) = .empty;
+
+fn borrowSlice(len: usize) ?[]u8 {
+    borrow_buf.resize(std.heap.page_allocator, len) catch return null;
+    return borrow_buf.items;
+}
+
+/// Encode bytes as RLP into a thread-local buffer owned by the library
+/// On success out_ptr/out_len describe the encoding; the caller must copy it
+/// before the next *_borrow call on this thread
+export fn primitives_rlp_encode_bytes_borrow(
+    data: [*]const u8,
+    data_len: usize,
+    out_ptr: *[*]const u8,
+    out_len: *usize,
+) c_int {
+    const input = data[0..data_len];
+
+    var header: [9]u8 = undefined;
+    var header_len: usize = 0;
+
+    if (input.len == 1 and input[0] < 0x80) {
+        // Single byte below 0x80 is its own encoding
+    } else if (input.len < 56) {
+        header[0] = 0x80 + @as(u8, @intCast(input.len));
+        header_len = 1;
+    } else {
+        var len_be: [8]u8 = undefined;
+        std.mem.writeInt(u64, &len_be, @intCast(input.len), .big);
+        const len_bytes = len_be[@clz(@as(u64, @intCast(input.len))) / 8 ..];
+        header[0] = 0xb7 + @as(u8, @intCast(len_bytes.len));
+        @memcpy(header[1 .. 1 + len_bytes.len], len_bytes);
+        header_len = 1 + len_bytes.len;
+    }
+
+    const out = borrowSlice(header_len + input.len) orelse {
+        return PRIMITIVES_ERROR_OUT_OF_MEMORY;
+    };
+    @memcpy(out[0..header_len], header[0..header_len]);
+    @memcpy(out[header_len..], input);
+
+    out_ptr.* = out.ptr;
+    out_len.* = out.len;
+    return PRIMITIVES_SUCCESS;
+}
+
 /// Encode unsigned integer as RLP
 /// value_bytes must be 32 bytes (big-endian u256)
 export fn primitives_rlp_encode_uint(
@@ -875,6 +1072,32 @@ export fn primitives_compress_public_key(
 // Bytecode Operations
 // ============================================================================
 
+/// Write valid JUMPDEST positions of `bytecode` into `out`, stopping when it is full
+/// Returns the number of positions written
+fn analyzeJumpdests(bytecode: []const u8, out: []u32) usize {
+    var count: usize = 0;
+    var pc: u32 = 0;
+
+    while (pc < bytecode.len and count < out.len) {
+        const opcode = bytecode[pc];
+
+        // Check if this is a JUMPDEST (0x5b)
+        if (opcode == 0x5b) {
+            out[count] = pc;
+            count += 1;
+            pc += 1;
+        } else if (opcode >= 0x60 and opcode <= 0x7f) {
+            // PUSH1-PUSH32: skip immediate data
+            const push_size = opcode - 0x5f;
+            pc += 1 + push_size;
+        } else {
+            pc += 1;
+        }
+    }
+
+    return count;
+}
+
 /// Analyze bytecode to find valid JUMPDEST locations
 /// Returns the number of valid jump destinations found
 /// out_jumpdests must have space for at least max_jumpdests u32 values
@@ -883,24 +1106,64 @@ export fn primitives_bytecode_analyze_jumpdests(
     code_len: usize,
     out_jumpdests: [*]u32,
     max_jumpdests: usize,
+) c_int {
+    return @intCast(analyzeJumpdests(code[0..code_len], out_jumpdests[0..max_jumpdests]));
+}
+
+/// Analyze JUMPDEST locations of `count` contracts in a single call
+/// Contracts are concatenated in `codes`; contract i spans offsets[i]..offsets[i + 1]
+/// (offsets holds count + 1 entries). Its positions, relative to its own
+/// start, are written from out_jumpdests[offsets[i]] on and their number to
+/// out_counts[i], so out_jumpdests must hold offsets[count] u32 values
+export fn primitives_bytecode_analyze_jumpdests_batch(
+    codes: [*]const u8,
+    offsets: [*]const u32,
+    count: usize,
+    out_jumpdests: [*]u32,
+    out_counts: [*]u32,
+) c_int {
+    for (0..count) |i| {
+        const start = offsets[i];
+        const end = offsets[i + 1];
+        if (end < start) return PRIMITIVES_ERROR_INVALID_INPUT;
+        out_counts[i] = @intCast(analyzeJumpdests(codes[start..end], out_jumpdests[start..end]));
+    }
+    return PRIMITIVES_SUCCESS;
+}
+
+/// Analyze bytecode to find valid JUMPDEST locations as a packed bitmap
+/// Bit (pc & 7) of out_bitmap[pc >> 3] is set when pc is a valid JUMPDEST
+/// out_bitmap must have space for at least ceil(code_len / 8) bytes
+/// Returns the number of valid jump destinations found, or an error code
+export fn primitives_bytecode_analyze_jumpdests_bitmap(
+    code: [*]const u8,
+    code_len: usize,
+    out_bitmap: [*]u8,
+    bitmap_len: usize,
 ) c_int {
     const bytecode = code[0..code_len];
+    const needed = (code_len + 7) / 8;
+
+    if (bitmap_len < needed) {
+        return PRIMITIVES_ERROR_INVALID_LENGTH;
+    }
+
+    const bitmap = out_bitmap[0..needed];
+    @memset(bitmap, 0);
 
     var count: usize = 0;
-    var pc: u32 = 0;
+    var pc: usize = 0;
 
-    while (pc < bytecode.len and count < max_jumpdests) {
+    while (pc < bytecode.len) {
         const opcode = bytecode[pc];
 
-        // Check if this is a JUMPDEST (0x5b)
         if (opcode == 0x5b) {
-            out_jumpdests[count] = pc;
+            bitmap[pc >> 3] |= @as(u8, 1) << @intCast(pc & 7);
             count += 1;
             pc += 1;
         } else if (opcode >= 0x60 and opcode <= 0x7f) {
             // PUSH1-PUSH32: skip immediate data
-            const push_size = opcode - 0x5f;
-            pc += 1 + push_size;
+            pc += 1 + @as(usize, opcode - 0x5f);
         } else {
             pc += 1;
         }
@@ -1336,6 +1599,269 @@ fn abiEncodeParametersImpl(
     return @intCast(encoded.len);
 }
 
+/// Parameter types accepted by primitives_abi_encode_parameters_bin, indexed by
+/// their one-byte tag. Bindings mirror this table, so only ever append to it.
+const abi_bin_types = [_]primitives.Abi.AbiType{
+    .uint8, // 0
+    .uint16, // 1
+    .uint32, // 2
+    .uint64, // 3
+    .uint128, // 4
+    .uint256, // 5
+    .int8, // 6
+    .int16, // 7
+    .int32, // 8
+    .int64, // 9
+    .int128, // 10
+    .int256, // 11
+    .address, // 12
+    .bool, // 13
+    .bytes1, // 14
+    .bytes2, // 15
+    .bytes3, // 16
+    .bytes4, // 17
+    .bytes8, // 18
+    .bytes16, // 19
+    .bytes32, // 20
+    .bytes, // 21
+    .string, // 22
+    .@"uint256[]", // 23
+    .@"address[]", // 24
+    .@"bytes32[]", // 25
+};
+
+/// Build an ABI value from its binary payload (see primitives_abi_encode_parameters_bin)
+/// Dynamic payloads are borrowed, not copied; uint256[] and address[] elements
+/// are unpacked into allocator-owned slices
+fn parseAbiValueBin(allocator: std.mem.Allocator, abi_type: primitives.Abi.AbiType, payload: []const u8) !primitives.Abi.AbiValue {
+    switch (abi_type) {
+        .uint8, .uint16, .uint32, .uint64, .uint128, .uint256 => {
+            if (payload.len != 32) return error.InvalidData;
+            return .{ .uint256 = std.mem.readInt(u256, payload[0..32], .big) };
+        },
+        .int8, .int16, .int32, .int64, .int128, .int256 => {
+            if (payload.len != 32) return error.InvalidData;
+            return .{ .int256 = std.mem.readInt(i256, payload[0..32], .big) };
+        },
+        .address => {
+            const addr = primitives.Address.fromBytes(payload) catch return error.InvalidData;
+            return .{ .address = addr };
+        },
+        .bool => {
+            if (payload.len != 1) return error.InvalidData;
+            return .{ .bool = payload[0] != 0 };
+        },
+        .bytes => return .{ .bytes = payload },
+        .string => return .{ .string = payload },
+        .@"uint256[]" => {
+            if (payload.len % 32 != 0) return error.InvalidData;
+            const items = try allocator.alloc(u256, payload.len / 32);
+            for (items, 0..) |*item, i| {
+                item.* = std.mem.readInt(u256, payload[i * 32 ..][0..32], .big);
+            }
+            return .{ .@"uint256[]" = items };
+        },
+        .@"address[]" => {
+            if (payload.len % 20 != 0) return error.InvalidData;
+            const items = try allocator.alloc(primitives.Address, payload.len / 20);
+            for (items, 0..) |*item, i| {
+                @memcpy(&item.bytes, payload[i * 20 ..][0..20]);
+            }
+            return .{ .@"address[]" = items };
+        },
+        .@"bytes32[]" => {
+            if (payload.len % 32 != 0) return error.InvalidData;
+            return .{ .@"bytes32[]" = std.mem.bytesAsSlice([32]u8, payload) };
+        },
+        inline .bytes1, .bytes2, .bytes3, .bytes4, .bytes8, .bytes16, .bytes32 => |tag| {
+            const n = comptime tag.size().?;
+            if (payload.len != n) return error.InvalidData;
+            return @unionInit(primitives.Abi.AbiValue, @tagName(tag), payload[0..n].*);
+        },
+        else => return error.UnsupportedType,
+    }
+}
+
+/// Encode ABI parameters from a compact binary description instead of JSON
+/// types: one tag per parameter (index into abi_bin_types)
+/// values: for each parameter, a little-endian u32 payload length followed by
+///   the payload: uintN/intN as 32-byte big-endian two's complement, address
+///   as 20 bytes, bool as 1 byte, bytesN as N bytes, bytes/string as raw bytes,
+///   uint256[]/address[]/bytes32[] as their elements' payloads back to back
+/// out_buf: output buffer for encoded data
+/// buf_len: size of output buffer
+/// Returns: number of bytes written, or negative error code
+export fn primitives_abi_encode_parameters_bin(
+    types: [*]const u8,
+    types_len: usize,
+    values: [*]const u8,
+    values_len: usize,
+    out_buf: [*]u8,
+    buf_len: usize,
+) c_int {
+    var arena = std.heap.ArenaAllocator.init(std.heap.page_allocator);
+    defer arena.deinit();
+    const allocator = arena.allocator();
+
+    const abi_values = allocator.alloc(primitives.Abi.AbiValue, types_len) catch {
+        return PRIMITIVES_ERROR_OUT_OF_MEMORY;
+    };
+
+    const input = values[0..values_len];
+    var pos: usize = 0;
+
+    for (types[0..types_len], abi_values) |tag, *abi_value| {
+        if (tag >= abi_bin_types.len) {
+            return PRIMITIVES_ERROR_UNSUPPORTED_TYPE;
+        }
+        if (input.len - pos < 4) {
+            return PRIMITIVES_ERROR_INVALID_INPUT;
+        }
+        const payload_len = std.mem.readInt(u32, input[pos..][0..4], .little);
+        pos += 4;
+        if (input.len - pos < payload_len) {
+            return PRIMITIVES_ERROR_INVALID_INPUT;
+        }
+
+        abi_value.* = parseAbiValueBin(allocator, abi_bin_types[tag], input[pos..][0..payload_len]) catch |err| {
+            return switch (err) {
+                error.OutOfMemory => PRIMITIVES_ERROR_OUT_OF_MEMORY,
+                else => PRIMITIVES_ERROR_INVALID_INPUT,
+            };
+        };
+        pos += payload_len;
+    }
+
+    if (pos != input.len) {
+        return PRIMITIVES_ERROR_INVALID_INPUT;
+    }
+
+    const encoded = primitives.Abi.encodeAbiParameters(allocator, abi_values) catch |err| {
+        return switch (err) {
+            error.OutOfMemory => PRIMITIVES_ERROR_OUT_OF_MEMORY,
+            error.MaxLengthExceeded => PRIMITIVES_ERROR_MAX_LENGTH_EXCEEDED,
+            else => PRIMITIVES_ERROR_INVALID_INPUT,
+        };
+    };
+
+    if (encoded.len > buf_len) {
+        return PRIMITIVES_ERROR_INVALID_LENGTH;
+    }
+
+    @memcpy(out_buf[0..encoded.len], encoded);
+    return @intCast(encoded.len);
+}
+
+/// Append one decoded value in the binary parameter format
+/// (see primitives_abi_encode_parameters_bin): u32 length, then the payload
+fn appendAbiValueBin(out: *std.array_list.AlignedManaged(u8, null), value: *const primitives.Abi.AbiValue) !void {
+    var word: [32]u8 = undefined;
+    var len_buf: [4]u8 = undefined;
+
+    // Arrays: element payloads back to back
+    switch (value.*) {
+        .@"uint256[]" => |items| {
+            std.mem.writeInt(u32, &len_buf, @intCast(items.len * 32), .little);
+            try out.appendSlice(&len_buf);
+            for (items) |item| {
+                std.mem.writeInt(u256, &word, item, .big);
+                try out.appendSlice(&word);
+            }
+            return;
+        },
+        .@"address[]" => |items| {
+            std.mem.writeInt(u32, &len_buf, @intCast(items.len * 20), .little);
+            try out.appendSlice(&len_buf);
+            for (items) |*item| try out.appendSlice(&item.bytes);
+            return;
+        },
+        .@"bytes32[]" => |items| {
+            std.mem.writeInt(u32, &len_buf, @intCast(items.len * 32), .little);
+            try out.appendSlice(&len_buf);
+            try out.appendSlice(std.mem.sliceAsBytes(items));
+            return;
+        },
+        else => {},
+    }
+
+    const payload: []const u8 = switch (value.*) {
+        inline .uint8, .uint16, .uint32, .uint64, .uint128, .uint256 => |v| blk: {
+            std.mem.writeInt(u256, &word, v, .big);
+            break :blk &word;
+        },
+        inline .int8, .int16, .int32, .int64, .int128, .int256 => |v| blk: {
+            std.mem.writeInt(i256, &word, v, .big);
+            break :blk &word;
+        },
+        .address => |*addr| &addr.bytes,
+        .bool => |b| if (b) "\x01" else "\x00",
+        .bytes, .string => |b| b,
+        inline .bytes1, .bytes2, .bytes3, .bytes4, .bytes8, .bytes16, .bytes32 => |*b| b,
+        else => return error.UnsupportedType,
+    };
+
+    std.mem.writeInt(u32, &len_buf, @intCast(payload.len), .little);
+    try out.appendSlice(&len_buf);
+    try out.appendSlice(payload);
+}
+
+/// Decode ABI parameters into the binary parameter format instead of JSON
+/// data: encoded ABI data
+/// data_len: length of encoded data
+/// types: one tag per parameter (index into abi_bin_types)
+/// out_buf: output buffer; for each parameter a little-endian u32 payload
+///   length followed by the payload, laid out as for
+///   primitives_abi_encode_parameters_bin
+/// buf_len: size of output buffer
+/// Returns: number of bytes written to out_buf, or negative error code
+export fn primitives_abi_decode_parameters_bin(
+    data: [*]const u8,
+    data_len: usize,
+    types: [*]const u8,
+    types_len: usize,
+    out_buf: [*]u8,
+    buf_len: usize,
+) c_int {
+    var arena = std.heap.ArenaAllocator.init(std.heap.page_allocator);
+    defer arena.deinit();
+    const allocator = arena.allocator();
+
+    const abi_types = allocator.alloc(primitives.Abi.AbiType, types_len) catch {
+        return PRIMITIVES_ERROR_OUT_OF_MEMORY;
+    };
+    for (types[0..types_len], abi_types) |tag, *abi_type| {
+        if (tag >= abi_bin_types.len) {
+            return PRIMITIVES_ERROR_UNSUPPORTED_TYPE;
+        }
+        abi_type.* = abi_bin_types[tag];
+    }
+
+    const decoded = primitives.Abi.decodeAbiParameters(allocator, data[0..data_len], abi_types) catch |err| {
+        return switch (err) {
+            error.OutOfMemory => PRIMITIVES_ERROR_OUT_OF_MEMORY,
+            error.DataTooSmall => PRIMITIVES_ERROR_INVALID_LENGTH,
+            else => PRIMITIVES_ERROR_INVALID_INPUT,
+        };
+    };
+
+    var out = std.array_list.AlignedManaged(u8, null).init(allocator);
+    for (decoded) |*value| {
+        appendAbiValueBin(&out, value) catch |err| {
+            return switch (err) {
+                error.OutOfMemory => PRIMITIVES_ERROR_OUT_OF_MEMORY,
+                error.UnsupportedType => PRIMITIVES_ERROR_UNSUPPORTED_TYPE,
+            };
+        };
+    }
+
+    if (out.items.len > buf_len) {
+        return PRIMITIVES_ERROR_INVALID_LENGTH;
+    }
+
+    @memcpy(out_buf[0..out.items.len], out.items);
+    return @intCast(out.items.len);
+}
+
 /// Decode ABI parameters
 /// data: encoded ABI data
 /// data_len: length of encoded data
@@ -1414,6 +1940,155 @@ fn abiDecodeParametersImpl(
     return @intCast(json_result.len);
 }
 
+/// Decode many ABI-encoded blobs that share one type list in a single call
+/// types_json: JSON array of type strings
+/// offsets: n_items + 1 ascending u32 offsets into data; item i spans
+///   data[offsets[i]..offsets[i + 1]]
+/// data: concatenation of all encoded blobs
+/// n_items: number of blobs
+/// out_buf: output buffer for a JSON array holding one value array per item
+/// buf_len: size of output buffer
+/// Returns: number of bytes written to out_buf, or negative error code
+export fn primitives_abi_decode_parameters_batch(
+    types_json: [*:0]const u8,
+    offsets: [*]const u32,
+    data: [*]const u8,
+    n_items: usize,
+    out_buf: [*]u8,
+    buf_len: usize,
+) c_int {
+    var types_arena = std.heap.ArenaAllocator.init(std.heap.page_allocator);
+    defer types_arena.deinit();
+
+    var types_list = std.array_list.AlignedManaged(primitives.Abi.AbiType, null).init(types_arena.allocator());
+    if (!parseJsonTypeArray(types_arena.allocator(), std.mem.span(types_json), &types_list)) {
+        return PRIMITIVES_ERROR_INVALID_INPUT;
+    }
+
+    // Per-item scratch, reset between items so memory stays bounded by the largest blob
+    var item_arena = std.heap.ArenaAllocator.init(std.heap.page_allocator);
+    defer item_arena.deinit();
+
+    const out = out_buf[0..buf_len];
+    if (buf_len < 2) {
+        return PRIMITIVES_ERROR_INVALID_LENGTH;
+    }
+    out[0] = '[';
+    var pos: usize = 1;
+
+    for (0..n_items) |i| {
+        const start = offsets[i];
+        const end = offsets[i + 1];
+        if (end < start) {
+            return PRIMITIVES_ERROR_INVALID_INPUT;
+        }
+        _ = item_arena.reset(.retain_capacity);
+        const allocator = item_arena.allocator();
+
+        const decoded = primitives.Abi.decodeAbiParameters(allocator, data[start..end], types_list.items) catch |err| {
+            return switch (err) {
+                error.OutOfMemory => PRIMITIVES_ERROR_OUT_OF_MEMORY,
+                error.DataTooSmall => PRIMITIVES_ERROR_INVALID_LENGTH,
+                else => PRIMITIVES_ERROR_INVALID_INPUT,
+            };
+        };
+        const json_result = formatAbiValuesToJson(allocator, decoded) catch {
+            return PRIMITIVES_ERROR_OUT_OF_MEMORY;
+        };
+
+        // Item JSON, a separating comma (or the closing bracket) must fit
+        if (json_result.len + 1 > buf_len - pos) {
+            return PRIMITIVES_ERROR_INVALID_LENGTH;
+        }
+        @memcpy(out[pos..][0..json_result.len], json_result);
+        pos += json_result.len;
+        if (i + 1 < n_items) {
+            out[pos] = ',';
+            pos += 1;
+        }
+    }
+
+    out[pos] = ']';
+    return @intCast(pos + 1);
+}
+
+/// Decode many ABI-encoded blobs that share one type list into the binary
+/// parameter format (see primitives_abi_decode_parameters_bin)
+/// data: concatenation of all encoded blobs
+/// offsets: n_items + 1 ascending u32 offsets into data; item i spans
+///   data[offsets[i]..offsets[i + 1]]
+/// n_items: number of blobs
+/// types: one tag per parameter (index into abi_bin_types)
+/// out_buf: output buffer; every item's values back to back, each value a
+///   little-endian u32 payload length followed by the payload
+/// buf_len: size of output buffer
+/// Returns: number of bytes written to out_buf, or negative error code
+export fn primitives_abi_decode_parameters_batch_bin(
+    data: [*]const u8,
+    offsets: [*]const u32,
+    n_items: usize,
+    types: [*]const u8,
+    types_len: usize,
+    out_buf: [*]u8,
+    buf_len: usize,
+) c_int {
+    var types_arena = std.heap.ArenaAllocator.init(std.heap.page_allocator);
+    defer types_arena.deinit();
+
+    const abi_types = types_arena.allocator().alloc(primitives.Abi.AbiType, types_len) catch {
+        return PRIMITIVES_ERROR_OUT_OF_MEMORY;
+    };
+    for (types[0..types_len], abi_types) |tag, *abi_type| {
+        if (tag >= abi_bin_types.len) {
+            return PRIMITIVES_ERROR_UNSUPPORTED_TYPE;
+        }
+        abi_type.* = abi_bin_types[tag];
+    }
+
+    // Per-item scratch, reset between items so memory stays bounded by the largest blob
+    var item_arena = std.heap.ArenaAllocator.init(std.heap.page_allocator);
+    defer item_arena.deinit();
+
+    const out = out_buf[0..buf_len];
+    var pos: usize = 0;
+
+    for (0..n_items) |i| {
+        const start = offsets[i];
+        const end = offsets[i + 1];
+        if (end < start) {
+            return PRIMITIVES_ERROR_INVALID_INPUT;
+        }
+        _ = item_arena.reset(.retain_capacity);
+        const allocator = item_arena.allocator();
+
+        const decoded = primitives.Abi.decodeAbiParameters(allocator, data[start..end], abi_types) catch |err| {
+            return switch (err) {
+                error.OutOfMemory => PRIMITIVES_ERROR_OUT_OF_MEMORY,
+                error.DataTooSmall => PRIMITIVES_ERROR_INVALID_LENGTH,
+                else => PRIMITIVES_ERROR_INVALID_INPUT,
+            };
+        };
+
+        var item_out = std.array_list.AlignedManaged(u8, null).init(allocator);
+        for (decoded) |*value| {
+            appendAbiValueBin(&item_out, value) catch |err| {
+                return switch (err) {
+                    error.OutOfMemory => PRIMITIVES_ERROR_OUT_OF_MEMORY,
+                    error.UnsupportedType => PRIMITIVES_ERROR_UNSUPPORTED_TYPE,
+                };
+            };
+        }
+
+        if (item_out.items.len > buf_len - pos) {
+            return PRIMITIVES_ERROR_INVALID_LENGTH;
+        }
+        @memcpy(out[pos..][0..item_out.items.len], item_out.items);
+        pos += item_out.items.len;
+    }
+
+    return @intCast(pos);
+}
+
 /// Helper: Parse JSON string array into ArrayList of AbiType
 fn parseJsonTypeArray(
     allocator: std.mem.Allocator,
@@ -1518,6 +2193,23 @@ fn parseJsonStringValueArray(
     return true;
 }
 
+/// Helper: Append string contents with JSON escaping, so quotes, backslashes
+/// and control characters survive parsing byte for byte
+fn appendJsonEscaped(out: *std.array_list.AlignedManaged(u8, null), s: []const u8) !void {
+    for (s) |c| {
+        switch (c) {
+            '"' => try out.appendSlice("\\\""),
+            '\\' => try out.appendSlice("\\\\"),
+            0...0x1f => {
+                var esc: [6]u8 = undefined;
+                _ = std.fmt.bufPrint(&esc, "\\u{x:0>4}", .{c}) catch return error.OutOfMemory;
+                try out.appendSlice(&esc);
+            },
+            else => try out.append(c),
+        }
+    }
+}
+
 /// Helper: Format ABI values to JSON string array
 fn formatAbiValuesToJson(allocator: std.mem.Allocator, values: []const primitives.Abi.AbiValue) ![]u8 {
     var result = std.array_list.AlignedManaged(u8, null).init(allocator);
@@ -1599,7 +2291,7 @@ fn formatAbiValuesToJson(allocator: std.mem.Allocator, values: []const primitive
                 try result.appendSlice(str);
             },
             .string => |s| {
-                try result.appendSlice(s);
+                try appendJsonEscaped(&result, s);
             },
             .bytes => |b| {
                 var temp_buf: [2048]u8 = undefined;
@@ -1725,7 +2417,7 @@ fn formatAbiValuesToJson(allocator: std.mem.Allocator, values: []const primitive
                 for (arr, 0..) |s, j| {
                     if (j > 0) try result.append(',');
                     try result.append('"');
-                    try result.appendSlice(s);
+                    try appendJsonEscaped(&result, s);
                     try result.append('"');
                 }
                 try result.append(']');
@@ -3036,6 +3728,30 @@ export fn primitives_bytecode_get_next_pc(
     return -1;
 }
 
+/// Get next program counter position as status + out-param
+/// Writes the next pc to out_next_pc and returns PRIMITIVES_SUCCESS, or
+/// returns PRIMITIVES_ERROR_INVALID_INPUT when at/past the end of code
+export fn primitives_bytecode_next_pc(
+    code: [*]const u8,
+    code_len: usize,
+    current_pc: u32,
+    out_next_pc: *u32,
+) c_int {
+    if (current_pc >= code_len) {
+        return PRIMITIVES_ERROR_INVALID_INPUT;
+    }
+
+    const opcode = code[current_pc];
+    const push_size: u32 = if (opcode >= 0x60 and opcode <= 0x7f) opcode - 0x5f else 0;
+    const next_pc: u64 = @as(u64, current_pc) + 1 + push_size;
+    if (next_pc > code_len) {
+        return PRIMITIVES_ERROR_INVALID_INPUT;
+    }
+
+    out_next_pc.* = @intCast(next_pc);
+    return PRIMITIVES_SUCCESS;
+}
+
 /// Instruction data structure (for serialization)
 const InstructionData = packed struct {
     pc: u32,
@@ -3094,6 +3810,45 @@ export fn primitives_bytecode_scan(
     return @intCast(count);
 }
 
+/// Scan bytecode into parallel arrays (structure-of-arrays layout)
+/// out_pcs, out_opcodes and out_push_sizes must each hold max_instructions
+/// entries; the opcode stream is contiguous, so consumers can filter it
+/// without stepping over pc/padding bytes
+/// Returns number of instructions written
+export fn primitives_bytecode_scan_soa(
+    code: [*]const u8,
+    code_len: usize,
+    start_pc: u32,
+    end_pc: u32,
+    out_pcs: [*]u32,
+    out_opcodes: [*]u8,
+    out_push_sizes: [*]u8,
+    max_instructions: usize,
+) c_int {
+    const bytecode = code[0..code_len];
+
+    if (start_pc > end_pc or start_pc >= bytecode.len) {
+        return 0;
+    }
+
+    var pc: u32 = start_pc;
+    var count: usize = 0;
+
+    while (pc < end_pc and pc < bytecode.len and count < max_instructions) {
+        const opcode = bytecode[pc];
+        const push_size: u8 = if (opcode >= 0x60 and opcode <= 0x7f) opcode - 0x5f else 0;
+
+        out_pcs[count] = pc;
+        out_opcodes[count] = opcode;
+        out_push_sizes[count] = push_size;
+        count += 1;
+
+        pc += 1 + @as(u32, push_size);
+    }
+
+    return @intCast(count);
+}
+
 /// Fusion pattern detection (simple: detect PUSH followed by operations)
 const FusionPattern = packed struct {
     pc: u32,